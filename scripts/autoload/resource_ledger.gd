@@ -4,39 +4,83 @@ class_name ResourceLedgerSingleton
 const ResourceSnapshot = preload("res://scripts/autoload/resource_snapshot.gd")
 const ResourceTelemetryPayload = preload("res://scripts/autoload/resource_telemetry_payload.gd")
 
+signal resource_changed(id: StringName, current: int, max: int)
+signal threshold_crossed(id: StringName, level: StringName)
 signal health_changed(current: int, max: int)
 signal materials_changed(current: int, max: int)
 signal oxygen_changed(current: int, max: int)
 signal threat_changed(current: int, max: int)
 signal threat_threshold_crossed(level: StringName)
 
-@export var max_health: int = 8
-@export var max_materials: int = 12
-@export var max_oxygen: int = 6
-@export var max_threat: int = 100
-
-var _health: int = 0
-var _materials: int = 0
-var _oxygen: int = 0
-var _threat: int = 0
-
-var _threshold_states: Dictionary[StringName, StringName] = {
-	"health": "normal",
-	"materials": "normal",
-	"oxygen": "normal",
-	"threat": "normal",
-}
-
-var _warning_threshold: float = 0.5
-var _critical_threshold: float = 0.25
-var _threat_warning_threshold: float = 0.6
-var _threat_critical_threshold: float = 0.85
+const CORE_RESOURCES: Array[StringName] = [&"health", &"materials", &"oxygen", &"threat"]
+
+const VIEW_HEALTH: int = 0
+const VIEW_MAX_HEALTH: int = 1
+const VIEW_MATERIALS: int = 2
+const VIEW_MAX_MATERIALS: int = 3
+const VIEW_OXYGEN: int = 4
+const VIEW_MAX_OXYGEN: int = 5
+const VIEW_THREAT: int = 6
+const VIEW_MAX_THREAT: int = 7
+
+@export var definitions_path: String = "res://resources/config/resource_ledger.tres"
+## Shared warning/critical ratios; they override the per-definition values so
+## the ledger states and the resource panel colours always agree.
+@export var thresholds_path: String = "res://resources/config/resource_thresholds.tres"
+## Upper bound on how long a resource change may sit unsaved. Zero flushes at
+## the end of the current frame; larger values collapse writes per interval.
+@export var persist_max_latency_ms: int = 0
+
+var max_health: int:
+	get:
+		return get_max(&"health")
+	set(value):
+		set_max(&"health", value)
+var max_materials: int:
+	get:
+		return get_max(&"materials")
+	set(value):
+		set_max(&"materials", value)
+var max_oxygen: int:
+	get:
+		return get_max(&"oxygen")
+	set(value):
+		set_max(&"oxygen", value)
+var max_threat: int:
+	get:
+		return get_max(&"threat")
+	set(value):
+		set_max(&"threat", value)
+
+var _ids: Array[StringName] = []
+var _index: Dictionary[StringName, int] = {}
+var _values: PackedInt32Array = PackedInt32Array()
+var _maxima: PackedInt32Array = PackedInt32Array()
+var _initial: PackedInt32Array = PackedInt32Array()
+var _warning: PackedFloat32Array = PackedFloat32Array()
+var _critical: PackedFloat32Array = PackedFloat32Array()
+var _rising: PackedByteArray = PackedByteArray()
+var _states: Array[StringName] = []
+var _legacy_signals: Array[StringName] = []
+var _telemetry_events: Array[StringName] = []
+var _view_slots: PackedInt32Array = PackedInt32Array()
+var _subscribers: Dictionary[StringName, Array] = {}
 
 var _save_service: Node = null
 var _telemetry_hub: Node = null
 var _snapshot: ResourceSnapshot = ResourceSnapshot.new()
+var _version: int = 0
+var _snapshot_version: int = -1
+var _view: PackedInt32Array = PackedInt32Array()
+var _view_version: int = -1
+var _batch_depth: int = 0
+var _batch_dirty: PackedByteArray = PackedByteArray()
+var _batch_dirty_count: int = 0
+var _persist_dirty: bool = false
+var _persist_scheduled: bool = false
 
 func _ready() -> void:
+	_ensure_definitions()
 	_resolve_save_service()
 	_resolve_telemetry()
 	var service = _save_service_stub()
@@ -45,14 +89,140 @@ func _ready() -> void:
 	else:
 		reset()
 
+func _notification(what: int) -> void:
+	match what:
+		NOTIFICATION_APPLICATION_PAUSED, NOTIFICATION_WM_CLOSE_REQUEST, NOTIFICATION_EXIT_TREE:
+			flush_now()
+
 func set_save_service(service: Node) -> void:
 	_save_service = service
 
+## Replaces the tracked resources. Values reset to each definition's initial value.
+func configure(definitions: Array[ResourceDefinition]) -> void:
+	_ids.clear()
+	_index.clear()
+	_states.clear()
+	_legacy_signals.clear()
+	_telemetry_events.clear()
+	var count := definitions.size()
+	_values.resize(count)
+	_maxima.resize(count)
+	_initial.resize(count)
+	_warning.resize(count)
+	_critical.resize(count)
+	_rising.resize(count)
+	_batch_dirty.resize(count)
+	_batch_dirty.fill(0)
+	_batch_dirty_count = 0
+	for index in count:
+		var definition := definitions[index]
+		var id: StringName = definition.resource_id
+		_ids.append(id)
+		_index[id] = index
+		_maxima[index] = max(0, definition.max_value)
+		_initial[index] = definition.get_initial_value()
+		_values[index] = _initial[index]
+		_warning[index] = definition.warning
+		_critical[index] = definition.critical
+		_rising[index] = 1 if definition.rising_is_danger else 0
+		_states.append(&"normal")
+		var legacy_signal := StringName("%s_changed" % id)
+		_legacy_signals.append(legacy_signal if has_signal(legacy_signal) else &"")
+		_telemetry_events.append(StringName("%s_updated" % id))
+	_rebuild_view_slots()
+	_version += 1
+
+func get_resource_ids() -> Array[StringName]:
+	_ensure_definitions()
+	return _ids.duplicate()
+
+func has_resource(id: StringName) -> bool:
+	return _index_of(id) >= 0
+
+func get_value(id: StringName) -> int:
+	var index := _index_of(id)
+	return _values[index] if index >= 0 else 0
+
+func get_max(id: StringName) -> int:
+	var index := _index_of(id)
+	return _maxima[index] if index >= 0 else 0
+
+func get_state(id: StringName) -> StringName:
+	var index := _index_of(id)
+	return _states[index] if index >= 0 else &"normal"
+
+## Lowering a max clamps the current value down to it.
+func set_max(id: StringName, value: int) -> void:
+	var index := _index_of(id)
+	if index < 0:
+		return
+	var new_max: int = max(0, value)
+	if new_max == _maxima[index]:
+		return
+	_maxima[index] = new_max
+	_values[index] = min(_values[index], new_max)
+	_version += 1
+	if _batch_depth > 0:
+		_mark_batch_dirty(index)
+		return
+	_publish_change(index)
+
+func set_value(id: StringName, value: int) -> void:
+	var index := _index_of(id)
+	if index < 0:
+		return
+	var clamped: int = clamp(value, 0, _maxima[index])
+	var out_of_bounds: bool = value != clamped
+	if clamped == _values[index] and not out_of_bounds:
+		return
+	_values[index] = clamped
+	_version += 1
+	if _batch_depth > 0:
+		_mark_batch_dirty(index)
+		return
+	_publish_change(index)
+
+func adjust(id: StringName, delta: int) -> void:
+	var index := _index_of(id)
+	if index < 0:
+		return
+	set_value(id, _values[index] + delta)
+
+## Calls callback(current, max) whenever the given resource changes.
+func subscribe(id: StringName, callback: Callable) -> void:
+	var callbacks: Array = _subscribers.get(id, [])
+	if not callbacks.has(callback):
+		callbacks.append(callback)
+	_subscribers[id] = callbacks
+
+func unsubscribe(id: StringName, callback: Callable) -> void:
+	if not _subscribers.has(id):
+		return
+	var callbacks: Array = _subscribers[id]
+	callbacks.erase(callback)
+	if callbacks.is_empty():
+		_subscribers.erase(id)
+
+## Writes any pending snapshot to the save service immediately. Call before
+## scene changes or anywhere the run state must be durable right now.
+func flush_now() -> void:
+	if not _persist_dirty:
+		return
+	_persist_dirty = false
+	var snapshot := get_snapshot()
+	var service = _save_service_stub()
+	if service and service.has_method("store_run_snapshot"):
+		service.store_run_snapshot(snapshot)
+	_record_telemetry("ledger_snapshot", snapshot)
+
+func has_pending_persist() -> bool:
+	return _persist_dirty
+
 func reset() -> void:
-	_health = max_health
-	_materials = max_materials
-	_oxygen = max_oxygen
-	_threat = 0
+	_ensure_definitions()
+	for index in _ids.size():
+		_values[index] = min(_initial[index], _maxima[index])
+	_version += 1
 	_emit_all_changes()
 	_persist_state()
 
@@ -65,72 +235,58 @@ func start_new_run(force_reset: bool = false) -> void:
 	_apply_snapshot(service.get_run_snapshot())
 
 func set_health(value: int) -> void:
-	var clamped: int = clamp(value, 0, max_health)
-	var out_of_bounds: bool = value != clamped
-	if clamped == _health and not out_of_bounds:
-		return
-	_health = clamped
-	health_changed.emit(_health, max_health)
-	_update_threshold_state("health", _health, max_health)
-	_refresh_snapshot()
-	_persist_state()
-	var payload := ResourceTelemetryPayload.new(&"health", _health, max_health, _snapshot.state_for(&"health"))
-	_record_telemetry("health_updated", payload)
+	set_value(&"health", value)
 
 func adjust_health(delta: int) -> void:
-	set_health(_health + delta)
+	adjust(&"health", delta)
 
 func set_materials(value: int) -> void:
-	var clamped: int = clamp(value, 0, max_materials)
-	var out_of_bounds: bool = value != clamped
-	if clamped == _materials and not out_of_bounds:
-		return
-	_materials = clamped
-	materials_changed.emit(_materials, max_materials)
-	_update_threshold_state("materials", _materials, max_materials)
-	_refresh_snapshot()
-	_persist_state()
-	var payload := ResourceTelemetryPayload.new(&"materials", _materials, max_materials, _snapshot.state_for(&"materials"))
-	_record_telemetry("materials_updated", payload)
+	set_value(&"materials", value)
 
 func adjust_materials(delta: int) -> void:
-	set_materials(_materials + delta)
+	adjust(&"materials", delta)
 
 func set_oxygen(value: int) -> void:
-	var clamped: int = clamp(value, 0, max_oxygen)
-	var out_of_bounds: bool = value != clamped
-	if clamped == _oxygen and not out_of_bounds:
-		return
-	_oxygen = clamped
-	oxygen_changed.emit(_oxygen, max_oxygen)
-	_update_threshold_state("oxygen", _oxygen, max_oxygen)
-	_refresh_snapshot()
-	_persist_state()
-	var payload := ResourceTelemetryPayload.new(&"oxygen", _oxygen, max_oxygen, _snapshot.state_for(&"oxygen"))
-	_record_telemetry("oxygen_updated", payload)
+	set_value(&"oxygen", value)
 
 func adjust_oxygen(delta: int) -> void:
-	set_oxygen(_oxygen + delta)
+	adjust(&"oxygen", delta)
 
 func set_threat(value: int) -> void:
-	var clamped: int = clamp(value, 0, max_threat)
-	var out_of_bounds: bool = value != clamped
-	if clamped == _threat and not out_of_bounds:
-		return
-	var previous_state: StringName = _threshold_states.get("threat", "normal")
-	_threat = clamped
-	threat_changed.emit(_threat, max_threat)
-	_update_threshold_state("threat", _threat, max_threat)
-	_refresh_snapshot()
-	var current_state: StringName = _snapshot.state_for(&"threat")
-	if current_state != previous_state:
-		threat_threshold_crossed.emit(current_state)
-	_persist_state()
-	var payload := ResourceTelemetryPayload.new(&"threat", _threat, max_threat, current_state)
-	_record_telemetry("threat_updated", payload)
+	set_value(&"threat", value)
 
 func adjust_threat(delta: int) -> void:
-	set_threat(_threat + delta)
+	adjust(&"threat", delta)
+
+## Opens a batch: setters update values immediately but signals, snapshot
+## persistence and telemetry are deferred until the matching commit().
+## Batches nest; only the outermost commit() flushes.
+func begin_batch() -> void:
+	_ensure_definitions()
+	_batch_depth += 1
+
+func commit() -> void:
+	if _batch_depth == 0:
+		return
+	_batch_depth -= 1
+	if _batch_depth > 0:
+		return
+	_flush_batch()
+
+func is_batching() -> bool:
+	return _batch_depth > 0
+
+## Applies several resource deltas as one update, e.g.
+## {"materials": -2, "threat": -1}. Emits each changed resource signal once
+## and persists/records telemetry a single time.
+func apply_deltas(deltas: Dictionary) -> void:
+	begin_batch()
+	for key in deltas.keys():
+		var delta := int(deltas[key])
+		if delta == 0:
+			continue
+		adjust(StringName(key), delta)
+	commit()
 
 func apply_roll_outcome(results: Array[int]) -> void:
 	# Basic placeholder logic: dice sum translates to material gains,
@@ -139,10 +295,12 @@ func apply_roll_outcome(results: Array[int]) -> void:
 	for value in results:
 		earned_materials += int(value)
 	var material_gain := int(earned_materials / 3)
+	begin_batch()
 	if material_gain > 0:
 		adjust_materials(material_gain)
 	adjust_oxygen(-1)
 	adjust_threat(1)
+	commit()
 	var payload := ResourceTelemetryPayload.new(
 		&"roll_outcome",
 		material_gain,
@@ -155,23 +313,45 @@ func apply_roll_outcome(results: Array[int]) -> void:
 	)
 	_record_telemetry("roll_outcome", payload)
 
+## Returns the current snapshot. The instance is shared and only rebuilt when
+## the ledger version changes, so callers must treat it as read-only.
 func get_snapshot() -> ResourceSnapshot:
 	_refresh_snapshot()
-	return _build_snapshot()
+	return _snapshot
+
+## Monotonic counter bumped on every value, maximum or threshold change.
+func get_version() -> int:
+	return _version
+
+## Current and max values packed as [health, max_health, materials, ...];
+## index with the VIEW_* constants. Non-core resources follow in definition
+## order. Rebuilt in place only when the version changes.
+func get_packed_view() -> PackedInt32Array:
+	_ensure_definitions()
+	if _view_version != _version:
+		_view.resize(max(CORE_RESOURCES.size(), _ids.size()) * 2)
+		_view.fill(0)
+		for index in _ids.size():
+			var slot := _view_slots[index]
+			_view[slot] = _values[index]
+			_view[slot + 1] = _maxima[index]
+		_view_version = _version
+	return _view
 
 func get_health() -> int:
-	return _health
+	return get_value(&"health")
 
 func get_materials() -> int:
-	return _materials
+	return get_value(&"materials")
 
 func get_oxygen() -> int:
-	return _oxygen
+	return get_value(&"oxygen")
 
 func get_threat() -> int:
-	return _threat
+	return get_value(&"threat")
 
 func _apply_snapshot(snapshot_data: Variant) -> void:
+	_ensure_definitions()
 	if snapshot_data == null:
 		reset()
 		return
@@ -180,6 +360,11 @@ func _apply_snapshot(snapshot_data: Variant) -> void:
 		typed_snapshot = snapshot_data
 	elif snapshot_data is Dictionary:
 		var data: Dictionary = snapshot_data
+		var extras: Dictionary = {}
+		var raw_extras: Dictionary = data.get("extra_resources", {}) as Dictionary
+		for key in raw_extras.keys():
+			var entry: Dictionary = raw_extras[key] as Dictionary
+			extras[StringName(key)] = Vector2i(int(entry.get("current", 0)), int(entry.get("max", 0)))
 		typed_snapshot = ResourceSnapshot.new(
 			int(data.get("health", max_health)),
 			int(data.get("max_health", max_health)),
@@ -189,92 +374,255 @@ func _apply_snapshot(snapshot_data: Variant) -> void:
 			int(data.get("max_oxygen", max_oxygen)),
 			int(data.get("threat", 0)),
 			int(data.get("max_threat", max_threat)),
-			data.get("threshold_states", {})
+			data.get("threshold_states", {}),
+			extras
 		)
 	if typed_snapshot == null:
 		reset()
 		return
-	_health = clamp(typed_snapshot.health, 0, max_health)
-	_materials = clamp(typed_snapshot.materials, 0, max_materials)
-	_oxygen = clamp(typed_snapshot.oxygen, 0, max_oxygen)
-	_threat = clamp(typed_snapshot.threat, 0, max_threat)
+	for index in _ids.size():
+		var id := _ids[index]
+		var restored: int = _initial[index]
+		match id:
+			&"health":
+				restored = typed_snapshot.health
+			&"materials":
+				restored = typed_snapshot.materials
+			&"oxygen":
+				restored = typed_snapshot.oxygen
+			&"threat":
+				restored = typed_snapshot.threat
+			_:
+				if typed_snapshot.extra_resources.has(id):
+					restored = typed_snapshot.extra_resources[id].x
+		_values[index] = clamp(restored, 0, _maxima[index])
+	_version += 1
 	_emit_all_changes()
 
+func _publish_change(index: int) -> void:
+	var previous_state: StringName = _states[index]
+	_emit_resource(index)
+	_update_threshold_state(index)
+	if _states[index] != previous_state:
+		_emit_threshold_crossed(index)
+	_persist_state()
+	_record_resource_telemetry(index)
+
+## Resets and restores can jump a resource across several bands at once, so
+## crossings are reported here too; otherwise listeners keep the old state.
 func _emit_all_changes() -> void:
-	health_changed.emit(_health, max_health)
-	materials_changed.emit(_materials, max_materials)
-	oxygen_changed.emit(_oxygen, max_oxygen)
-	threat_changed.emit(_threat, max_threat)
-	_update_threshold_state("health", _health, max_health, true)
-	_update_threshold_state("materials", _materials, max_materials, true)
-	_update_threshold_state("oxygen", _oxygen, max_oxygen, true)
-	_update_threshold_state("threat", _threat, max_threat, true)
+	for index in _ids.size():
+		_emit_resource(index)
+	var crossed: Array[int] = []
+	for index in _ids.size():
+		var previous_state: StringName = _states[index]
+		_update_threshold_state(index, true)
+		if _states[index] != previous_state:
+			crossed.append(index)
 	_refresh_snapshot()
+	for index in crossed:
+		_emit_threshold_crossed(index)
+
+func _emit_resource(index: int) -> void:
+	var id := _ids[index]
+	var current := _values[index]
+	var maximum := _maxima[index]
+	resource_changed.emit(id, current, maximum)
+	var legacy_signal := _legacy_signals[index]
+	if legacy_signal != &"":
+		emit_signal(legacy_signal, current, maximum)
+	if _subscribers.has(id):
+		for callback in _subscribers[id]:
+			var subscriber: Callable = callback
+			if subscriber.is_valid():
+				subscriber.call(current, maximum)
+
+func _emit_threshold_crossed(index: int) -> void:
+	var id := _ids[index]
+	threshold_crossed.emit(id, _states[index])
+	if id == &"threat":
+		threat_threshold_crossed.emit(_states[index])
+
+func _record_resource_telemetry(index: int) -> void:
+	var id := _ids[index]
+	var payload := ResourceTelemetryPayload.new(id, _values[index], _maxima[index], _states[index])
+	_record_telemetry(_telemetry_events[index], payload)
+
+func _mark_batch_dirty(index: int) -> void:
+	if _batch_dirty[index] == 0:
+		_batch_dirty[index] = 1
+		_batch_dirty_count += 1
+
+func _flush_batch() -> void:
+	if _batch_dirty_count == 0:
+		return
+	var crossed: Array[int] = []
+	for index in _ids.size():
+		if _batch_dirty[index] == 0:
+			continue
+		var previous_state: StringName = _states[index]
+		_emit_resource(index)
+		_update_threshold_state(index)
+		if _states[index] != previous_state:
+			crossed.append(index)
+	for index in crossed:
+		_emit_threshold_crossed(index)
+	_persist_state()
+	for index in _ids.size():
+		if _batch_dirty[index] == 0:
+			continue
+		_batch_dirty[index] = 0
+		_record_resource_telemetry(index)
+	_batch_dirty_count = 0
 
 func _refresh_snapshot() -> void:
+	if _snapshot_version == _version:
+		return
 	_snapshot = _build_snapshot()
+	_snapshot_version = _version
 
 func _build_snapshot() -> ResourceSnapshot:
+	var states: Dictionary = {}
+	var extras: Dictionary = {}
+	for index in _ids.size():
+		var id := _ids[index]
+		states[id] = _states[index]
+		if not CORE_RESOURCES.has(id):
+			extras[id] = Vector2i(_values[index], _maxima[index])
 	return ResourceSnapshot.new(
-		_health,
+		get_health(),
 		max_health,
-		_materials,
+		get_materials(),
 		max_materials,
-		_oxygen,
+		get_oxygen(),
 		max_oxygen,
-		_threat,
+		get_threat(),
 		max_threat,
-		_threshold_states
+		states,
+		extras
 	)
 
-func _update_threshold_state(key: StringName, current: int, max_value: int, force: bool = false) -> void:
+func _update_threshold_state(index: int, force: bool = false) -> void:
+	var max_value := _maxima[index]
 	var ratio: float = 0.0
 	if max_value > 0:
-		ratio = float(current) / float(max_value)
-	var state: StringName = "normal"
-	if key == "threat":
-		if ratio >= _threat_critical_threshold:
-			state = "critical"
-		elif ratio >= _threat_warning_threshold:
-			state = "warning"
+		ratio = float(_values[index]) / float(max_value)
+	var state: StringName = &"normal"
+	if _rising[index] == 1:
+		if ratio >= _critical[index]:
+			state = &"critical"
+		elif ratio >= _warning[index]:
+			state = &"warning"
 	else:
-		if ratio <= _critical_threshold:
-			state = "critical"
-		elif ratio <= _warning_threshold:
-			state = "warning"
-	if force or _threshold_states.get(key, "normal") != state:
-		_threshold_states[key] = state
+		if ratio <= _critical[index]:
+			state = &"critical"
+		elif ratio <= _warning[index]:
+			state = &"warning"
+	if force or _states[index] != state:
+		_states[index] = state
+		_version += 1
+
+func _ensure_definitions() -> void:
+	if not _ids.is_empty():
+		return
+	var definitions: Array[ResourceDefinition] = []
+	var resource: Resource = null
+	if not definitions_path.is_empty() and ResourceLoader.exists(definitions_path):
+		resource = load(definitions_path)
+	if resource is ResourceLedgerConfig:
+		definitions = (resource as ResourceLedgerConfig).get_definitions()
+	if definitions.is_empty():
+		definitions = _default_definitions()
+	configure(definitions)
+	_apply_thresholds()
+
+func _apply_thresholds() -> void:
+	if thresholds_path.is_empty() or not ResourceLoader.exists(thresholds_path):
+		return
+	var thresholds = load(thresholds_path)
+	if thresholds == null or not thresholds.has_method("get_thresholds"):
+		return
+	var threshold_map: Dictionary = thresholds.get_thresholds()
+	for index in _ids.size():
+		var data: Dictionary = threshold_map.get(String(_ids[index]), {})
+		if data.is_empty():
+			continue
+		_warning[index] = float(data.get("warning", _warning[index]))
+		_critical[index] = float(data.get("critical", _critical[index]))
+
+func _default_definitions() -> Array[ResourceDefinition]:
+	var defaults: Array[ResourceDefinition] = []
+	for entry in [
+		[&"health", 8, true, 0.5, 0.25, false],
+		[&"materials", 12, true, 0.4, 0.2, false],
+		[&"oxygen", 6, true, 0.5, 0.25, false],
+		[&"threat", 100, false, 0.6, 0.85, true],
+	]:
+		var definition := ResourceDefinition.new()
+		definition.resource_id = entry[0]
+		definition.display_name = String(entry[0]).capitalize()
+		definition.max_value = entry[1]
+		definition.start_full = entry[2]
+		definition.warning = entry[3]
+		definition.critical = entry[4]
+		definition.rising_is_danger = entry[5]
+		defaults.append(definition)
+	return defaults
+
+func _rebuild_view_slots() -> void:
+	_view_slots.resize(_ids.size())
+	var next_slot := CORE_RESOURCES.size() * 2
+	for index in _ids.size():
+		var core_index := CORE_RESOURCES.find(_ids[index])
+		if core_index >= 0:
+			_view_slots[index] = core_index * 2
+		else:
+			_view_slots[index] = next_slot
+			next_slot += 2
+	_view_version = -1
+
+func _index_of(id: StringName) -> int:
+	_ensure_definitions()
+	return int(_index.get(id, -1))
 
 func _persist_state() -> void:
-	var snapshot := get_snapshot()
-	var service = _save_service_stub()
-	if service and service.has_method("store_run_snapshot"):
-		service.store_run_snapshot(snapshot)
-	_record_telemetry("ledger_snapshot", snapshot)
+	_persist_dirty = true
+	var tree := get_tree() if is_inside_tree() else null
+	if tree == null:
+		flush_now()
+		return
+	if _persist_scheduled:
+		return
+	_persist_scheduled = true
+	if persist_max_latency_ms <= 0:
+		call_deferred("_on_persist_deadline")
+		return
+	var timer := tree.create_timer(float(persist_max_latency_ms) / 1000.0, true, false, true)
+	timer.timeout.connect(_on_persist_deadline, Object.CONNECT_ONE_SHOT)
+
+func _on_persist_deadline() -> void:
+	_persist_scheduled = false
+	flush_now()
 
 func _resolve_save_service() -> void:
 	if _save_service != null:
 		return
-	var tree := get_tree()
-	if tree == null:
+	if not is_inside_tree():
 		return
-	var root := tree.get_root()
-	if root and root.has_node("SaveService"):
-		_save_service = root.get_node("SaveService")
+	_save_service = ServiceRegistry.get_save_service()
 
 func _resolve_telemetry() -> void:
-	var tree := get_tree()
-	if tree == null:
+	if not is_inside_tree():
 		return
-	var root := tree.get_root()
-	if root and root.has_node("TelemetryHub"):
-		_telemetry_hub = root.get_node("TelemetryHub")
+	_telemetry_hub = ServiceRegistry.get_telemetry_hub()
 
 func _save_service_stub():
+	if _save_service != null and not is_instance_valid(_save_service):
+		_save_service = null
 	return _save_service
 
 func _record_telemetry(event_name: StringName, payload: Variant) -> void:
-	if _telemetry_hub != null and _telemetry_hub.has_method("record"):
+	if _telemetry_hub != null and is_instance_valid(_telemetry_hub) and _telemetry_hub.has_method("record"):
 		var body: Variant = payload
 		if payload is ResourceTelemetryPayload:
 			body = payload.to_dictionary()
@@ -1,6 +1,9 @@
 extends RefCounted
 class_name ResourceSnapshot
 
+## Point-in-time copy of the ledger. ResourceLedger hands the same instance to
+## every reader until its version changes, so treat fields as read-only.
+
 var health: int
 var max_health: int
 var materials: int
@@ -10,6 +13,8 @@ var max_oxygen: int
 var threat: int
 var max_threat: int
 var threshold_states: Dictionary[StringName, StringName]
+## Values for ledger resources beyond the core four, keyed by id as Vector2i(current, max).
+var extra_resources: Dictionary[StringName, Vector2i]
 
 func _init(
 	health_value: int = 0,
@@ -20,7 +25,8 @@ func _init(
 	max_oxygen_value: int = 0,
 	threat_value: int = 0,
 	max_threat_value: int = 0,
-	states: Dictionary = {}
+	states: Dictionary = {},
+	extras: Dictionary = {}
 ) -> void:
 	health = health_value
 	max_health = max_health_value
@@ -34,9 +40,12 @@ func _init(
 	for key in states.keys():
 		var name_key: StringName = key
 		threshold_states[name_key] = StringName(states[key])
+	extra_resources = {}
+	for key in extras.keys():
+		extra_resources[StringName(key)] = Vector2i(extras[key])
 
 func to_dictionary() -> Dictionary:
-	return {
+	var payload := {
 		"health": health,
 		"max_health": max_health,
 		"materials": materials,
@@ -47,6 +56,13 @@ func to_dictionary() -> Dictionary:
 		"max_threat": max_threat,
 		"threshold_states": threshold_states.duplicate(true),
 	}
+	if not extra_resources.is_empty():
+		var extras: Dictionary = {}
+		for key in extra_resources.keys():
+			var entry: Vector2i = extra_resources[key]
+			extras[String(key)] = {"current": entry.x, "max": entry.y}
+		payload["extra_resources"] = extras
+	return payload
 
 func state_for(key: StringName) -> StringName:
 	return threshold_states.get(key, "normal")
@@ -0,0 +1,75 @@
+extends Node
+class_name RngServiceSingleton
+
+## Hands out named RandomNumberGenerator streams derived from one run seed, so
+## a run can be replayed from its seed. Each stream's seed depends only on the
+## run seed and the stream name, so subsystems never share or perturb each
+## other's sequences. Stream objects are reseeded in place on a new run, so
+## holders can keep the reference they were given.
+
+signal run_seed_changed(run_seed: int)
+
+var _run_seed: int = 0
+var _streams: Dictionary[StringName, RandomNumberGenerator] = {}
+var _save_service: Node = null
+
+func _ready() -> void:
+	_save_service = ServiceRegistry.get_save_service()
+	if _save_service and _save_service.has_signal("snapshot_updated"):
+		_save_service.snapshot_updated.connect(_on_run_snapshot_stored)
+	if _save_service and _save_service.has_method("has_rng_state") and _save_service.has_rng_state():
+		apply_snapshot(_save_service.get_rng_state())
+	else:
+		start_run()
+
+## Starts a new run from run_seed, or from a random seed when it is 0.
+func start_run(run_seed: int = 0) -> void:
+	if run_seed == 0:
+		var seeder := RandomNumberGenerator.new()
+		seeder.randomize()
+		run_seed = (seeder.randi() << 31) | seeder.randi()
+	_run_seed = run_seed
+	for stream_name in _streams:
+		_streams[stream_name].seed = _derive_seed(stream_name)
+	run_seed_changed.emit(_run_seed)
+
+func get_run_seed() -> int:
+	return _run_seed
+
+func get_stream(stream_name: StringName) -> RandomNumberGenerator:
+	var stream: RandomNumberGenerator = _streams.get(stream_name, null)
+	if stream == null:
+		stream = RandomNumberGenerator.new()
+		stream.seed = _derive_seed(stream_name)
+		_streams[stream_name] = stream
+	return stream
+
+## Child streams are independent of their parent, e.g. one per die:
+## split_stream(&"dice", "die_0").
+func split_stream(parent: StringName, child: String) -> RandomNumberGenerator:
+	return get_stream(StringName("%s/%s" % [parent, child]))
+
+func get_snapshot() -> Dictionary:
+	var streams: Dictionary = {}
+	for stream_name in _streams:
+		streams[String(stream_name)] = _streams[stream_name].state
+	return {
+		"seed": _run_seed,
+		"streams": streams,
+	}
+
+func apply_snapshot(snapshot: Dictionary) -> void:
+	start_run(int(snapshot.get("seed", 0)))
+	var streams := snapshot.get("streams", {}) as Dictionary
+	for stream_name in streams.keys():
+		get_stream(StringName(stream_name)).state = int(streams[stream_name])
+
+func _derive_seed(stream_name: StringName) -> int:
+	var low := hash("%d/%s" % [_run_seed, stream_name])
+	var high := hash("%s/%d" % [stream_name, _run_seed])
+	return (high << 32) | low
+
+func _on_run_snapshot_stored(_snapshot) -> void:
+	# Stream state is saved at the same points as the run snapshot.
+	if is_instance_valid(_save_service) and _save_service.has_method("store_rng_state"):
+		_save_service.store_rng_state(get_snapshot())
@@ -0,0 +1,164 @@
+extends Node
+class_name ServiceRegistrySingleton
+
+## Resolves the project autoloads once and hands out cached references so
+## gameplay code does not walk the scene root on every action. Tests can
+## register fakes with set_override() and restore with clear_overrides().
+
+signal service_changed(service_name: StringName, service: Node)
+
+# Autoload scripts without a class_name; the constants give the typed getters
+# a concrete return type without clashing with the autoload names.
+const RoomQueueServiceScript = preload("res://scripts/services/room_queue_service.gd")
+const ThreatServiceScript = preload("res://scripts/services/threat_service.gd")
+const EquipmentInventoryModelScript = preload("res://scripts/services/equipment_inventory_model.gd")
+const TelemetryHubScript = preload("res://scripts/services/telemetry_hub.gd")
+
+const GAME_DIRECTOR: StringName = &"GameDirector"
+const TURN_MANAGER: StringName = &"TurnManagerSingleton"
+const DICE_POOL_CACHE: StringName = &"DicePoolCache"
+const SAVE_SERVICE: StringName = &"SaveService"
+const RNG_SERVICE: StringName = &"RngService"
+const RESOURCE_LEDGER: StringName = &"ResourceLedger"
+const ROOM_QUEUE_SERVICE: StringName = &"RoomQueueService"
+const THREAT_SERVICE: StringName = &"ThreatService"
+const EVENT_RESOLVER: StringName = &"EventResolver"
+const EQUIPMENT_INVENTORY: StringName = &"EquipmentInventoryModel"
+const EQUIPMENT_FEEDBACK: StringName = &"EquipmentFeedbackService"
+const LOOT_SERVICE: StringName = &"LootService"
+const TELEMETRY_HUB: StringName = &"TelemetryHub"
+const TUTORIAL_SERVICE: StringName = &"TutorialService"
+
+const SERVICE_NAMES: Array[StringName] = [
+	GAME_DIRECTOR,
+	TURN_MANAGER,
+	DICE_POOL_CACHE,
+	SAVE_SERVICE,
+	RNG_SERVICE,
+	RESOURCE_LEDGER,
+	ROOM_QUEUE_SERVICE,
+	THREAT_SERVICE,
+	EVENT_RESOLVER,
+	EQUIPMENT_INVENTORY,
+	EQUIPMENT_FEEDBACK,
+	LOOT_SERVICE,
+	TELEMETRY_HUB,
+	TUTORIAL_SERVICE,
+]
+
+var _cache: Dictionary[StringName, Node] = {}
+var _overrides: Dictionary[StringName, Node] = {}
+
+func _ready() -> void:
+	# Autoloads listed after this one are not in the tree yet.
+	call_deferred("_resolve_all")
+
+func get_service(service_name: StringName) -> Node:
+	# Untyped on purpose: assigning a freed instance to a Node variable errors
+	# before is_instance_valid() gets a chance to run.
+	var override = _overrides.get(service_name, null)
+	if override != null:
+		if is_instance_valid(override):
+			return override as Node
+		_overrides.erase(service_name)
+	var cached = _cache.get(service_name, null)
+	if cached != null:
+		if is_instance_valid(cached):
+			return cached as Node
+		_cache.erase(service_name)
+	return _resolve(service_name)
+
+func has_service(service_name: StringName) -> bool:
+	return get_service(service_name) != null
+
+## Routes lookups for service_name to the given node until cleared. Passing
+## null removes the override.
+func set_override(service_name: StringName, service: Node) -> void:
+	if service == null:
+		clear_override(service_name)
+		return
+	_overrides[service_name] = service
+	service_changed.emit(service_name, service)
+
+func clear_override(service_name: StringName) -> void:
+	if not _overrides.has(service_name):
+		return
+	_overrides.erase(service_name)
+	service_changed.emit(service_name, get_service(service_name))
+
+func clear_overrides() -> void:
+	for service_name in _overrides.keys():
+		clear_override(service_name)
+
+## Drops the cached reference so the next lookup resolves from the tree again.
+func invalidate(service_name: StringName = &"") -> void:
+	if service_name.is_empty():
+		_cache.clear()
+		return
+	_cache.erase(service_name)
+
+func get_game_director() -> Node:
+	return get_service(GAME_DIRECTOR)
+
+func get_turn_manager() -> TurnManager:
+	return get_service(TURN_MANAGER) as TurnManager
+
+func get_dice_pool_cache() -> Node:
+	return get_service(DICE_POOL_CACHE)
+
+func get_save_service() -> SaveServiceStub:
+	return get_service(SAVE_SERVICE) as SaveServiceStub
+
+func get_rng_service() -> RngServiceSingleton:
+	return get_service(RNG_SERVICE) as RngServiceSingleton
+
+func get_resource_ledger() -> ResourceLedgerSingleton:
+	return get_service(RESOURCE_LEDGER) as ResourceLedgerSingleton
+
+func get_room_queue_service() -> RoomQueueServiceScript:
+	return get_service(ROOM_QUEUE_SERVICE) as RoomQueueServiceScript
+
+func get_threat_service() -> ThreatServiceScript:
+	return get_service(THREAT_SERVICE) as ThreatServiceScript
+
+func get_event_resolver() -> Node:
+	return get_service(EVENT_RESOLVER)
+
+func get_equipment_inventory() -> EquipmentInventoryModelScript:
+	return get_service(EQUIPMENT_INVENTORY) as EquipmentInventoryModelScript
+
+func get_equipment_feedback() -> Node:
+	return get_service(EQUIPMENT_FEEDBACK)
+
+func get_loot_service() -> Node:
+	return get_service(LOOT_SERVICE)
+
+func get_telemetry_hub() -> TelemetryHubScript:
+	return get_service(TELEMETRY_HUB) as TelemetryHubScript
+
+func get_tutorial_service() -> Node:
+	return get_service(TUTORIAL_SERVICE)
+
+func _resolve_all() -> void:
+	for service_name in SERVICE_NAMES:
+		get_service(service_name)
+
+func _resolve(service_name: StringName) -> Node:
+	if not is_inside_tree():
+		return null
+	var root := get_tree().get_root()
+	if root == null:
+		return null
+	var service := root.get_node_or_null(NodePath(String(service_name)))
+	if service == null:
+		return null
+	_cache[service_name] = service
+	var on_exiting := _on_service_exiting.bind(service_name, service)
+	if not service.tree_exiting.is_connected(on_exiting):
+		service.tree_exiting.connect(on_exiting)
+	return service
+
+func _on_service_exiting(service_name: StringName, service: Node) -> void:
+	if _cache.get(service_name, null) == service:
+		_cache.erase(service_name)
+		service_changed.emit(service_name, null)
@@ -0,0 +1,66 @@
+extends RefCounted
+class_name AliasTable
+
+## Weighted sampling with Vose's alias method: O(n) to build, O(1) per draw.
+## Members are caller-defined ids (e.g. indices into a room or item table).
+## When every weight is zero the table samples uniformly.
+
+var members: PackedInt32Array = PackedInt32Array()
+var probabilities: PackedFloat32Array = PackedFloat32Array()
+var aliases: PackedInt32Array = PackedInt32Array()
+var uniform: bool = false
+var total_weight: float = 0.0
+## Weight drawn out of the table by callers that sample without replacement
+## and rebuild once it grows too large.
+var removed_weight: float = 0.0
+
+## weights runs parallel to members.
+static func build(table_members: PackedInt32Array, weights: PackedFloat32Array) -> AliasTable:
+	var table := AliasTable.new()
+	table.members = table_members
+	var count := table_members.size()
+	for slot in count:
+		table.total_weight += weights[slot]
+	table.uniform = table.total_weight <= 0.0
+	if table.uniform:
+		table.total_weight = count
+	var scaled := PackedFloat32Array()
+	scaled.resize(count)
+	var small := PackedInt32Array()
+	var large := PackedInt32Array()
+	for slot in count:
+		var weight: float = 1.0 if table.uniform else weights[slot]
+		scaled[slot] = weight * count / table.total_weight
+		if scaled[slot] < 1.0:
+			small.append(slot)
+		else:
+			large.append(slot)
+	table.probabilities.resize(count)
+	table.aliases.resize(count)
+	while not small.is_empty() and not large.is_empty():
+		var low := small[small.size() - 1]
+		small.resize(small.size() - 1)
+		var high := large[large.size() - 1]
+		large.resize(large.size() - 1)
+		table.probabilities[low] = scaled[low]
+		table.aliases[low] = high
+		scaled[high] = scaled[high] + scaled[low] - 1.0
+		if scaled[high] < 1.0:
+			small.append(high)
+		else:
+			large.append(high)
+	for slot in small + large:
+		table.probabilities[slot] = 1.0
+		table.aliases[slot] = slot
+	return table
+
+func is_empty() -> bool:
+	return members.is_empty()
+
+## Returns a member, or -1 for an empty table.
+func sample(rng: RandomNumberGenerator) -> int:
+	if members.is_empty():
+		return -1
+	var slot := rng.randi_range(0, members.size() - 1)
+	var pick := slot if rng.randf() < probabilities[slot] else aliases[slot]
+	return members[pick]
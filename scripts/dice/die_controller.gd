@@ -128,6 +128,11 @@ func set_value(value: int, instant: bool = false) -> void:
     else:
         global_transform = Transform3D(basis, global_transform.origin)
 
+## Replaces the self-seeded generator with a stream owned by the caller.
+func set_rng(rng: RandomNumberGenerator) -> void:
+    if rng:
+        _rng = rng
+
 func set_locked(enabled: bool) -> void:
     _locked = enabled
     if _locked_glow:
@@ -0,0 +1,67 @@
+extends Resource
+class_name EquipmentCatalogIndex
+
+## Boot-time summary of every equipment module. Full EquipmentModuleResource
+## files are only loaded from resource_paths when a module is first needed.
+## Regenerate with scripts/tools/build_equipment_catalog_index.gd.
+
+@export var module_ids: Array[StringName] = []
+@export var display_names: PackedStringArray = PackedStringArray()
+@export var burdens: PackedInt32Array = PackedInt32Array()
+@export var cell_counts: PackedInt32Array = PackedInt32Array()
+## Unrotated mask bounds as (width, height) pairs.
+@export var mask_bounds: PackedInt32Array = PackedInt32Array()
+@export var resource_paths: PackedStringArray = PackedStringArray()
+
+var _lookup: Dictionary[StringName, int] = {}
+
+static func build_from_directory(directory: String) -> EquipmentCatalogIndex:
+	var index := EquipmentCatalogIndex.new()
+	var dir := DirAccess.open(directory)
+	if dir == null:
+		return index
+	var entries: Array[String] = []
+	dir.list_dir_begin()
+	while true:
+		var entry := dir.get_next()
+		if entry == "":
+			break
+		if dir.current_is_dir():
+			continue
+		if entry.ends_with(".tres") or entry.ends_with(".res"):
+			entries.append(entry)
+	dir.list_dir_end()
+	entries.sort()
+	for entry in entries:
+		var path := "%s/%s" % [directory, entry]
+		var resource := load(path)
+		if resource is EquipmentModuleResource:
+			index.add_module(resource, path)
+	return index
+
+func add_module(module: EquipmentModuleResource, path: String) -> void:
+	var bounds := Vector2i.ZERO
+	for cell in module.shape_mask:
+		bounds.x = max(bounds.x, cell.x + 1)
+		bounds.y = max(bounds.y, cell.y + 1)
+	module_ids.append(module.module_id)
+	display_names.append(module.display_name)
+	burdens.append(module.burden)
+	cell_counts.append(module.shape_mask.size())
+	mask_bounds.append(bounds.x)
+	mask_bounds.append(bounds.y)
+	resource_paths.append(path)
+	_lookup.clear()
+
+func size() -> int:
+	return module_ids.size()
+
+func find(module_id: StringName) -> int:
+	if _lookup.size() != module_ids.size():
+		_lookup.clear()
+		for index in module_ids.size():
+			_lookup[module_ids[index]] = index
+	return _lookup.get(module_id, -1)
+
+func get_mask_bounds(index: int) -> Vector2i:
+	return Vector2i(mask_bounds[index * 2], mask_bounds[index * 2 + 1])
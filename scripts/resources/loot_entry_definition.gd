@@ -0,0 +1,7 @@
+extends Resource
+class_name LootEntryDefinition
+
+@export var module: EquipmentModuleResource
+@export var rarity: StringName = &"common"
+## Room tags whose rooms can drop this module.
+@export var room_tags: Array[StringName] = []
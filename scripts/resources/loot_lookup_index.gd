@@ -0,0 +1,137 @@
+extends Resource
+class_name LootLookupIndex
+
+## Packed lookup compiled from a LootTableDefinition and shared by LootService
+## and EquipmentInventoryModel. Items are indexed in item_ids; room tags map to
+## bits in tag_names order. Alias tables for the tag masks rooms actually use
+## are stored precompiled; other masks are built on first use.
+
+@export var item_ids: Array[StringName] = []
+@export var item_rarities: PackedStringArray = PackedStringArray()
+@export var item_weights: PackedFloat32Array = PackedFloat32Array()
+@export var module_paths: PackedStringArray = PackedStringArray()
+@export var tag_names: PackedStringArray = PackedStringArray()
+## Items per tag: tag_members[tag_offsets[bit]..tag_offsets[bit + 1]].
+@export var tag_offsets: PackedInt32Array = PackedInt32Array([0])
+@export var tag_members: PackedInt32Array = PackedInt32Array()
+## Precompiled alias tables, sliced the same way by mask_offsets. Aliases
+## are slots relative to the start of their mask's range.
+@export var mask_keys: PackedInt64Array = PackedInt64Array()
+@export var mask_offsets: PackedInt32Array = PackedInt32Array([0])
+@export var mask_members: PackedInt32Array = PackedInt32Array()
+@export var mask_probabilities: PackedFloat32Array = PackedFloat32Array()
+@export var mask_aliases: PackedInt32Array = PackedInt32Array()
+
+const MAX_TAGS: int = 62
+
+var _item_lookup: Dictionary[StringName, int] = {}
+var _tag_bits: Dictionary[String, int] = {}
+var _tables: Dictionary[int, AliasTable] = {}
+
+## room_tag_sets lists the tag arrays of known rooms; their masks get
+## precompiled tables. Mask 0 (no loot tags) always covers every item.
+static func compile(table: LootTableDefinition, room_tag_sets: Array = []) -> LootLookupIndex:
+	var index := LootLookupIndex.new()
+	var tag_items: Dictionary[String, PackedInt32Array] = {}
+	for entry in table.entries:
+		if entry == null or entry.module == null:
+			continue
+		var item := index.find(entry.module.module_id)
+		if item < 0:
+			item = index.item_ids.size()
+			index.item_ids.append(entry.module.module_id)
+			index.item_rarities.append(String(entry.rarity))
+			index.item_weights.append(table.get_rarity_weight(entry.rarity))
+			index.module_paths.append(entry.module.resource_path)
+			index._item_lookup.clear()
+		for tag in entry.room_tags:
+			var items: PackedInt32Array = tag_items.get(String(tag), PackedInt32Array())
+			items.append(item)
+			tag_items[String(tag)] = items
+	for tag in tag_items:
+		if index.tag_names.size() >= MAX_TAGS:
+			push_warning("LootLookupIndex: too many loot tags, ignoring %s" % tag)
+			break
+		index.tag_names.append(tag)
+		index.tag_members.append_array(tag_items[tag])
+		index.tag_offsets.append(index.tag_members.size())
+	var masks: Dictionary[int, bool] = {0: true}
+	for tags in room_tag_sets:
+		masks[index.get_tag_mask(tags)] = true
+	for mask in masks:
+		index._store_table(mask, index._build_table(mask))
+	index._tables.clear()
+	return index
+
+func size() -> int:
+	return item_ids.size()
+
+func find(item_id: StringName) -> int:
+	if _item_lookup.size() != item_ids.size():
+		_item_lookup.clear()
+		for item in item_ids.size():
+			_item_lookup[item_ids[item]] = item
+	return _item_lookup.get(item_id, -1)
+
+func get_rarity(item_id: StringName) -> StringName:
+	var item := find(item_id)
+	return StringName(item_rarities[item]) if item >= 0 else &"unknown"
+
+func get_tag_mask(tags: Array) -> int:
+	if _tag_bits.size() != tag_names.size():
+		_tag_bits.clear()
+		for bit in tag_names.size():
+			_tag_bits[tag_names[bit]] = 1 << bit
+	var mask := 0
+	for tag in tags:
+		mask |= _tag_bits.get(String(tag), 0)
+	return mask
+
+## Alias table over the items that rooms with this tag mask can drop.
+## Members are item indices.
+func get_table(mask: int) -> AliasTable:
+	var table: AliasTable = _tables.get(mask, null)
+	if table != null:
+		return table
+	var slot := mask_keys.find(mask)
+	if slot >= 0:
+		table = AliasTable.new()
+		var start := mask_offsets[slot]
+		var end := mask_offsets[slot + 1]
+		table.members = mask_members.slice(start, end)
+		table.probabilities = mask_probabilities.slice(start, end)
+		table.aliases = mask_aliases.slice(start, end)
+		for item in table.members:
+			table.total_weight += item_weights[item]
+	else:
+		table = _build_table(mask)
+	_tables[mask] = table
+	return table
+
+func _build_table(mask: int) -> AliasTable:
+	var members := PackedInt32Array()
+	if mask == 0:
+		for item in item_ids.size():
+			members.append(item)
+	else:
+		var seen := PackedByteArray()
+		seen.resize(item_ids.size())
+		for bit in tag_names.size():
+			if (mask & (1 << bit)) == 0:
+				continue
+			for offset in range(tag_offsets[bit], tag_offsets[bit + 1]):
+				var item := tag_members[offset]
+				if seen[item] == 0:
+					seen[item] = 1
+					members.append(item)
+	var weights := PackedFloat32Array()
+	for item in members:
+		weights.append(item_weights[item])
+	return AliasTable.build(members, weights)
+
+func _store_table(mask: int, table: AliasTable) -> void:
+	mask_keys.append(mask)
+	mask_members.append_array(table.members)
+	mask_probabilities.append_array(table.probabilities)
+	mask_aliases.append_array(table.aliases)
+	mask_offsets.append(mask_members.size())
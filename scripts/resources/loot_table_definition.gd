@@ -0,0 +1,15 @@
+extends Resource
+class_name LootTableDefinition
+
+## Authored loot table. Entries point at equipment module resources so loot
+## ids always match the equipment catalog. Compile it into a LootLookupIndex
+## with scripts/tools/build_loot_lookup_index.gd.
+
+@export var rarity_weights: Dictionary = {
+	&"common": 1.0,
+	&"uncommon": 0.5,
+}
+@export var entries: Array[LootEntryDefinition] = []
+
+func get_rarity_weight(rarity: StringName) -> float:
+	return float(rarity_weights.get(rarity, 1.0))
@@ -0,0 +1,17 @@
+extends Resource
+class_name ResourceDefinition
+
+@export var resource_id: StringName
+@export var display_name: String = ""
+@export var max_value: int = 10
+@export var start_full: bool = true
+@export var initial_value: int = 0
+@export var warning: float = 0.5
+@export var critical: float = 0.25
+## Threat-style resources get worse as they rise; thresholds then trigger at or above the ratio.
+@export var rising_is_danger: bool = false
+
+func get_initial_value() -> int:
+	if start_full:
+		return max_value
+	return clampi(initial_value, 0, max_value)
@@ -0,0 +1,11 @@
+extends Resource
+class_name ResourceLedgerConfig
+
+@export var definitions: Array[ResourceDefinition] = []
+
+func get_definitions() -> Array[ResourceDefinition]:
+	var valid: Array[ResourceDefinition] = []
+	for definition in definitions:
+		if definition != null and not String(definition.resource_id).is_empty():
+			valid.append(definition)
+	return valid
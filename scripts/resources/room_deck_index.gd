@@ -0,0 +1,82 @@
+extends Resource
+class_name RoomDeckIndex
+
+## Boot-time summary of every room: what the deck needs to shuffle, weight and
+## resolve a room. Summary text and art stay in the RoomDefinition files under
+## resource_paths and are loaded when a room enters the queue.
+## Regenerate with scripts/tools/build_room_deck_index.gd.
+
+@export var room_ids: Array[StringName] = []
+@export var display_names: PackedStringArray = PackedStringArray()
+@export var tag_lists: Array[PackedStringArray] = []
+@export var threats: PackedStringArray = PackedStringArray()
+@export var clue_rewards: PackedInt32Array = PackedInt32Array()
+@export var materials_rewards: PackedInt32Array = PackedInt32Array()
+@export var oxygen_costs: PackedInt32Array = PackedInt32Array()
+@export var resource_paths: PackedStringArray = PackedStringArray()
+
+var _lookup: Dictionary[StringName, int] = {}
+
+static func build_from_directory(directory: String) -> RoomDeckIndex:
+	var index := RoomDeckIndex.new()
+	var dir := DirAccess.open(directory)
+	if dir == null:
+		return index
+	var entries: Array[String] = []
+	dir.list_dir_begin()
+	while true:
+		var entry := dir.get_next()
+		if entry == "":
+			break
+		if dir.current_is_dir():
+			continue
+		if entry.ends_with(".tres") or entry.ends_with(".res"):
+			entries.append(entry)
+	dir.list_dir_end()
+	entries.sort()
+	for entry in entries:
+		var path := "%s/%s" % [directory, entry]
+		var resource := load(path)
+		if resource is RoomDefinition:
+			index.add_room(resource, path)
+	return index
+
+func add_room(room: RoomDefinition, path: String) -> void:
+	var tags := PackedStringArray()
+	for tag in room.tags:
+		tags.append(String(tag))
+	room_ids.append(room.room_id)
+	display_names.append(room.display_name)
+	tag_lists.append(tags)
+	threats.append(String(room.threat))
+	clue_rewards.append(room.clue_reward)
+	materials_rewards.append(room.materials_reward)
+	oxygen_costs.append(room.oxygen_cost)
+	resource_paths.append(path)
+	_lookup.clear()
+
+func size() -> int:
+	return room_ids.size()
+
+func find(room_id: StringName) -> int:
+	if _lookup.size() != room_ids.size():
+		_lookup.clear()
+		for index in room_ids.size():
+			_lookup[room_ids[index]] = index
+	return _lookup.get(room_id, -1)
+
+## Room record without summary or art, in the same shape as
+## RoomDefinition.to_record().
+func get_record(index: int) -> Dictionary:
+	var tags: Array[String] = []
+	for tag in tag_lists[index]:
+		tags.append(tag)
+	return {
+		"id": String(room_ids[index]),
+		"name": display_names[index],
+		"tags": tags,
+		"threat": threats[index],
+		"clue_reward": clue_rewards[index],
+		"materials_reward": materials_rewards[index],
+		"oxygen_cost": oxygen_costs[index],
+	}
@@ -0,0 +1,37 @@
+extends Resource
+class_name RoomDeckRules
+
+## Draw weights for the room deck. Each profile maps a tag family to a weight;
+## a tag matches a family when it equals it or starts with "<family>_", so
+## "hazard" covers hazard_low/med/high. A room weighs as much as its heaviest
+## matching family, or default_weight when none match.
+
+@export var weighted_draws: bool = true
+@export var default_weight: float = 0.5
+@export var profiles: Dictionary = {
+	&"normal": {"hazard": 1.0, "cache": 0.8, "sanctuary": 0.7, "anomaly": 0.3},
+}
+
+func has_profile(profile: StringName) -> bool:
+	return profiles.has(profile)
+
+func get_profile_names() -> Array[StringName]:
+	var names: Array[StringName] = []
+	for profile in profiles.keys():
+		names.append(StringName(profile))
+	return names
+
+func get_room_weight(profile: StringName, tags: Array) -> float:
+	var weights := profiles.get(profile, {}) as Dictionary
+	var best: float = -1.0
+	for tag_variant in tags:
+		var tag := String(tag_variant)
+		for family in weights.keys():
+			var family_name := String(family)
+			if tag == family_name or tag.begins_with(family_name + "_"):
+				best = max(best, float(weights[family]))
+	return best if best >= 0.0 else default_weight
+
+func set_profile(profile: StringName, weights: Dictionary) -> void:
+	profiles[profile] = weights.duplicate()
+	emit_changed()
@@ -0,0 +1,29 @@
+extends Resource
+class_name RoomDefinition
+
+@export var room_id: StringName
+@export var display_name: String = ""
+@export var tags: Array[StringName] = []
+@export var threat: StringName
+@export_multiline var summary: String = ""
+@export_file("*.png", "*.tres") var art_path: String = ""
+@export var clue_reward: int = 0
+@export var materials_reward: int = 0
+@export var oxygen_cost: int = 0
+
+## Full room record as handed out by RoomQueueService.
+func to_record() -> Dictionary:
+	var tag_names: Array[String] = []
+	for tag in tags:
+		tag_names.append(String(tag))
+	return {
+		"id": String(room_id),
+		"name": display_name,
+		"tags": tag_names,
+		"threat": String(threat),
+		"summary": summary,
+		"art_path": art_path,
+		"clue_reward": clue_reward,
+		"materials_reward": materials_reward,
+		"oxygen_cost": oxygen_cost,
+	}
@@ -0,0 +1,81 @@
+extends Resource
+class_name ThreatTemplate
+
+## Shared, read-only description of a threat. Latched threats reference one
+## template and only keep their own timer, cooldown and statuses.
+
+@export var threat_id: StringName
+@export var display_name: String = ""
+@export var severity: StringName = &"moderate"
+@export_multiline var summary: String = ""
+@export var timer: int = 3
+@export var attack_type: StringName = &"standard"
+@export var damage: int = 1
+@export var threat_delta: int = 1
+@export var cooldown: int = 1
+@export var attack_statuses: Array[Dictionary] = []
+
+var _attack: Dictionary = {}
+var _attack_pattern: Dictionary = {}
+
+## Builds a one-off template from a legacy threat dictionary.
+static func from_dictionary(info: Dictionary) -> ThreatTemplate:
+	var template := ThreatTemplate.new()
+	template.threat_id = StringName(String(info.get("id", "")))
+	template.display_name = String(info.get("name", template.threat_id))
+	template.severity = StringName(String(info.get("severity", "moderate")))
+	template.summary = String(info.get("summary", ""))
+	template.timer = int(info.get("timer", 3))
+	var pattern: Dictionary = info.get("attack_pattern", {}) as Dictionary
+	template.attack_type = StringName(String(pattern.get("type", "standard")))
+	template.damage = int(pattern.get("damage", 1))
+	template.threat_delta = int(pattern.get("threat_delta", 1))
+	template.cooldown = int(pattern.get("cooldown", 1))
+	for status in pattern.get("statuses", []):
+		template.attack_statuses.append((status as Dictionary).duplicate(true))
+	return template
+
+## Attack payload shared by every instance; read-only.
+func get_attack() -> Dictionary:
+	if _attack.is_empty():
+		var statuses: Array = []
+		for status in attack_statuses:
+			var entry := status.duplicate()
+			entry.make_read_only()
+			statuses.append(entry)
+		statuses.make_read_only()
+		_attack = {"damage": damage, "threat_delta": threat_delta, "statuses": statuses}
+		_attack.make_read_only()
+	return _attack
+
+## Attack pattern shared by every instance; read-only. Use
+## get_attack_pattern() for a copy that can be edited.
+func get_shared_attack_pattern() -> Dictionary:
+	if _attack_pattern.is_empty():
+		_attack_pattern = get_attack_pattern()
+		var statuses: Array = _attack_pattern["statuses"]
+		for status in statuses:
+			(status as Dictionary).make_read_only()
+		statuses.make_read_only()
+		_attack_pattern.make_read_only()
+	return _attack_pattern
+
+func get_attack_pattern() -> Dictionary:
+	return {
+		"type": String(attack_type),
+		"damage": damage,
+		"threat_delta": threat_delta,
+		"cooldown": cooldown,
+		"statuses": attack_statuses.duplicate(true),
+	}
+
+func to_dictionary() -> Dictionary:
+	return {
+		"id": String(threat_id),
+		"name": display_name,
+		"timer": timer,
+		"severity": String(severity),
+		"summary": summary,
+		"attack_pattern": get_attack_pattern(),
+		"status_effects": [],
+	}
@@ -4,24 +4,132 @@ signal preview_updated(state: StringName, cells: Array)
 signal preview_cleared()
 signal feedback_played(feedback_type: StringName)
 
-var _valid_pool: Array = []
-var _invalid_pool: Array = []
-var _active_overlays: Array = []
+const VALID_OVERLAY_COLOR := Color(0.24, 0.95, 0.87, 0.45)
+const INVALID_OVERLAY_COLOR := Color(0.96, 0.33, 0.33, 0.45)
+const NEUTRAL_OVERLAY_COLOR := Color(0.82, 0.82, 0.82, 0.3)
 
+var _valid_pool: Array[ColorRect] = []
+var _invalid_pool: Array[ColorRect] = []
+var _neutral_pool: Array[ColorRect] = []
+var _active_overlays: Array[ColorRect] = []
+var _overlay_host: Control = null
+var _cell_rect: Callable = Callable()
+# Hover requests are coalesced: only the last one per frame is drawn.
+var _pending_state: StringName = &""
+var _pending_cells: Array = []
+var _pending_conflicts: Array = []
+var _preview_scheduled: bool = false
+
+## Pre-warms one valid, one invalid and one neutral overlay per grid cell
+## under host.
+## cell_rect(cell: Vector2i) -> Rect2 must return global rects; an empty rect
+## skips the cell.
+func attach_overlay_host(host: Control, cell_count: int, cell_rect: Callable) -> void:
+	detach_overlay_host()
+	_overlay_host = host
+	_cell_rect = cell_rect
+	for _i in cell_count:
+		_valid_pool.append(_create_overlay(VALID_OVERLAY_COLOR))
+		_invalid_pool.append(_create_overlay(INVALID_OVERLAY_COLOR))
+		_neutral_pool.append(_create_overlay(NEUTRAL_OVERLAY_COLOR))
+
+func detach_overlay_host() -> void:
+	for overlay in _valid_pool + _invalid_pool + _neutral_pool + _active_overlays:
+		if is_instance_valid(overlay):
+			overlay.queue_free()
+	_valid_pool.clear()
+	_invalid_pool.clear()
+	_neutral_pool.clear()
+	_active_overlays.clear()
+	_overlay_host = null
+	_cell_rect = Callable()
+
+func has_overlay_host() -> bool:
+	return _overlay_host != null and is_instance_valid(_overlay_host)
+
+func get_active_overlay_count() -> int:
+	return _active_overlays.size()
+
+## The cells array is kept until the frame's preview is drawn; callers should
+## pass a fresh array rather than reuse one.
 func show_valid_preview(cells: Array) -> void:
-	preview_updated.emit(&"valid", _duplicate_cells(cells))
+	_queue_preview(&"valid", cells)
 
-func show_invalid_preview(cells: Array) -> void:
-	preview_updated.emit(&"invalid", _duplicate_cells(cells))
+## Tints only the conflicts red and draws the rest of the footprint neutral.
+## Without conflicts the whole footprint is treated as blocked.
+func show_invalid_preview(cells: Array, conflicts: Array = []) -> void:
+	_queue_preview(&"invalid", cells, conflicts)
 
 func clear_preview() -> void:
-	preview_cleared.emit()
+	_queue_preview(&"clear", [])
+
+## Draws the pending preview now instead of at the end of the frame.
+func flush_preview() -> void:
+	_preview_scheduled = false
+	var state := _pending_state
+	var cells := _pending_cells
+	var conflicts := _pending_conflicts
+	_pending_state = &""
+	_pending_cells = []
+	_pending_conflicts = []
+	match state:
+		&"":
+			return
+		&"clear":
+			_release_overlays()
+			preview_cleared.emit()
+		_:
+			_release_overlays()
+			_acquire_overlays(state, cells, conflicts)
+			preview_updated.emit(state, cells)
 
 func play_action_feedback(feedback_type: StringName) -> void:
 	feedback_played.emit(feedback_type)
 
-func _duplicate_cells(cells: Array) -> Array:
-	var copy: Array[Vector2i] = []
-	for cell in cells:
-		copy.append(Vector2i(cell))
-	return copy
+func _queue_preview(state: StringName, cells: Array, conflicts: Array = []) -> void:
+	_pending_state = state
+	_pending_cells = cells
+	_pending_conflicts = conflicts
+	if _preview_scheduled:
+		return
+	_preview_scheduled = true
+	call_deferred("flush_preview")
+
+func _acquire_overlays(state: StringName, cells: Array, conflicts: Array) -> void:
+	if not has_overlay_host():
+		return
+	var marks_conflicts := state == &"invalid" and not conflicts.is_empty()
+	for cell_variant in cells:
+		var cell := Vector2i(cell_variant)
+		var pool := _valid_pool
+		if state != &"valid":
+			pool = _neutral_pool if marks_conflicts and not conflicts.has(cell) else _invalid_pool
+		if pool.is_empty():
+			continue
+		var rect: Rect2 = _cell_rect.call(cell)
+		if rect.size == Vector2.ZERO:
+			continue
+		var overlay: ColorRect = pool.pop_back()
+		overlay.global_position = rect.position
+		overlay.size = rect.size
+		overlay.visible = true
+		_active_overlays.append(overlay)
+
+func _release_overlays() -> void:
+	for overlay in _active_overlays:
+		overlay.visible = false
+		if overlay.color == VALID_OVERLAY_COLOR:
+			_valid_pool.append(overlay)
+		elif overlay.color == NEUTRAL_OVERLAY_COLOR:
+			_neutral_pool.append(overlay)
+		else:
+			_invalid_pool.append(overlay)
+	_active_overlays.clear()
+
+func _create_overlay(color: Color) -> ColorRect:
+	var overlay := ColorRect.new()
+	overlay.color = color
+	overlay.mouse_filter = Control.MOUSE_FILTER_IGNORE
+	overlay.visible = false
+	_overlay_host.add_child(overlay)
+	return overlay
@@ -2,65 +2,225 @@ extends Node
 
 signal inventory_changed(carry: Array[Dictionary], installed: Dictionary)
 signal grid_updated(grid: Array)
+## Incremental counterpart to grid_updated: only the cells touched since the
+## last emission, paired with their new occupant (&"" when vacated).
+signal grid_cells_changed(version: int, cells: Array[Vector2i], module_ids: Array[StringName])
 signal loadout_changed(loadout: Dictionary)
 signal burden_changed(total_burden: int, state: StringName)
 signal dice_binding_updated(slot: StringName, module_id: StringName)
 signal placement_invalid(module_id: StringName, reason: StringName, conflicts: Array)
+signal auto_arrange_finished(placements: Array[Dictionary], unplaced: Array[StringName])
 
 const ROTATIONS: Array[int] = [0, 90, 180, 270]
+## Each grid row is stored as one int bitmask, so rows are capped at 63 cells.
+const MAX_GRID_WIDTH: int = 63
+const EMPTY_CELL: int = -1
+## Highest-scoring placements tried per module while packing; keeps the
+## backtracking search shallow enough to finish within a few frames.
+const ARRANGE_BRANCH_LIMIT: int = 4
+const BATCH_INVENTORY: int = 1
+const BATCH_GRID: int = 2
+const BATCH_LOADOUT: int = 4
+const BATCH_BURDEN: int = 8
+const NEIGHBOR_OFFSETS: Array[Vector2i] = [Vector2i.LEFT, Vector2i.RIGHT, Vector2i.UP, Vector2i.DOWN]
+
+class ArrangeJob:
+	var module_ids: Array[StringName] = []
+	var cell_counts: PackedInt32Array = PackedInt32Array()
+	var remaining_cells: PackedInt32Array = PackedInt32Array()
+	var board: PackedInt64Array = PackedInt64Array()
+	var burden: int = 0
+	var placed_cells: int = 0
+	# One entry per depth: candidates (Vector3i x, y, rotation), cursor, applied.
+	var candidates: Array = []
+	var cursors: PackedInt32Array = PackedInt32Array()
+	var applied: Array[Vector3i] = []
+	var best: Array[Vector3i] = []
+	var best_cells: int = -1
+	var elapsed_usec: int = 0
 
 @export var config_path: String = "res://resources/config/equipment_matrix.tres"
 @export var modules_path: String = "res://resources/equipment"
+@export var catalog_index_path: String = "res://resources/config/equipment_catalog_index.tres"
+## Same compiled lookup LootService rolls from; supplies item rarities.
+@export var loot_index_path: String = "res://resources/config/loot_lookup_index.tres"
+## Longest a single frame may spend on auto-arrange before yielding.
+@export var arrange_step_budget_usec: int = 1000
+## Total search time before auto-arrange settles for the best packing found.
+@export var arrange_time_budget_usec: int = 50000
 
 var _config: EquipmentMatrixConfig
+var _catalog_index: EquipmentCatalogIndex = EquipmentCatalogIndex.new()
+var _loot_index: LootLookupIndex = null
+# Modules loaded so far; the index lists everything that can be loaded.
 var _catalog: Dictionary[StringName, EquipmentModuleResource] = {}
+var _pending_loads: Dictionary[StringName, String] = {}
+# Switched to CACHE_MODE_REPLACE by reload_catalog() so module files edited on
+# disk are re-read instead of served from the ResourceLoader cache.
+var _module_cache_mode: ResourceLoader.CacheMode = ResourceLoader.CACHE_MODE_REUSE
+# Per module, indexed by rotation / 90: normalized offsets, one bitmask per
+# footprint row, and the (width, height) bounding box packed as pairs.
+var _mask_cells: Dictionary[StringName, Array] = {}
+var _mask_rows: Dictionary[StringName, Array] = {}
+var _mask_extents: Dictionary[StringName, PackedInt32Array] = {}
+# Valid-origin maps per module and rotation index, dropped on grid mutation.
+var _placement_maps: Dictionary[StringName, Array] = {}
+var _grid_version: int = 0
+var _pending_cells: Array[Vector2i] = []
+var _pending_modules: Array[StringName] = []
 var _grid_width: int = 0
 var _grid_height: int = 0
-var _grid: Array = []
-var _carry: Array[Dictionary] = []
+var _row_bits: PackedInt64Array = PackedInt64Array()
+var _cell_modules: PackedInt32Array = PackedInt32Array()
+var _module_ids: Array[StringName] = []
+var _module_slots: Dictionary[StringName, int] = {}
+# Carried modules stack by id. Handles stay fixed for the life of a stack so
+# UI rows can be matched across updates.
+var _carry_counts: Dictionary[StringName, int] = {}
+var _carry_handles: Dictionary[StringName, int] = {}
+var _next_carry_handle: int = 1
+var _carry_view: Array[Dictionary] = []
+var _carry_view_dirty: bool = false
 var _installed: Dictionary[StringName, Dictionary] = {}
 var _total_burden: int = 0
 var _burden_state: StringName = &"safe"
 var _telemetry_hub: Node = null
+var _arrange_job: ArrangeJob = null
+var _batch_depth: int = 0
+var _batch_flags: int = 0
+var _batch_burden_delta: int = 0
+var _batch_bindings: Array[StringName] = []
 
 func _ready() -> void:
 	_load_config()
 	_load_catalog()
 	reset()
+	set_process(false)
+
+func _process(_delta: float) -> void:
+	if _arrange_job == null:
+		set_process(false)
+		return
+	step_auto_arrange()
 
 func reset() -> void:
-	_grid_width = max(1, _config.grid_width)
+	_grid_width = clamp(_config.grid_width, 1, MAX_GRID_WIDTH)
 	_grid_height = max(1, _config.grid_height)
-	_grid = []
-	for _y in _grid_height:
-		var row: Array = []
-		for _x in _grid_width:
-			row.append(null)
-		_grid.append(row)
-	_carry.clear()
+	_row_bits.resize(_grid_height)
+	_row_bits.fill(0)
+	_cell_modules.resize(_grid_width * _grid_height)
+	_cell_modules.fill(EMPTY_CELL)
+	_placement_maps.clear()
+	_pending_cells.clear()
+	_pending_modules.clear()
+	for y in _grid_height:
+		for x in _grid_width:
+			_pending_cells.append(Vector2i(x, y))
+			_pending_modules.append(&"")
+	_clear_carry()
 	_installed.clear()
 	_total_burden = max(0, _config.base_burden)
 	_burden_state = _evaluate_burden_state(_total_burden)
 	_emit_all()
 
+## Loads every module in the index; prefer get_module_name() or has_module()
+## when only summary data is needed.
 func get_catalog() -> Dictionary:
 	var result: Dictionary = {}
-	for module_id in _catalog.keys():
-		var module: EquipmentModuleResource = _catalog[module_id]
-		result[module_id] = _module_to_dictionary(module)
+	for module_id in _catalog_index.module_ids:
+		var module := _get_module(module_id)
+		if module:
+			result[module_id] = _module_to_dictionary(module)
 	return result
 
-func get_grid() -> Array:
-	var duplicate_grid: Array = []
-	for row in _grid:
-		duplicate_grid.append(row.duplicate())
-	return duplicate_grid
+func has_module(module_id: StringName) -> bool:
+	return _catalog_index.find(_normalize_module_id(module_id)) >= 0
 
-func get_carry_items() -> Array:
-	var copy: Array[Dictionary] = []
-	for entry in _carry:
-		copy.append(entry.duplicate(true))
-	return copy
+func get_module_name(module_id: StringName) -> String:
+	var index := _catalog_index.find(_normalize_module_id(module_id))
+	return _catalog_index.display_names[index] if index >= 0 else ""
+
+## Starts background loads for modules that are likely to be needed soon, such
+## as loot offered by upcoming rooms.
+func prefetch_modules(module_ids: Array[StringName]) -> void:
+	for module_id in module_ids:
+		var normalized_id: StringName = _normalize_module_id(module_id)
+		if _catalog.has(normalized_id) or _pending_loads.has(normalized_id):
+			continue
+		var index := _catalog_index.find(normalized_id)
+		if index < 0:
+			continue
+		var path := _catalog_index.resource_paths[index]
+		if ResourceLoader.load_threaded_request(path, "EquipmentModuleResource", false, _module_cache_mode) == OK:
+			_pending_loads[normalized_id] = path
+
+func get_grid() -> Array:
+	var grid: Array = []
+	for y in _grid_height:
+		var row: Array = []
+		row.resize(_grid_width)
+		var offset := y * _grid_width
+		for x in _grid_width:
+			var slot: int = _cell_modules[offset + x]
+			if slot != EMPTY_CELL:
+				row[x] = _module_ids[slot]
+		grid.append(row)
+	return grid
+
+func get_grid_version() -> int:
+	return _grid_version
+
+func get_grid_size() -> Vector2i:
+	return Vector2i(_grid_width, _grid_height)
+
+func is_cell_occupied(cell: Vector2i) -> bool:
+	if not _is_cell_inside(cell):
+		return false
+	return ((_row_bits[cell.y] >> cell.x) & 1) == 1
+
+func get_module_at(cell: Vector2i) -> StringName:
+	if not _is_cell_inside(cell):
+		return &""
+	var slot: int = _cell_modules[cell.y * _grid_width + cell.x]
+	return _module_ids[slot] if slot != EMPTY_CELL else &""
+
+## One entry per carried stack with "count" and "handle" fields. The array is
+## shared until the carry changes and is replaced rather than edited, so
+## callers may hold on to it but must not modify it.
+func get_carry_items() -> Array[Dictionary]:
+	if _carry_view_dirty:
+		var view: Array[Dictionary] = []
+		for module_id in _carry_counts:
+			var module := _get_module(module_id)
+			if module == null:
+				continue
+			var entry := _module_to_dictionary(module)
+			entry["count"] = _carry_counts[module_id]
+			entry["handle"] = _carry_handles[module_id]
+			entry["rarity"] = get_loot_rarity(module_id)
+			view.append(entry)
+		view.make_read_only()
+		_carry_view = view
+		_carry_view_dirty = false
+	return _carry_view
+
+## Modules the loot table can award, for prefetch_modules().
+func get_loot_module_ids() -> Array[StringName]:
+	if _loot_index == null:
+		return []
+	return _loot_index.item_ids.duplicate()
+
+func get_loot_rarity(module_id: StringName) -> StringName:
+	if _loot_index == null:
+		return &"unknown"
+	return _loot_index.get_rarity(_normalize_module_id(module_id))
+
+func get_carry_count(module_id: StringName) -> int:
+	return _carry_counts.get(_normalize_module_id(module_id), 0)
+
+## Returns the stable handle of a carried stack, or 0 when nothing is carried.
+func get_carry_handle(module_id: StringName) -> int:
+	return _carry_handles.get(_normalize_module_id(module_id), 0)
 
 func get_installed_items() -> Dictionary:
 	return _installed.duplicate(true)
@@ -73,10 +233,9 @@ func get_burden_state() -> StringName:
 
 func add_loot(module_id: StringName) -> void:
 	var normalized_id: StringName = _normalize_module_id(module_id)
-	var module: EquipmentModuleResource = _catalog.get(normalized_id, null)
-	if module == null:
+	if _get_module(normalized_id) == null:
 		return
-	_carry.append(_module_to_dictionary(module))
+	_add_to_carry(normalized_id, 1)
 	_emit_inventory()
 
 func remove_installed(module_id: StringName) -> void:
@@ -86,9 +245,7 @@ func remove_installed(module_id: StringName) -> void:
 		return
 	var cells: Array = installed_entry.get("cells", [])
 	for cell_variant in cells:
-		var cell := Vector2i(cell_variant)
-		if _is_cell_inside(cell):
-			_grid[cell.y][cell.x] = null
+		_vacate_cell(Vector2i(cell_variant))
 	_installed.erase(normalized_id)
 	_apply_burden_delta(-int(installed_entry.get("burden", 0)))
 	_emit_inventory()
@@ -111,7 +268,7 @@ func place_item(module_id: StringName, origin: Vector2i, rotation: int = 0) -> b
 
 func evaluate_placement(module_id: StringName, origin: Vector2i, rotation: int) -> Dictionary:
 	var normalized_id: StringName = _normalize_module_id(module_id)
-	var module: EquipmentModuleResource = _catalog.get(normalized_id, null)
+	var module := _get_module(normalized_id)
 	if module == null:
 		return {
 			"valid": false,
@@ -127,20 +284,24 @@ func evaluate_placement(module_id: StringName, origin: Vector2i, rotation: int)
 			"footprint": [],
 			"conflicts": [],
 		}
+	var rotation_index := normalized_rotation / 90
 	var offsets: Array[Vector2i] = _get_rotated_mask(module, normalized_rotation)
 	var footprint: Array[Vector2i] = []
-	var conflicts: Array[Vector2i] = []
-	var reason: StringName = &"valid"
 	for offset in offsets:
-		var cell := origin + offset
-		footprint.append(cell)
-		if not _is_cell_inside(cell):
-			conflicts.append(cell)
-			reason = &"out_of_bounds"
-		elif _grid[cell.y][cell.x] != null:
-			conflicts.append(cell)
-			reason = &"occupied"
-	if not conflicts.is_empty():
+		footprint.append(origin + offset)
+	var extents: PackedInt32Array = _mask_extents[normalized_id]
+	var extent := Vector2i(extents[rotation_index * 2], extents[rotation_index * 2 + 1])
+	if not _footprint_fits(_mask_rows[normalized_id][rotation_index], extent, origin):
+		# Slow path only when rejected: walk the cells to report conflicts.
+		var conflicts: Array[Vector2i] = []
+		var reason: StringName = &"valid"
+		for cell in footprint:
+			if not _is_cell_inside(cell):
+				conflicts.append(cell)
+				reason = &"out_of_bounds"
+			elif is_cell_occupied(cell):
+				conflicts.append(cell)
+				reason = &"occupied"
 		return {
 			"valid": false,
 			"reason": reason,
@@ -155,9 +316,151 @@ func evaluate_placement(module_id: StringName, origin: Vector2i, rotation: int)
 		"rotation": normalized_rotation,
 	}
 
+## Same result as evaluate_placement(), but answers accepted origins from the
+## cached placement map so repeated hover previews skip the footprint test.
+func preview_placement(module_id: StringName, origin: Vector2i, rotation: int) -> Dictionary:
+	if not _is_cell_inside(origin):
+		return evaluate_placement(module_id, origin, rotation)
+	var placement_map := compute_placement_map(module_id, rotation)
+	if placement_map[origin.y * _grid_width + origin.x] == 0:
+		return evaluate_placement(module_id, origin, rotation)
+	var normalized_id: StringName = _normalize_module_id(module_id)
+	var normalized_rotation := _normalize_rotation(rotation)
+	var footprint: Array[Vector2i] = []
+	for offset in _mask_cells[normalized_id][normalized_rotation / 90]:
+		footprint.append(origin + offset)
+	return {
+		"valid": true,
+		"reason": &"valid",
+		"footprint": footprint,
+		"conflicts": [],
+		"rotation": normalized_rotation,
+	}
+
+## Returns one byte per grid cell (row-major, width from get_grid_size()) set
+## to 1 where the module can be placed with that cell as its origin. Maps are
+## cached until the grid or catalog changes.
+func compute_placement_map(module_id: StringName, rotation: int = 0) -> PackedByteArray:
+	var normalized_id: StringName = _normalize_module_id(module_id)
+	var normalized_rotation := _normalize_rotation(rotation)
+	var rotation_index := normalized_rotation / 90
+	var cached: Array = _placement_maps.get(normalized_id, [])
+	if not cached.is_empty() and not (cached[rotation_index] as PackedByteArray).is_empty():
+		return cached[rotation_index]
+	var placement_map := PackedByteArray()
+	placement_map.resize(_grid_width * _grid_height)
+	placement_map.fill(0)
+	var module := _get_module(normalized_id)
+	if module != null and (normalized_rotation == 0 or _config.can_rotate(normalized_id)):
+		_get_rotated_mask(module, normalized_rotation)
+		var rows: PackedInt64Array = _mask_rows[normalized_id][rotation_index]
+		var extents: PackedInt32Array = _mask_extents[normalized_id]
+		var extent := Vector2i(extents[rotation_index * 2], extents[rotation_index * 2 + 1])
+		for y in range(0, _grid_height - extent.y + 1):
+			for x in range(0, _grid_width - extent.x + 1):
+				if _footprint_fits(rows, extent, Vector2i(x, y)):
+					placement_map[y * _grid_width + x] = 1
+	if cached.is_empty():
+		cached = [PackedByteArray(), PackedByteArray(), PackedByteArray(), PackedByteArray()]
+		_placement_maps[normalized_id] = cached
+	cached[rotation_index] = placement_map
+	return placement_map
+
+## Suggests where a module fits best on the current grid, preferring spots that
+## touch walls and installed modules. The result carries "valid", "origin",
+## "rotation" and the "burden_state" that equipping it would produce.
+func find_placement(module_id: StringName) -> Dictionary:
+	var normalized_id: StringName = _normalize_module_id(module_id)
+	var module := _get_module(normalized_id)
+	if module == null:
+		return {"valid": false, "reason": &"unknown_module"}
+	var candidates := _collect_candidates(normalized_id, _row_bits, 1)
+	if candidates.is_empty():
+		return {"valid": false, "reason": &"no_space"}
+	var best: Vector3i = candidates[0]
+	return {
+		"valid": true,
+		"reason": &"valid",
+		"origin": Vector2i(best.x, best.y),
+		"rotation": best.z,
+		"burden_state": _evaluate_burden_state(_total_burden + module.burden),
+	}
+
+## Packs the given modules (or every carried module when empty) onto the grid.
+## The search runs in slices of arrange_step_budget_usec from _process and
+## emits auto_arrange_finished once it has placed the best packing it found.
+## Modules that would push burden into the critical band are left unplaced.
+func start_auto_arrange(module_ids: Array[StringName] = []) -> void:
+	var requested: Array[StringName] = module_ids.duplicate()
+	if requested.is_empty():
+		requested.assign(_carry_counts.keys())
+	var job := ArrangeJob.new()
+	for module_id in requested:
+		var normalized_id: StringName = _normalize_module_id(module_id)
+		if _installed.has(normalized_id) or job.module_ids.has(normalized_id):
+			continue
+		if _get_module(normalized_id) != null:
+			job.module_ids.append(normalized_id)
+	# Largest footprints first so the first complete branch is already tight.
+	job.module_ids.sort_custom(func(a: StringName, b: StringName) -> bool:
+		return _catalog[a].shape_mask.size() > _catalog[b].shape_mask.size()
+	)
+	var count := job.module_ids.size()
+	job.cell_counts.resize(count)
+	job.remaining_cells.resize(count + 1)
+	job.remaining_cells[count] = 0
+	for index in range(count - 1, -1, -1):
+		job.cell_counts[index] = _catalog[job.module_ids[index]].shape_mask.size()
+		job.remaining_cells[index] = job.remaining_cells[index + 1] + job.cell_counts[index]
+	job.board = _row_bits.duplicate()
+	job.burden = _total_burden
+	_arrange_job = job
+	set_process(true)
+
+## Runs the pending auto-arrange search for up to budget_usec microseconds.
+## Returns true once the search has finished and its result was applied.
+func step_auto_arrange(budget_usec: int = arrange_step_budget_usec) -> bool:
+	var job := _arrange_job
+	if job == null:
+		return true
+	var started := Time.get_ticks_usec()
+	var finished := false
+	while not finished:
+		finished = _advance_arrange(job)
+		if Time.get_ticks_usec() - started >= budget_usec:
+			break
+	job.elapsed_usec += Time.get_ticks_usec() - started
+	if finished or job.elapsed_usec >= arrange_time_budget_usec:
+		_finish_auto_arrange(job)
+		return true
+	return false
+
+func cancel_auto_arrange() -> void:
+	_arrange_job = null
+	set_process(false)
+
+func is_arranging() -> bool:
+	return _arrange_job != null
+
+## Defers change signals until the matching commit(), which emits each of
+## them once. Batches nest; only the outermost commit emits.
+func begin_batch() -> void:
+	_batch_depth += 1
+
+func commit() -> void:
+	if _batch_depth == 0:
+		return
+	_batch_depth -= 1
+	if _batch_depth > 0:
+		return
+	_flush_batch()
+
+func is_batching() -> bool:
+	return _batch_depth > 0
+
 func get_snapshot() -> Dictionary:
 	return {
-		"carry": get_carry_items(),
+		"carry": get_carry_items().duplicate(true),
 		"installed": get_installed_items(),
 		"grid": get_grid(),
 		"total_burden": _total_burden,
@@ -165,25 +468,27 @@ func get_snapshot() -> Dictionary:
 	}
 
 func apply_snapshot(snapshot: Dictionary) -> void:
+	begin_batch()
 	reset()
 	var carry_snapshot := snapshot.get("carry", []) as Array
-	_carry.clear()
+	_clear_carry()
 	for entry in carry_snapshot:
 		if typeof(entry) == TYPE_DICTIONARY:
-			_carry.append((entry as Dictionary).duplicate(true))
+			var module_id: StringName = _normalize_module_id(entry.get("id", ""))
+			if has_module(module_id):
+				_add_to_carry(module_id, max(1, int(entry.get("count", 1))))
 	var installed_snapshot := snapshot.get("installed", {}) as Dictionary
 	_installed.clear()
 	for module_id in installed_snapshot.keys():
 		var entry: Dictionary = installed_snapshot.get(module_id, {})
 		var cells: Array = entry.get("cells", [])
 		for cell_variant in cells:
-			var cell := Vector2i(cell_variant)
-			if _is_cell_inside(cell):
-				_grid[cell.y][cell.x] = module_id
+			_occupy_cell(Vector2i(cell_variant), StringName(module_id))
 		_installed[module_id] = entry.duplicate(true)
 	_total_burden = int(snapshot.get("total_burden", _config.base_burden))
 	_burden_state = StringName(snapshot.get("burden_state", "safe"))
 	_emit_all()
+	commit()
 
 func get_slot_bindings() -> Dictionary:
 	var bindings: Dictionary = {}
@@ -202,9 +507,7 @@ func _commit_placement(module_id: StringName, result: Dictionary) -> void:
 	var rotation: int = int(result.get("rotation", 0))
 	var footprint: Array = result.get("footprint", [])
 	for cell_variant in footprint:
-		var cell := Vector2i(cell_variant)
-		if _is_cell_inside(cell):
-			_grid[cell.y][cell.x] = module_id
+		_occupy_cell(Vector2i(cell_variant), module_id)
 	var origin_cell := Vector2i.ZERO
 	if not footprint.is_empty():
 		origin_cell = Vector2i(footprint[0])
@@ -232,6 +535,10 @@ func _commit_placement(module_id: StringName, result: Dictionary) -> void:
 	})
 
 func _emit_slot_bindings(module_id: StringName) -> void:
+	if _batch_depth > 0:
+		if not _batch_bindings.has(module_id):
+			_batch_bindings.append(module_id)
+		return
 	var bindings := _config.get_slot_tags(module_id)
 	for slot in bindings:
 		dice_binding_updated.emit(slot, module_id)
@@ -242,6 +549,10 @@ func _apply_burden_delta(delta: int) -> void:
 	_total_burden = max(0, _total_burden + delta)
 	var previous_state := _burden_state
 	_burden_state = _evaluate_burden_state(_total_burden)
+	if _batch_depth > 0:
+		_batch_burden_delta += delta
+		_batch_flags |= BATCH_BURDEN
+		return
 	if previous_state != _burden_state or delta != 0:
 		burden_changed.emit(_total_burden, _burden_state)
 		_record_telemetry("matrix_burden_changed", {
@@ -251,12 +562,32 @@ func _apply_burden_delta(delta: int) -> void:
 		})
 
 func _emit_inventory() -> void:
+	if _batch_depth > 0:
+		_batch_flags |= BATCH_INVENTORY
+		return
 	inventory_changed.emit(get_carry_items(), get_installed_items())
 
 func _emit_grid() -> void:
-	grid_updated.emit(get_grid())
+	if _batch_depth > 0:
+		_batch_flags |= BATCH_GRID
+		return
+	if not _pending_cells.is_empty():
+		var cells := _pending_cells
+		var module_ids := _pending_modules
+		_pending_cells = []
+		_pending_modules = []
+		_grid_version += 1
+		grid_cells_changed.emit(_grid_version, cells, module_ids)
+	# The full copy is only built for listeners that still want it.
+	if not grid_updated.get_connections().is_empty():
+		grid_updated.emit(get_grid())
 
 func _emit_loadout() -> void:
+	if _batch_depth > 0:
+		_batch_flags |= BATCH_LOADOUT
+		return
+	if loadout_changed.get_connections().is_empty():
+		return
 	var loadout := {
 		"total_burden": _total_burden,
 		"state": String(_burden_state),
@@ -268,9 +599,59 @@ func _emit_all() -> void:
 	_emit_inventory()
 	_emit_grid()
 	_emit_loadout()
+	if _batch_depth > 0:
+		_batch_flags |= BATCH_BURDEN
+		return
 	burden_changed.emit(_total_burden, _burden_state)
 
+func _flush_batch() -> void:
+	var flags := _batch_flags
+	var burden_delta := _batch_burden_delta
+	var bindings := _batch_bindings
+	_batch_flags = 0
+	_batch_burden_delta = 0
+	_batch_bindings = []
+	if flags & BATCH_INVENTORY:
+		_emit_inventory()
+	if flags & BATCH_GRID:
+		_emit_grid()
+	if flags & BATCH_LOADOUT:
+		_emit_loadout()
+	for module_id in bindings:
+		if _installed.has(module_id):
+			_emit_slot_bindings(module_id)
+	if flags & BATCH_BURDEN:
+		burden_changed.emit(_total_burden, _burden_state)
+		if burden_delta != 0:
+			_record_telemetry("matrix_burden_changed", {
+				"total": _total_burden,
+				"state": String(_burden_state),
+				"delta": burden_delta,
+			})
+
+## Returns the cached offsets for an already normalized rotation. The array is
+## shared; callers must not modify it.
 func _get_rotated_mask(module: EquipmentModuleResource, rotation: int) -> Array[Vector2i]:
+	if not _mask_cells.has(module.module_id):
+		_cache_module_masks(module)
+	return _mask_cells[module.module_id][rotation / 90]
+
+func _cache_module_masks(module: EquipmentModuleResource) -> void:
+	var cells: Array = []
+	var rows: Array = []
+	var extents := PackedInt32Array()
+	for rotation in ROTATIONS:
+		var offsets := _compute_rotated_mask(module, rotation)
+		var extent := _footprint_extent(offsets)
+		cells.append(offsets)
+		rows.append(_build_footprint_rows(offsets))
+		extents.append(extent.x)
+		extents.append(extent.y)
+	_mask_cells[module.module_id] = cells
+	_mask_rows[module.module_id] = rows
+	_mask_extents[module.module_id] = extents
+
+func _compute_rotated_mask(module: EquipmentModuleResource, rotation: int) -> Array[Vector2i]:
 	var base_mask := module.get_mask()
 	var rotated: Array[Vector2i] = []
 	for cell in base_mask:
@@ -278,6 +659,194 @@ func _get_rotated_mask(module: EquipmentModuleResource, rotation: int) -> Array[
 		rotated.append(rotated_cell)
 	return _normalize_mask(rotated)
 
+## Packs normalized offsets into one bitmask per footprint row.
+func _build_footprint_rows(offsets: Array[Vector2i]) -> PackedInt64Array:
+	var rows := PackedInt64Array()
+	rows.resize(_footprint_extent(offsets).y)
+	for offset in offsets:
+		rows[offset.y] |= 1 << offset.x
+	return rows
+
+func _footprint_extent(offsets: Array[Vector2i]) -> Vector2i:
+	var extent := Vector2i.ZERO
+	for offset in offsets:
+		extent.x = max(extent.x, offset.x + 1)
+		extent.y = max(extent.y, offset.y + 1)
+	return extent
+
+func _footprint_fits(rows: PackedInt64Array, extent: Vector2i, origin: Vector2i) -> bool:
+	return _footprint_fits_on(_row_bits, rows, extent, origin)
+
+func _footprint_fits_on(board: PackedInt64Array, rows: PackedInt64Array, extent: Vector2i, origin: Vector2i) -> bool:
+	if origin.x < 0 or origin.y < 0:
+		return false
+	if origin.x + extent.x > _grid_width or origin.y + extent.y > _grid_height:
+		return false
+	for row in rows.size():
+		if (board[origin.y + row] & (rows[row] << origin.x)) != 0:
+			return false
+	return true
+
+func _stamp_footprint(board: PackedInt64Array, module_id: StringName, placement: Vector3i, occupied: bool) -> PackedInt64Array:
+	var rows: PackedInt64Array = _mask_rows[module_id][placement.z / 90]
+	for row in rows.size():
+		var bits := rows[row] << placement.x
+		if occupied:
+			board[placement.y + row] |= bits
+		else:
+			board[placement.y + row] &= ~bits
+	return board
+
+## Valid placements on board as Vector3i(x, y, rotation), best contact first.
+## Rotations that are locked or repeat an earlier footprint are skipped.
+func _collect_candidates(module_id: StringName, board: PackedInt64Array, limit: int) -> Array[Vector3i]:
+	var module: EquipmentModuleResource = _catalog[module_id]
+	_get_rotated_mask(module, 0)
+	var extents: PackedInt32Array = _mask_extents[module_id]
+	var seen: Array[PackedInt64Array] = []
+	var scored: Array[Vector4i] = []
+	for rotation in ROTATIONS:
+		if rotation != 0 and not _config.can_rotate(module_id):
+			break
+		var rotation_index := rotation / 90
+		var rows: PackedInt64Array = _mask_rows[module_id][rotation_index]
+		if seen.has(rows):
+			continue
+		seen.append(rows)
+		var extent := Vector2i(extents[rotation_index * 2], extents[rotation_index * 2 + 1])
+		for y in range(0, _grid_height - extent.y + 1):
+			for x in range(0, _grid_width - extent.x + 1):
+				var origin := Vector2i(x, y)
+				if _footprint_fits_on(board, rows, extent, origin):
+					var contact := _count_contact(board, _mask_cells[module_id][rotation_index], origin)
+					scored.append(Vector4i(x, y, rotation, contact))
+	scored.sort_custom(func(a: Vector4i, b: Vector4i) -> bool:
+		if a.w != b.w:
+			return a.w > b.w
+		if a.y != b.y:
+			return a.y < b.y
+		if a.x != b.x:
+			return a.x < b.x
+		return a.z < b.z
+	)
+	var candidates: Array[Vector3i] = []
+	for entry in scored:
+		if candidates.size() >= limit:
+			break
+		candidates.append(Vector3i(entry.x, entry.y, entry.z))
+	return candidates
+
+func _count_contact(board: PackedInt64Array, offsets: Array[Vector2i], origin: Vector2i) -> int:
+	var contact := 0
+	for offset in offsets:
+		var cell := origin + offset
+		for neighbor in NEIGHBOR_OFFSETS:
+			var probe := cell + neighbor
+			if not _is_cell_inside(probe) or ((board[probe.y] >> probe.x) & 1) == 1:
+				contact += 1
+	return contact
+
+## One unit of depth-first search. Returns true when the search is exhausted
+## or every module has been placed.
+func _advance_arrange(job: ArrangeJob) -> bool:
+	var depth := job.candidates.size()
+	if depth == job.module_ids.size():
+		if job.placed_cells > job.best_cells:
+			job.best_cells = job.placed_cells
+			job.best = job.applied.duplicate()
+		if job.placed_cells == job.remaining_cells[0]:
+			return true
+		return _next_arrange_branch(job)
+	if job.placed_cells + job.remaining_cells[depth] <= job.best_cells:
+		return _next_arrange_branch(job)
+	var module_id := job.module_ids[depth]
+	var candidates: Array[Vector3i] = []
+	var burden: int = _catalog[module_id].burden
+	if _evaluate_burden_state(job.burden + burden) != &"critical":
+		candidates = _collect_candidates(module_id, job.board, ARRANGE_BRANCH_LIMIT)
+	job.candidates.append(candidates)
+	job.cursors.append(0)
+	job.applied.append(Vector3i(-1, -1, -1))
+	return _next_arrange_branch(job)
+
+## Replaces the deepest applied placement with its next alternative. Leaving
+## the module out is the last alternative before backtracking a level.
+func _next_arrange_branch(job: ArrangeJob) -> bool:
+	while not job.candidates.is_empty():
+		var depth := job.candidates.size() - 1
+		var module_id := job.module_ids[depth]
+		var module: EquipmentModuleResource = _catalog[module_id]
+		var previous := job.applied[depth]
+		if previous.x >= 0:
+			job.board = _stamp_footprint(job.board, module_id, previous, false)
+			job.burden -= module.burden
+			job.placed_cells -= job.cell_counts[depth]
+		var candidates: Array[Vector3i] = job.candidates[depth]
+		var cursor := job.cursors[depth]
+		if cursor < candidates.size():
+			var placement := candidates[cursor]
+			job.board = _stamp_footprint(job.board, module_id, placement, true)
+			job.burden += module.burden
+			job.placed_cells += job.cell_counts[depth]
+			job.applied[depth] = placement
+			job.cursors[depth] = cursor + 1
+			return false
+		if cursor == candidates.size():
+			job.applied[depth] = Vector3i(-1, -1, -1)
+			job.cursors[depth] = cursor + 1
+			return false
+		job.candidates.pop_back()
+		job.cursors.resize(depth)
+		job.applied.pop_back()
+	return true
+
+func _finish_auto_arrange(job: ArrangeJob) -> void:
+	_arrange_job = null
+	set_process(false)
+	var placements: Array[Dictionary] = []
+	var unplaced: Array[StringName] = []
+	begin_batch()
+	for index in job.module_ids.size():
+		var module_id := job.module_ids[index]
+		var placement := job.best[index] if index < job.best.size() else Vector3i(-1, -1, -1)
+		# The grid may have changed while the search ran; place_item re-validates.
+		if placement.x >= 0 and place_item(module_id, Vector2i(placement.x, placement.y), placement.z):
+			placements.append({
+				"id": module_id,
+				"origin": Vector2i(placement.x, placement.y),
+				"rotation": placement.z,
+			})
+		else:
+			unplaced.append(module_id)
+	commit()
+	auto_arrange_finished.emit(placements, unplaced)
+
+func _occupy_cell(cell: Vector2i, module_id: StringName) -> void:
+	if not _is_cell_inside(cell):
+		return
+	_row_bits[cell.y] |= 1 << cell.x
+	_placement_maps.clear()
+	_pending_cells.append(cell)
+	_pending_modules.append(module_id)
+	_cell_modules[cell.y * _grid_width + cell.x] = _get_module_slot(module_id)
+
+func _vacate_cell(cell: Vector2i) -> void:
+	if not _is_cell_inside(cell):
+		return
+	_row_bits[cell.y] &= ~(1 << cell.x)
+	_placement_maps.clear()
+	_pending_cells.append(cell)
+	_pending_modules.append(&"")
+	_cell_modules[cell.y * _grid_width + cell.x] = EMPTY_CELL
+
+func _get_module_slot(module_id: StringName) -> int:
+	if _module_slots.has(module_id):
+		return _module_slots[module_id]
+	var slot := _module_ids.size()
+	_module_ids.append(module_id)
+	_module_slots[module_id] = slot
+	return slot
+
 func _normalize_mask(mask: Array[Vector2i]) -> Array[Vector2i]:
 	if mask.is_empty():
 		return mask
@@ -305,12 +874,28 @@ func _rotate_cell(cell: Vector2i, rotation: int) -> Vector2i:
 func _is_cell_inside(cell: Vector2i) -> bool:
 	return cell.x >= 0 and cell.x < _grid_width and cell.y >= 0 and cell.y < _grid_height
 
+func _add_to_carry(module_id: StringName, count: int) -> void:
+	if not _carry_counts.has(module_id):
+		_carry_handles[module_id] = _next_carry_handle
+		_next_carry_handle += 1
+	_carry_counts[module_id] = _carry_counts.get(module_id, 0) + count
+	_carry_view_dirty = true
+
 func _remove_from_carry(module_id: StringName) -> void:
-	for index in _carry.size():
-		var entry: Dictionary = _carry[index]
-		if _normalize_module_id(entry.get("id", "")) == module_id:
-			_carry.remove_at(index)
-			return
+	var count: int = _carry_counts.get(module_id, 0)
+	if count <= 0:
+		return
+	if count == 1:
+		_carry_counts.erase(module_id)
+		_carry_handles.erase(module_id)
+	else:
+		_carry_counts[module_id] = count - 1
+	_carry_view_dirty = true
+
+func _clear_carry() -> void:
+	_carry_counts.clear()
+	_carry_handles.clear()
+	_carry_view_dirty = true
 
 func _normalize_rotation(rotation: int) -> int:
 	var normalized: int = abs(rotation) % 360
@@ -346,25 +931,61 @@ func _load_config() -> void:
 	else:
 		_config = EquipmentMatrixConfig.new()
 
-func _load_catalog() -> void:
+## Re-reads the catalog index and drops loaded modules and their mask cache,
+## so edited module files are picked up on next use.
+func reload_catalog() -> void:
+	_load_catalog(ResourceLoader.CACHE_MODE_REPLACE)
+
+## Only the index is read at boot. Without a generated index the modules
+## directory is scanned instead.
+func _load_catalog(cache_mode: ResourceLoader.CacheMode = ResourceLoader.CACHE_MODE_REUSE) -> void:
+	for module in _catalog.values():
+		if module.changed.is_connected(_invalidate_mask_cache):
+			module.changed.disconnect(_invalidate_mask_cache)
 	_catalog.clear()
-	var dir := DirAccess.open(modules_path)
-	if dir == null:
-		return
-	dir.list_dir_begin()
-	while true:
-		var entry := dir.get_next()
-		if entry == "":
-			break
-		if dir.current_is_dir():
-			continue
-		if not (entry.ends_with(".tres") or entry.ends_with(".res")):
-			continue
-		var resource := load("%s/%s" % [modules_path, entry])
-		if resource is EquipmentModuleResource:
-			var module: EquipmentModuleResource = resource
-			_catalog[module.module_id] = module
-	dir.list_dir_end()
+	_pending_loads.clear()
+	_invalidate_mask_cache()
+	_module_cache_mode = cache_mode
+	var resource: Resource = null
+	if ResourceLoader.exists(catalog_index_path):
+		resource = ResourceLoader.load(catalog_index_path, "", cache_mode)
+	if resource is EquipmentCatalogIndex:
+		_catalog_index = resource
+	else:
+		_catalog_index = EquipmentCatalogIndex.build_from_directory(modules_path)
+	_loot_index = null
+	if ResourceLoader.exists(loot_index_path):
+		_loot_index = ResourceLoader.load(loot_index_path, "", cache_mode) as LootLookupIndex
+
+func _get_module(module_id: StringName) -> EquipmentModuleResource:
+	var module: EquipmentModuleResource = _catalog.get(module_id, null)
+	if module != null:
+		return module
+	var index := _catalog_index.find(module_id)
+	if index < 0:
+		return null
+	var path := _catalog_index.resource_paths[index]
+	var resource: Resource = null
+	if _pending_loads.has(module_id):
+		_pending_loads.erase(module_id)
+		resource = ResourceLoader.load_threaded_get(path)
+	else:
+		resource = ResourceLoader.load(path, "", _module_cache_mode)
+	if not resource is EquipmentModuleResource:
+		return null
+	module = resource
+	_catalog[module_id] = module
+	_cache_module_masks(module)
+	if not module.changed.is_connected(_invalidate_mask_cache):
+		module.changed.connect(_invalidate_mask_cache)
+	return module
+
+## Edited module resources rebuild their masks on the next lookup.
+func _invalidate_mask_cache() -> void:
+	_placement_maps.clear()
+	_mask_cells.clear()
+	_mask_rows.clear()
+	_mask_extents.clear()
 
 func _record_telemetry(event_name: String, payload: Dictionary) -> void:
 	if _telemetry_hub == null or not is_instance_valid(_telemetry_hub):
@@ -373,15 +994,9 @@ func _record_telemetry(event_name: String, payload: Dictionary) -> void:
 		_telemetry_hub.call("record", event_name, payload.duplicate(true))
 
 func _resolve_node(node_name: StringName) -> Node:
-	if get_tree() == null:
-		return null
-	var root := get_tree().get_root()
-	if root == null:
+	if not is_inside_tree():
 		return null
-	var path := NodePath(String(node_name))
-	if root.has_node(path):
-		return root.get_node(path)
-	return null
+	return ServiceRegistry.get_service(node_name)
 
 func _normalize_module_id(module_id: Variant) -> StringName:
 	return StringName(module_id)
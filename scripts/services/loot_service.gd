@@ -2,52 +2,67 @@ extends Node
 
 signal loot_awarded(loot: Dictionary)
 
-const RARITY_TABLE: Dictionary = {
-	"common": ["ion_blaster", "oxygen_siphon"],
-	"uncommon": ["seeker_array"]
-}
-
-const ROOM_TAG_LOOT: Dictionary = {
-	"cache": ["ion_blaster", "oxygen_siphon"],
-	"clue": ["seeker_array"],
-	"materials": ["ion_blaster"],
-	"resource_gain": ["oxygen_siphon"]
-}
+@export var lookup_index_path: String = "res://resources/config/loot_lookup_index.tres"
+## Compiled at runtime when no lookup index has been generated.
+@export var loot_table_path: String = "res://resources/loot/default_loot_table.tres"
 
 var _rng := RandomNumberGenerator.new()
+# Shared with EquipmentInventoryModel through the resource cache.
+var _index: LootLookupIndex = LootLookupIndex.new()
+var _table: LootTableDefinition = null
 
 func _ready() -> void:
-	_rng.randomize()
+	var rng_service := ServiceRegistry.get_rng_service()
+	if rng_service:
+		_rng = rng_service.get_stream(&"loot")
+	else:
+		_rng.randomize()
+	_load_index()
+
+## Replaces the loot definitions, e.g. for modded tables, and recompiles the
+## lookup. Later edits to the table recompile it again.
+func set_loot_table(table: LootTableDefinition) -> void:
+	_watch_table(table)
+	_compile_table()
+
+func get_lookup_index() -> LootLookupIndex:
+	return _index
 
 func roll_loot_for_room(room: Dictionary) -> Dictionary:
-	var tags: Array = room.get("tags", []) as Array
-	var candidates: Array[String] = []
-	for tag in tags:
-		var items: Array = ROOM_TAG_LOOT.get(tag, []) as Array
-		for item in items:
-			if item is String and not candidates.has(item):
-				candidates.append(item)
-	if candidates.is_empty():
-		for pool_variant in RARITY_TABLE.values():
-			var pool: Array = pool_variant as Array
-			for item in pool:
-				if item is String and not candidates.has(item):
-					candidates.append(item)
-	if candidates.is_empty():
+	var table := _index.get_table(_index.get_tag_mask(room.get("tags", []) as Array))
+	var item := table.sample(_rng)
+	if item < 0:
 		return {}
-	var choice: String = candidates[_rng.randi_range(0, candidates.size() - 1)]
-	var rarity := _find_rarity(choice)
 	var loot := {
-		"id": choice,
-		"rarity": rarity,
+		"id": String(_index.item_ids[item]),
+		"rarity": _index.item_rarities[item],
 		"source_room": room.get("id", "")
 	}
 	loot_awarded.emit(loot)
 	return loot
 
-func _find_rarity(item_id: String) -> String:
-	for rarity in RARITY_TABLE.keys():
-		var pool := RARITY_TABLE[rarity] as Array
-		if pool.has(item_id):
-			return rarity
-	return "unknown"
+func get_rarity(item_id: String) -> String:
+	return String(_index.get_rarity(StringName(item_id)))
+
+func _load_index() -> void:
+	if ResourceLoader.exists(lookup_index_path):
+		var index := load(lookup_index_path) as LootLookupIndex
+		if index != null:
+			_index = index
+			return
+	if ResourceLoader.exists(loot_table_path):
+		_watch_table(load(loot_table_path) as LootTableDefinition)
+		_compile_table()
+
+func _watch_table(table: LootTableDefinition) -> void:
+	if _table != null and _table.changed.is_connected(_compile_table):
+		_table.changed.disconnect(_compile_table)
+	_table = table
+	if _table != null:
+		_table.changed.connect(_compile_table)
+
+func _compile_table() -> void:
+	if _table == null:
+		_index = LootLookupIndex.new()
+		return
+	_index = LootLookupIndex.compile(_table)
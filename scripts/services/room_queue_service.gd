@@ -5,122 +5,321 @@ signal room_entered(room: Dictionary)
 signal room_cycled(room: Dictionary)
 
 const QUEUE_SIZE: int = 3
+## Profiles that track the ledger's threat state. Any other profile was picked
+## by hand and survives resets.
+const THREAT_PROFILES: Array[StringName] = [&"normal", &"warning", &"critical"]
 
-const ROOM_DECK: Array[Dictionary] = [
-	{"id": "medbay_antechamber", "name": "Medbay Antechamber", "tags": ["sanctuary", "hazard_low"], "threat": "lurking_stalker", "summary": "Salvage oxygen tanks while a stalker circles the vents.", "clue_reward": 0, "materials_reward": 2, "oxygen_cost": 1},
-	{"id": "reactor_cooling", "name": "Reactor Cooling Hub", "tags": ["hazard_high", "materials"], "threat": "thermal_overload", "summary": "Stabilize leaking coolant before heat signatures spike.", "clue_reward": 1, "materials_reward": 3, "oxygen_cost": 2},
-	{"id": "cargo_hall", "name": "Collapsed Cargo Hall", "tags": ["cache", "threat_spawn"], "threat": "nesting_chitter", "summary": "Pick through wreckage for parts while larvae hatch nearby.", "clue_reward": 0, "materials_reward": 3, "oxygen_cost": 1},
-	{"id": "observation_dome", "name": "Observation Dome", "tags": ["clue", "anomaly"], "threat": "whispering_signal", "summary": "Decode spectral readings to triangulate the escape vector.", "clue_reward": 2, "materials_reward": 1, "oxygen_cost": 1},
-	{"id": "hydroponics_sprawl", "name": "Hydroponics Sprawl", "tags": ["sanctuary", "resource_gain"], "threat": "spore_bloom", "summary": "Harvest bio-gel while mutagenic spores thicken the air.", "clue_reward": 0, "materials_reward": 2, "oxygen_cost": 0},
-	{"id": "hangar_spindle", "name": "Hangar Spindle", "tags": ["escape", "materials"], "threat": "siren_drones", "summary": "Scavenge power couplings under the gaze of corrupted drones.", "clue_reward": 2, "materials_reward": 2, "oxygen_cost": 2},
-	{"id": "drift_vault", "name": "Drift Vault", "tags": ["cache", "clue"], "threat": "gravity_ghost", "summary": "Navigate zero-g vault to secure encoded data caches.", "clue_reward": 1, "materials_reward": 2, "oxygen_cost": 1},
-	{"id": "waste_processing", "name": "Waste Processing Sump", "tags": ["hazard_low", "materials"], "threat": "acidic_sludge", "summary": "Extract salvage amid corrosive runoff and compromised filters.", "clue_reward": 0, "materials_reward": 3, "oxygen_cost": 1},
-	{"id": "signal_array", "name": "Signal Array Nexus", "tags": ["clue", "anomaly"], "threat": "resonant_feedback", "summary": "Calibrate antennae to triangulate exit route before resonance spikes.", "clue_reward": 2, "materials_reward": 0, "oxygen_cost": 2},
-	{"id": "crew_quarters", "name": "Abandoned Crew Quarters", "tags": ["sanctuary", "cache"], "threat": "phantom_echo", "summary": "Search personal lockers while echoing memories destabilize resolve.", "clue_reward": 1, "materials_reward": 1, "oxygen_cost": 0},
-	{"id": "hull_breach", "name": "Exterior Hull Breach", "tags": ["hazard_high", "materials"], "threat": "vacuum_surge", "summary": "Brace against decompression to weld plates over hull fissure.", "clue_reward": 0, "materials_reward": 3, "oxygen_cost": 2},
-	{"id": "engine_spire", "name": "Engine Spire", "tags": ["escape", "hazard_high"], "threat": "overclocked_core", "summary": "Tame the screaming core before it surges and melts the deck plating.", "clue_reward": 2, "materials_reward": 3, "oxygen_cost": 3},
-	{"id": "maintenance_tunnels", "name": "Maintenance Tunnels", "tags": ["hazard_low", "clue"], "threat": "tracking_nanite_swarm", "summary": "Lay decoys and jam signals to shake a rogue nanite swarm.", "clue_reward": 1, "materials_reward": 1, "oxygen_cost": 1},
-	{"id": "observation_quarantine", "name": "Observation Quarantine", "tags": ["hazard_med", "resource_gain"], "threat": "containment_failure", "summary": "Divert power to hold back mutated specimens while scavenging supplies.", "clue_reward": 1, "materials_reward": 2, "oxygen_cost": 1},
-	{"id": "cryonics_bay", "name": "Cryonics Bay", "tags": ["sanctuary", "resource_gain"], "threat": "frostbite_specter", "summary": "Thaw cryo pods carefully to secure med-gel caches under time pressure.", "clue_reward": 0, "materials_reward": 2, "oxygen_cost": 1},
-	{"id": "biodome_ruins", "name": "Biodome Ruins", "tags": ["anomaly", "clue"], "threat": "feral_growth", "summary": "Decode growth patterns while carnivorous flora shadows the trail.", "clue_reward": 2, "materials_reward": 1, "oxygen_cost": 1},
-	{"id": "communications_core", "name": "Communications Core", "tags": ["clue", "threat_spawn"], "threat": "signal_intruder", "summary": "Scrub corrupted protocols to reclaim long-range contact.", "clue_reward": 2, "materials_reward": 1, "oxygen_cost": 2},
-	{"id": "life_support_hub", "name": "Life Support Hub", "tags": ["resource_gain", "sanctuary"], "threat": "oxygen_syphon", "summary": "Divert spare filters while a siphon threat drains reserves.", "clue_reward": 0, "materials_reward": 2, "oxygen_cost": 0},
-	{"id": "gravity_lab", "name": "Gravity Research Lab", "tags": ["anomaly", "hazard_med"], "threat": "quantum_maw", "summary": "Stabilize fields to recover gravity cores before collapse.", "clue_reward": 1, "materials_reward": 2, "oxygen_cost": 2},
-	{"id": "archives", "name": "Data Archives", "tags": ["clue", "cache"], "threat": "data_wraith", "summary": "Decrypt logs to uncover escape coordinates guarded by a wraith.", "clue_reward": 2, "materials_reward": 1, "oxygen_cost": 1},
-	{"id": "docking_ring", "name": "Docking Ring", "tags": ["escape", "hazard_med"], "threat": "boarding_seraphs", "summary": "Secure the docking umbilicals while spectral boarders push through.", "clue_reward": 2, "materials_reward": 2, "oxygen_cost": 2},
-	{"id": "armory_cache", "name": "Armory Cache", "tags": ["materials", "cache"], "threat": "supply_wraith", "summary": "Bypass locked containment to salvage armaments before the wraith consumes inventory.", "clue_reward": 0, "materials_reward": 4, "oxygen_cost": 1},
-	{"id": "sensor_blindspot", "name": "Sensor Blindspot", "tags": ["anomaly", "hazard_low"], "threat": "latent_voidling", "summary": "Map the blindspot to re-align sensors and flush out void anomalies.", "clue_reward": 1, "materials_reward": 0, "oxygen_cost": 1},
-	{"id": "worship_chamber", "name": "Derelict Worship Chamber", "tags": ["lore", "clue"], "threat": "psionic_echo", "summary": "Piece together cult rituals to learn how they navigated the sector.", "clue_reward": 2, "materials_reward": 0, "oxygen_cost": 1},
-	{"id": "transport_spine", "name": "Transport Spine", "tags": ["hazard_med", "materials"], "threat": "tram_cannibal", "summary": "Reactivate tram power without giving away position to marauders.", "clue_reward": 0, "materials_reward": 3, "oxygen_cost": 1},
-	{"id": "slipspace_observatory", "name": "Slipspace Observatory", "tags": ["clue", "anomaly"], "threat": "rift_apparition", "summary": "Chart slipspace currents while apparitions claw through reality.", "clue_reward": 3, "materials_reward": 0, "oxygen_cost": 2},
-	{"id": "maintenance_bay", "name": "Maintenance Bay 12", "tags": ["cache", "resource_gain"], "threat": "rogue_loader", "summary": "Disable an out-of-control loader to salvage fuel cells.", "clue_reward": 0, "materials_reward": 3, "oxygen_cost": 1},
-	{"id": "bioscan_corridor", "name": "Bioscan Corridor", "tags": ["hazard_low", "clue"], "threat": "sporelock", "summary": "Bypass bioscan locks while spores threaten to seal doors permanently.", "clue_reward": 1, "materials_reward": 1, "oxygen_cost": 1},
-	{"id": "refinery_overlook", "name": "Refinery Overlook", "tags": ["materials", "hazard_med"], "threat": "pressure_djinn", "summary": "Relieve pressure valves to harvest rare alloys before the djinn breaches containment.", "clue_reward": 0, "materials_reward": 4, "oxygen_cost": 2},
-	{"id": "echoing_drift", "name": "Echoing Drift", "tags": ["anomaly", "lore"], "threat": "temporal_murmur", "summary": "Listen to time-warped transmissions for secrets to the sector.", "clue_reward": 1, "materials_reward": 0, "oxygen_cost": 1},
-	{"id": "arboretum_heart", "name": "Arboretum Heart", "tags": ["resource_gain", "anomaly"], "threat": "sentient_vines", "summary": "Appease sentient vines to harvest bio-energy safely.", "clue_reward": 0, "materials_reward": 2, "oxygen_cost": 1}
-]
-
-var _default_deck: Array[Dictionary] = []
-var _deck: Array[Dictionary] = []
-var _discard: Array[Dictionary] = []
+const ROOMS_PATH := "res://resources/rooms"
+
+@export var deck_index_path: String = "res://resources/config/room_deck_index.tres"
+@export var deck_rules_path: String = "res://resources/config/room_deck_rules.tres"
+
+# Rooms are shared read-only records; the deck is a shuffled order of indices
+# into the table, consumed front to back by a cursor. Table records come from
+# the deck index and lack summary and art; the full RoomDefinition is loaded
+# on a background thread when a room enters the queue and replaces the
+# record in its slot, so only queued rooms are ever fully resident.
+var _room_table: Array[Dictionary] = []
+var _room_paths: PackedStringArray = PackedStringArray()
+var _deck_order: PackedInt32Array = PackedInt32Array()
+var _deck_cursor: int = 0
 var _queue: Array[Dictionary] = []
+var _queue_indices: PackedInt32Array = PackedInt32Array()
+var _pending_loads: Dictionary[int, String] = {}
 var _rng := RandomNumberGenerator.new()
 
+# Weighted mode draws without replacement from the rooms still flagged in
+# _in_deck. Alias tables are built per weight profile over the rooms in the
+# deck and only rebuilt once half their weight has been drawn; until then
+# draws of already-dealt rooms are rejected and redrawn.
+var _rules: RoomDeckRules = null
+var _weight_profile: StringName = &"normal"
+var _room_weights: Dictionary[StringName, PackedFloat32Array] = {}
+var _alias_tables: Dictionary[StringName, AliasTable] = {}
+var _in_deck: PackedByteArray = PackedByteArray()
+var _in_deck_count: int = 0
+
 func _ready() -> void:
-	_rng.randomize()
+	var rng_service := ServiceRegistry.get_rng_service()
+	if rng_service:
+		_rng = rng_service.get_stream(&"room_queue")
+	else:
+		_rng.randomize()
+	_load_rules()
+	var ledger := ServiceRegistry.get_resource_ledger()
+	if ledger:
+		ledger.threat_threshold_crossed.connect(_on_threat_threshold_crossed)
+	set_process(false)
 	_initialize_default_deck()
 	reset(true)
 
+func _process(_delta: float) -> void:
+	var updated := false
+	for index in _pending_loads.keys():
+		var status := ResourceLoader.load_threaded_get_status(_pending_loads[index])
+		if status == ResourceLoader.THREAD_LOAD_IN_PROGRESS:
+			continue
+		if _finish_room_load(index):
+			updated = true
+	if _pending_loads.is_empty():
+		set_process(false)
+	if updated:
+		queue_updated.emit(_queue_snapshot())
+
 func reset(force_shuffle: bool = false) -> void:
-	if force_shuffle or _deck.is_empty():
+	if force_shuffle or _deck_order.is_empty():
 		_reset_deck_from_default()
 	_queue.clear()
+	_queue_indices.clear()
+	_sync_threat_profile()
 	for _i in QUEUE_SIZE:
-		_queue.append(_draw_room())
+		_enqueue_room(_draw_room_index())
 	queue_updated.emit(_queue_snapshot())
 
+## Replaces the room table, e.g. with a modded deck, and reshuffles. Rooms are
+## made read-only because draws hand out the same records. Rooms given here
+## are complete and never streamed.
+func set_room_table(rooms: Array[Dictionary]) -> void:
+	_load_room_table(rooms)
+	reset(true)
+
+## True while a queued room is still waiting for its full definition.
+func is_loading() -> bool:
+	return not _pending_loads.is_empty()
+
+## Switches the draw weights, e.g. toward hazards as threat rises. Tables are
+## cached per profile, so switching back and forth does not rebuild them.
+func set_weight_profile(profile: StringName) -> void:
+	if _rules and _rules.has_profile(profile):
+		_weight_profile = profile
+
+func get_weight_profile() -> StringName:
+	return _weight_profile
+
+func set_profile_weights(profile: StringName, weights: Dictionary) -> void:
+	if _rules == null:
+		_rules = RoomDeckRules.new()
+		_rules.changed.connect(_on_rules_changed)
+	_rules.set_profile(profile, weights)
+
 func get_queue() -> Array[Dictionary]:
 	return _queue_snapshot()
 
+## Waits for the top room's definition if it is still loading, so the room
+## returned here and by draw_next_room() is complete.
 func peek_next_room() -> Dictionary:
 	if _queue.is_empty():
 		return {}
-	return _queue[0].duplicate(true)
+	_resolve_slot(0)
+	return _queue[0]
 
 func draw_next_room() -> Dictionary:
-	if _queue.is_empty():
-		return {}
-	var room: Dictionary = _queue[0]
-	_queue.remove_at(0)
-	_queue.append(_draw_room())
+	var room := _pop_top_room()
+	if room.is_empty():
+		return room
 	queue_updated.emit(_queue_snapshot())
-	var emitted: Dictionary = room.duplicate(true)
-	room_entered.emit(emitted)
-	return emitted
+	room_entered.emit(room)
+	return room
 
 func cycle_top_room() -> Dictionary:
-	if _queue.is_empty():
-		return {}
-	var room: Dictionary = _queue[0]
-	_queue.remove_at(0)
-	_queue.append(_draw_room())
+	var room := _pop_top_room()
+	if room.is_empty():
+		return room
 	queue_updated.emit(_queue_snapshot())
-	var emitted: Dictionary = room.duplicate(true)
-	room_cycled.emit(emitted)
-	return emitted
+	room_cycled.emit(room)
+	return room
 
 func discard_room(room_id: String) -> void:
 	for index in _queue.size():
 		var room: Dictionary = _queue[index]
 		if room.get("id", "") == room_id:
 			_queue.remove_at(index)
+			_queue_indices.remove_at(index)
 			queue_updated.emit(_queue_snapshot())
 			return
 
-func _draw_room() -> Dictionary:
-	if _deck.is_empty():
-		_reset_deck_from_default()
-	if _deck.is_empty():
+func _pop_top_room() -> Dictionary:
+	if _queue.is_empty():
 		return {}
-	var index: int = _rng.randi_range(0, _deck.size() - 1)
-	var room: Dictionary = _deck[index]
-	_deck.remove_at(index)
-	_discard.append(room)
-	return room.duplicate(true)
+	_resolve_slot(0)
+	var room: Dictionary = _queue[0]
+	_queue.remove_at(0)
+	_queue_indices.remove_at(0)
+	_enqueue_room(_draw_room_index())
+	return room
+
+func _enqueue_room(index: int) -> void:
+	_queue_indices.append(index)
+	if index < 0:
+		_queue.append({})
+		return
+	_queue.append(_room_table[index])
+	var path := _room_paths[index]
+	if path.is_empty() or _pending_loads.has(index):
+		return
+	if ResourceLoader.load_threaded_request(path) == OK:
+		_pending_loads[index] = path
+		set_process(true)
+
+func _resolve_slot(slot: int) -> void:
+	var index := _queue_indices[slot]
+	if _pending_loads.has(index):
+		_finish_room_load(index)
+
+## Collects a requested definition, blocking if it is not done yet, and swaps
+## the full record into every queue slot still holding that room.
+func _finish_room_load(index: int) -> bool:
+	var path: String = _pending_loads[index]
+	_pending_loads.erase(index)
+	var definition := ResourceLoader.load_threaded_get(path) as RoomDefinition
+	if definition == null:
+		push_warning("RoomQueueService: failed to load room %s" % path)
+		return false
+	var record := _freeze_room(definition.to_record())
+	var applied := false
+	for slot in _queue_indices.size():
+		if _queue_indices[slot] == index:
+			_queue[slot] = record
+			applied = true
+	return applied
+
+func _draw_room_index() -> int:
+	if _deck_order.is_empty():
+		_reset_deck_from_default()
+	if _deck_order.is_empty():
+		return -1
+	if _rules and _rules.weighted_draws:
+		return _draw_weighted_index()
+	if _deck_cursor >= _deck_order.size():
+		_shuffle_deck()
+	var index := _deck_order[_deck_cursor]
+	_deck_cursor += 1
+	return index
 
 func _reset_deck_from_default() -> void:
-	if _default_deck.is_empty():
+	if _room_table.is_empty():
 		_initialize_default_deck()
-	_deck = _default_deck.duplicate(true)
-	_discard.clear()
+	_shuffle_deck()
+	_refill_weighted_deck()
+
+func _refill_weighted_deck() -> void:
+	_in_deck.resize(_room_table.size())
+	_in_deck.fill(1)
+	_in_deck_count = _room_table.size()
+	_alias_tables.clear()
+
+func _draw_weighted_index() -> int:
+	if _in_deck_count == 0:
+		_refill_weighted_deck()
+	var table := _get_alias_table(_weight_profile)
+	var index := table.sample(_rng)
+	while _in_deck[index] == 0:
+		index = table.sample(_rng)
+	_in_deck[index] = 0
+	_in_deck_count -= 1
+	for profile in _alias_tables:
+		var cached := _alias_tables[profile]
+		cached.removed_weight += 1.0 if cached.uniform else _get_room_weights(profile)[index]
+	return index
+
+func _get_alias_table(profile: StringName) -> AliasTable:
+	var table: AliasTable = _alias_tables.get(profile, null)
+	if table == null or table.removed_weight * 2.0 > table.total_weight:
+		table = _build_alias_table(profile)
+		_alias_tables[profile] = table
+	return table
 
+func _build_alias_table(profile: StringName) -> AliasTable:
+	var weights := _get_room_weights(profile)
+	var members := PackedInt32Array()
+	var member_weights := PackedFloat32Array()
+	for index in _room_table.size():
+		if _in_deck[index] == 1:
+			members.append(index)
+			member_weights.append(weights[index])
+	return AliasTable.build(members, member_weights)
+
+func _get_room_weights(profile: StringName) -> PackedFloat32Array:
+	if _room_weights.has(profile):
+		return _room_weights[profile]
+	var weights := PackedFloat32Array()
+	weights.resize(_room_table.size())
+	for index in _room_table.size():
+		weights[index] = _rules.get_room_weight(profile, _room_table[index].get("tags", []))
+	_room_weights[profile] = weights
+	return weights
+
+func _load_rules() -> void:
+	if ResourceLoader.exists(deck_rules_path):
+		_rules = load(deck_rules_path) as RoomDeckRules
+	if _rules and not _rules.changed.is_connected(_on_rules_changed):
+		_rules.changed.connect(_on_rules_changed)
+
+func _on_rules_changed() -> void:
+	_room_weights.clear()
+	_alias_tables.clear()
+
+func _on_threat_threshold_crossed(level: StringName) -> void:
+	set_weight_profile(level)
+
+# Crossings are only signalled on change, so a restart or a restored save
+# re-reads the current threat state instead of keeping the last profile.
+func _sync_threat_profile() -> void:
+	if not THREAT_PROFILES.has(_weight_profile):
+		return
+	var ledger := ServiceRegistry.get_resource_ledger()
+	var level: StringName = ledger.get_state(&"threat") if ledger else &"normal"
+	_weight_profile = level if _rules and _rules.has_profile(level) else &"normal"
+
+## Fisher-Yates over the existing index array; no allocation.
+func _shuffle_deck() -> void:
+	for index in range(_deck_order.size() - 1, 0, -1):
+		var swap_index: int = _rng.randi_range(0, index)
+		var held: int = _deck_order[index]
+		_deck_order[index] = _deck_order[swap_index]
+		_deck_order[swap_index] = held
+	_deck_cursor = 0
+
+## Only the index is read at boot. Without a generated index the rooms
+## directory is scanned instead.
 func _initialize_default_deck() -> void:
-	if not _default_deck.is_empty():
+	if not _room_table.is_empty():
 		return
-	_default_deck = ROOM_DECK.duplicate(true)
+	var index: RoomDeckIndex = null
+	if ResourceLoader.exists(deck_index_path):
+		index = load(deck_index_path) as RoomDeckIndex
+	if index == null:
+		index = RoomDeckIndex.build_from_directory(ROOMS_PATH)
+	var rooms: Array[Dictionary] = []
+	for room_index in index.size():
+		rooms.append(index.get_record(room_index))
+	_load_room_table(rooms, index.resource_paths)
+
+func _load_room_table(rooms: Array[Dictionary], paths: PackedStringArray = PackedStringArray()) -> void:
+	_room_table.clear()
+	for path in _pending_loads.values():
+		ResourceLoader.load_threaded_get(path)
+	_pending_loads.clear()
+	for room in rooms:
+		_room_table.append(_freeze_room(room))
+	_room_paths = paths
+	_room_paths.resize(_room_table.size())
+	_deck_order.resize(_room_table.size())
+	for index in _room_table.size():
+		_deck_order[index] = index
+	_deck_cursor = 0
+	_room_weights.clear()
+	_refill_weighted_deck()
+
+func _freeze_room(room: Dictionary) -> Dictionary:
+	if room.is_read_only():
+		return room
+	var record := room.duplicate(true)
+	for key in record.keys():
+		if record[key] is Array:
+			(record[key] as Array).make_read_only()
+	record.make_read_only()
+	return record
 
 func _queue_snapshot() -> Array[Dictionary]:
-	var snapshot: Array[Dictionary] = []
-	for room in _queue:
-		snapshot.append(room.duplicate(true))
-	return snapshot
+	return _queue.duplicate()
@@ -10,6 +10,7 @@ const ResourceSnapshot = preload("res://scripts/autoload/resource_snapshot.gd")
 signal snapshot_updated(snapshot: ResourceSnapshot)
 
 var _run_snapshot: ResourceSnapshot = null
+var _rng_state: Dictionary = {}
 
 func store_run_snapshot(snapshot: ResourceSnapshot) -> void:
 	if snapshot == null:
@@ -28,8 +29,22 @@ func has_run_snapshot() -> bool:
 
 func clear_run_snapshot() -> void:
 	_run_snapshot = null
+	_rng_state = {}
+
+## RNG stream state from RngService, saved alongside each run snapshot.
+func store_rng_state(state: Dictionary) -> void:
+	_rng_state = state.duplicate(true)
+
+func get_rng_state() -> Dictionary:
+	return _rng_state.duplicate(true)
+
+func has_rng_state() -> bool:
+	return not _rng_state.is_empty()
 
 func _copy_snapshot(snapshot: ResourceSnapshot) -> ResourceSnapshot:
+	var extras: Dictionary = {}
+	for key in snapshot.extra_resources.keys():
+		extras[key] = snapshot.extra_resources[key]
 	return ResourceSnapshot.new(
 		snapshot.health,
 		snapshot.max_health,
@@ -39,5 +54,6 @@ func _copy_snapshot(snapshot: ResourceSnapshot) -> ResourceSnapshot:
 		snapshot.max_oxygen,
 		snapshot.threat,
 		snapshot.max_threat,
-		snapshot.threshold_states.duplicate(true)
+		snapshot.threshold_states.duplicate(true),
+		extras
 	)
@@ -1,159 +1,279 @@
 extends Node
 
+## Full list, emitted at most once per frame and only while something is
+## connected. Prefer threats_changed.
 signal threats_updated(active_threats: Array[Dictionary])
+## Coalesced per frame: snapshots of threats latched or changed since the last
+## emission and ids of threats that left. Timers of unchanged threats follow
+## from turn: timer = next_attack_turn - turn - 1.
+signal threats_changed(turn: int, changed: Array[Dictionary], removed: PackedStringArray)
 signal threat_latched(threat: Dictionary)
 signal threat_cleared(threat: Dictionary)
 signal threat_attack_resolved(threat_id: String, attack: Dictionary)
 
-const THREAT_TEMPLATES: Dictionary = {
-	"lurking_stalker": {
-		"id": "lurking_stalker",
-		"name": "Lurking Stalker",
-		"timer": 2,
-		"severity": "moderate",
-		"attack_pattern": {"damage": 1, "threat_delta": 1, "cooldown": 2, "statuses": [{"id": "bleed", "label": "Bleed", "duration": 2}]},
-		"status_effects": []
-	},
-	"thermal_overload": {
-		"id": "thermal_overload",
-		"name": "Thermal Overload",
-		"timer": 1,
-		"severity": "critical",
-		"attack_pattern": {"damage": 2, "threat_delta": 2, "cooldown": 3, "statuses": [{"id": "heat_burn", "label": "Burn", "duration": 2}]},
-		"status_effects": []
-	},
-	"nesting_chitter": {
-		"id": "nesting_chitter",
-		"name": "Nesting Chitter",
-		"timer": 3,
-		"severity": "moderate",
-		"attack_pattern": {"damage": 1, "threat_delta": 1, "cooldown": 3, "statuses": [{"id": "dice_lock", "label": "Jam", "duration": 1}]},
-		"status_effects": []
-	},
-	"whispering_signal": {
-		"id": "whispering_signal",
-		"name": "Whispering Signal",
-		"timer": 2,
-		"severity": "high",
-		"attack_pattern": {"damage": 0, "threat_delta": 2, "cooldown": 2, "statuses": [{"id": "mind_fog", "label": "Mind Fog", "duration": 2}]},
-		"status_effects": []
-	},
-	"spore_bloom": {
-		"id": "spore_bloom",
-		"name": "Spore Bloom",
-		"timer": 3,
-		"severity": "moderate",
-		"attack_pattern": {"damage": 1, "threat_delta": 1, "cooldown": 3, "statuses": [{"id": "oxygen_leak", "label": "Oxygen Leak", "duration": 2}]},
-		"status_effects": []
-	},
-	"siren_drones": {
-		"id": "siren_drones",
-		"name": "Siren Drones",
-		"timer": 2,
-		"severity": "high",
-		"attack_pattern": {"damage": 1, "threat_delta": 2, "cooldown": 2, "statuses": [{"id": "sensor_jam", "label": "Sensor Jam", "duration": 1}]},
-		"status_effects": []
-	},
-	"signal_intruder": {
-		"id": "signal_intruder",
-		"name": "Signal Intruder",
-		"timer": 2,
-		"severity": "moderate",
-		"attack_pattern": {"damage": 1, "threat_delta": 1, "cooldown": 2, "statuses": [{"id": "stagger", "label": "Stagger", "duration": 1}]},
-		"status_effects": []
-	}
-}
+@export var templates_path: String = "res://resources/threats"
+
+## Per-threat mutable state. Everything else is read from the shared template.
+class ThreatInstance:
+	var id: String = ""
+	var template: ThreatTemplate = null
+	var attack_turn: int = 0
+	var cooldown: int = 1
+	var has_attacked: bool = false
+	var status_ids: PackedStringArray = PackedStringArray()
+	var status_labels: PackedStringArray = PackedStringArray()
+	var status_durations: PackedInt32Array = PackedInt32Array()
+
+	func add_status(status: Dictionary) -> void:
+		status_ids.append(String(status.get("id", "")))
+		status_labels.append(String(status.get("label", "Effect")))
+		status_durations.append(int(status.get("duration", 0)))
+
+	func remove_status(status_id: String) -> void:
+		for index in range(status_ids.size() - 1, -1, -1):
+			if status_ids[index] == status_id:
+				status_ids.remove_at(index)
+				status_labels.remove_at(index)
+				status_durations.remove_at(index)
 
-var _active_threats: Array[Dictionary] = []
+var _templates: Dictionary[StringName, ThreatTemplate] = {}
+
+# Threats live in slots addressed through _slots (id -> slot). Attack timing
+# is stored as the absolute turn of the next attack, and _attack_wheel buckets
+# threat ids by that turn so a tick only visits threats that are due. Wheel
+# entries are not removed when a threat is resolved or rescheduled; stale ones
+# are skipped when their bucket comes up.
+var _active_threats: Array[ThreatInstance] = []
+var _slots: Dictionary[String, int] = {}
+var _attack_wheel: Dictionary[int, PackedStringArray] = {}
+var _turn: int = 0
+var _latch_serial: int = 0
+# Changes are coalesced into one threats_changed per frame.
+var _changed_ids: Dictionary[String, bool] = {}
+var _removed_ids: PackedStringArray = PackedStringArray()
+var _update_scheduled: bool = false
+
+func _ready() -> void:
+	_load_templates()
 
 func reset() -> void:
+	for threat in _active_threats:
+		_mark_removed(threat.id)
 	_active_threats.clear()
-	_emit_update()
-
-func latch_threat(threat_info: Dictionary) -> void:
-	var threat := threat_info.duplicate(true)
-	if not threat.has("id"):
-		threat["id"] = "threat_%d" % _active_threats.size()
-	if not threat.has("name"):
-		threat["name"] = threat.get("id")
-	if not threat.has("timer"):
-		threat["timer"] = 3
-	if not threat.has("severity"):
-		threat["severity"] = "moderate"
-	if not threat.has("status_effects"):
-		threat["status_effects"] = []
-	if not threat.has("attack_pattern"):
-		threat["attack_pattern"] = {
-			"type": "standard",
-			"damage": 1,
-			"threat_delta": 1,
-			"statuses": []
-		}
-	_active_threats.append(threat)
-	threat_latched.emit(threat.duplicate(true))
-	_emit_update()
+	_slots.clear()
+	_attack_wheel.clear()
+	_turn = 0
+	_latch_serial = 0
+	_schedule_update()
+
+func has_template(template_id: StringName) -> bool:
+	return _templates.has(template_id)
+
+func get_template(template_id: StringName) -> ThreatTemplate:
+	return _templates.get(template_id, null)
+
+## Latches a threat that shares the loaded template. Returns the id of the
+## new threat, or "" when the template is unknown.
+func latch_template(template_id: StringName) -> String:
+	var template: ThreatTemplate = _templates.get(template_id, null)
+	if template == null:
+		return ""
+	return _latch(template, [])
+
+## Latches a threat described by a dictionary in the template format. The
+## dictionary becomes a private template for this one threat.
+func latch_threat(threat_info: Dictionary) -> String:
+	var template := ThreatTemplate.from_dictionary(threat_info)
+	return _latch(template, threat_info.get("status_effects", []) as Array)
 
 func resolve_threat(threat_id: String) -> void:
-	for index in _active_threats.size():
-		var threat := _active_threats[index]
-		if threat.get("id", "") == threat_id:
-			_active_threats.remove_at(index)
-			threat_cleared.emit(threat.duplicate(true))
-			_emit_update()
-			return
+	var slot: int = _slots.get(threat_id, -1)
+	if slot < 0:
+		return
+	var threat := _snapshot(slot)
+	_remove_slot(slot)
+	threat_cleared.emit(threat)
+	_mark_removed(threat_id)
 
+## Advances one turn. Threats whose timer ran out attack and restart their
+## cooldown; the rest count down implicitly through the turn counter.
 func tick_timers() -> void:
-	for threat in _active_threats:
-		var timer := int(threat.get("timer", 0))
-		if timer > 0:
-			threat["timer"] = timer - 1
-		else:
-			_execute_attack(threat)
-	_emit_update()
+	_turn += 1
+	var due: PackedStringArray = _attack_wheel.get(_turn, PackedStringArray())
+	_attack_wheel.erase(_turn)
+	for threat_id in due:
+		var slot: int = _slots.get(threat_id, -1)
+		if slot < 0 or _active_threats[slot].attack_turn != _turn:
+			continue
+		_execute_attack(slot)
+		_changed_ids[threat_id] = true
+	_schedule_update()
 
 func apply_status(threat_id: String, status: Dictionary) -> void:
-	for threat in _active_threats:
-		if threat.get("id", "") == threat_id:
-			var status_effects: Array = threat.get("status_effects", []) as Array
-			status_effects.append(status.duplicate(true))
-			threat["status_effects"] = status_effects
-			_emit_update()
-			return
+	var slot: int = _slots.get(threat_id, -1)
+	if slot < 0:
+		return
+	_active_threats[slot].add_status(status)
+	_mark_changed(threat_id)
 
 func clear_status(threat_id: String, status_id: String) -> void:
-	for threat in _active_threats:
-		if threat.get("id", "") == threat_id:
-			var status_effects: Array = threat.get("status_effects", []) as Array
-			status_effects = status_effects.filter(func(effect: Dictionary) -> bool:
-				return effect.get("id", "") != status_id
-			)
-			threat["status_effects"] = status_effects
-			_emit_update()
-			return
+	var slot: int = _slots.get(threat_id, -1)
+	if slot < 0:
+		return
+	_active_threats[slot].remove_status(status_id)
+	_mark_changed(threat_id)
+
+func has_threat(threat_id: String) -> bool:
+	return _slots.has(threat_id)
+
+func get_threat(threat_id: String) -> Dictionary:
+	var slot: int = _slots.get(threat_id, -1)
+	return _snapshot(slot, true) if slot >= 0 else {}
+
+func get_threat_count() -> int:
+	return _active_threats.size()
+
+func get_turn() -> int:
+	return _turn
 
 func get_threats() -> Array[Dictionary]:
 	var copy: Array[Dictionary] = []
-	for threat in _active_threats:
-		copy.append(threat.duplicate(true))
+	for slot in _active_threats.size():
+		copy.append(_snapshot(slot, true))
 	return copy
 
-func _emit_update() -> void:
-	threats_updated.emit(get_threats())
-
-func _execute_attack(threat: Dictionary) -> void:
-	var pattern: Dictionary = threat.get("attack_pattern", {}) as Dictionary
-	var cooldown: int = int(pattern.get("cooldown", 1))
-	threat["timer"] = max(1, cooldown)
-	threat["last_attack"] = {
-		"damage": pattern.get("damage", 1),
-		"threat_delta": pattern.get("threat_delta", 1),
-		"statuses": pattern.get("statuses", [])
-	}
-	threat_attack_resolved.emit(String(threat.get("id", "")), (threat["last_attack"] as Dictionary).duplicate(true))
+## Emits the pending threats_changed now instead of at the end of the frame.
+func flush_updates() -> void:
+	if not _update_scheduled:
+		return
+	_update_scheduled = false
+	var changed: Array[Dictionary] = []
+	for threat_id in _changed_ids:
+		var slot: int = _slots.get(threat_id, -1)
+		if slot >= 0:
+			changed.append(_snapshot(slot))
+	var removed := _removed_ids
+	_changed_ids.clear()
+	_removed_ids = PackedStringArray()
+	threats_changed.emit(_turn, changed, removed)
+	if not threats_updated.get_connections().is_empty():
+		threats_updated.emit(get_threats())
 
+## Dictionary copy of a template, for callers that still want to edit one
+## before passing it to latch_threat().
 func build_from_template(threat_id: String) -> Dictionary:
-	var template_variant: Variant = THREAT_TEMPLATES.get(threat_id, null)
-	if template_variant == null:
+	var template: ThreatTemplate = _templates.get(StringName(threat_id), null)
+	if template == null:
 		return {}
-	var template: Dictionary = template_variant as Dictionary
-	return template.duplicate(true)
+	return template.to_dictionary()
+
+func _latch(template: ThreatTemplate, statuses: Array) -> String:
+	_latch_serial += 1
+	var threat := ThreatInstance.new()
+	threat.template = template
+	threat.id = String(template.threat_id)
+	if threat.id.is_empty():
+		threat.id = "threat_%d" % _latch_serial
+	elif _slots.has(threat.id):
+		# A second copy of the same threat needs its own id for the index.
+		threat.id = "%s_%d" % [threat.id, _latch_serial]
+	threat.cooldown = max(1, template.cooldown)
+	for status in statuses:
+		threat.add_status(status as Dictionary)
+	_slots[threat.id] = _active_threats.size()
+	_active_threats.append(threat)
+	_schedule_attack(_active_threats.size() - 1, max(0, template.timer))
+	threat_latched.emit(_snapshot(_active_threats.size() - 1))
+	_mark_changed(threat.id)
+	return threat.id
+
+func _mark_changed(threat_id: String) -> void:
+	_changed_ids[threat_id] = true
+	_schedule_update()
+
+func _mark_removed(threat_id: String) -> void:
+	_changed_ids.erase(threat_id)
+	_removed_ids.append(threat_id)
+	_schedule_update()
+
+func _schedule_update() -> void:
+	if _update_scheduled:
+		return
+	_update_scheduled = true
+	call_deferred("flush_updates")
+
+## Timer semantics match the old per-tick countdown: a threat with timer N
+## attacks on the (N + 1)th tick from now.
+func _schedule_attack(slot: int, timer: int) -> void:
+	var threat := _active_threats[slot]
+	threat.attack_turn = _turn + timer + 1
+	var bucket: PackedStringArray = _attack_wheel.get(threat.attack_turn, PackedStringArray())
+	bucket.append(threat.id)
+	_attack_wheel[threat.attack_turn] = bucket
+
+## Swap-removes the slot so the index stays dense.
+func _remove_slot(slot: int) -> void:
+	var last := _active_threats.size() - 1
+	var threat_id := _active_threats[slot].id
+	if slot != last:
+		_active_threats[slot] = _active_threats[last]
+		_slots[_active_threats[slot].id] = slot
+	_active_threats.remove_at(last)
+	_slots.erase(threat_id)
+
+## Builds the dictionary view handed to signals and getters. Signal views
+## share the template's read-only attack dictionaries; getters ask for copies.
+func _snapshot(slot: int, copy_attack: bool = false) -> Dictionary:
+	var threat := _active_threats[slot]
+	var template := threat.template
+	var statuses: Array[Dictionary] = []
+	for index in threat.status_ids.size():
+		statuses.append({
+			"id": threat.status_ids[index],
+			"label": threat.status_labels[index],
+			"duration": threat.status_durations[index],
+		})
+	var snapshot := {
+		"id": threat.id,
+		"template_id": String(template.threat_id),
+		"name": template.display_name if not template.display_name.is_empty() else threat.id,
+		"severity": String(template.severity),
+		"timer": threat.attack_turn - _turn - 1,
+		"next_attack_turn": threat.attack_turn,
+		"cooldown": threat.cooldown,
+		"status_effects": statuses,
+		"attack_pattern": template.get_attack_pattern() if copy_attack else template.get_shared_attack_pattern(),
+	}
+	if not template.summary.is_empty():
+		snapshot["summary"] = template.summary
+	if threat.has_attacked:
+		snapshot["last_attack"] = template.get_attack().duplicate(true) if copy_attack else template.get_attack()
+	return snapshot
+
+func _execute_attack(slot: int) -> void:
+	var threat := _active_threats[slot]
+	_schedule_attack(slot, threat.cooldown)
+	threat.has_attacked = true
+	threat_attack_resolved.emit(threat.id, threat.template.get_attack())
+
+func _load_templates() -> void:
+	_templates.clear()
+	var dir := DirAccess.open(templates_path)
+	if dir == null:
+		return
+	var entries: Array[String] = []
+	dir.list_dir_begin()
+	while true:
+		var entry := dir.get_next()
+		if entry == "":
+			break
+		if dir.current_is_dir():
+			continue
+		if entry.ends_with(".tres") or entry.ends_with(".res"):
+			entries.append(entry)
+	dir.list_dir_end()
+	entries.sort()
+	for entry in entries:
+		var template := load("%s/%s" % [templates_path, entry]) as ThreatTemplate
+		if template != null:
+			_templates[template.threat_id] = template
@@ -15,6 +15,7 @@ class DieState:
     var locked: bool = false
     var held: bool = false
     var exhausted: bool = false
+    var jammed: bool = false
 
 var _dice_states: Array[DieState] = []
 var _cached_results: Array[int] = []
@@ -27,12 +28,20 @@ var _dice_nodes: Array[DieController] = []
 var _reduced_motion: bool = false
 var _pending_roll_indices: Array[int] = []
 var _rolling: bool = false
+## Skips the 3D dice: rolls resolve immediately from the dice stream and
+## roll_resolved fires before request_roll() returns. Set before _ready.
+var logical_only: bool = false
 
 func _ready() -> void:
-    _rng.randomize()
+    var rng_service := ServiceRegistry.get_rng_service()
+    if rng_service:
+        _rng = rng_service.get_stream(&"dice")
+    else:
+        _rng.randomize()
     _load_faces()
     _initialize_pool()
-    _ensure_visual_dice()
+    if not logical_only:
+        _ensure_visual_dice()
     set_physics_process(false)
     _initialized = true
 
@@ -71,7 +80,7 @@ func request_roll() -> void:
             next_results.append(0)
             _sync_die_value(index, state.value)
             continue
-        if state.locked or state.held:
+        if state.locked or state.held or state.jammed:
             next_results.append(state.value)
             _sync_die_value(index, state.value)
             continue
@@ -193,6 +202,38 @@ func restore_die(index: int) -> void:
     _set_die_hold_visual(index, false)
     hold_state_changed.emit(get_held_indices())
 
+## Applies the dice side of status effects for this turn in one call. The
+## last jammed_count dice are jammed: they show their lowest face and do not
+## roll until reset(). Earlier jams are replaced.
+func apply_status_effects(jammed_count: int) -> void:
+    _ensure_initialized()
+    var lowest: int = _faces.min()
+    var remaining := jammed_count
+    for index in range(_dice_states.size() - 1, -1, -1):
+        var state := _dice_states[index]
+        state.jammed = remaining > 0 and not state.exhausted
+        if not state.jammed:
+            continue
+        remaining -= 1
+        state.value = lowest
+        if index < _cached_results.size():
+            _cached_results[index] = lowest
+        _sync_die_value(index, lowest)
+
+func is_die_jammed(index: int) -> bool:
+    _ensure_initialized()
+    if not _is_valid_index(index):
+        return false
+    return _dice_states[index].jammed
+
+func get_jammed_indices() -> Array[int]:
+    _ensure_initialized()
+    var jammed: Array[int] = []
+    for index in _dice_states.size():
+        if _dice_states[index].jammed:
+            jammed.append(index)
+    return jammed
+
 func get_results() -> Array[int]:
     _ensure_initialized()
     return _cached_results.duplicate()
@@ -203,6 +244,7 @@ func reset() -> void:
         state.locked = false
         state.held = false
         state.exhausted = false
+        state.jammed = false
         state.value = 1
     _cached_results = [1, 1, 1]
     _pending_roll_indices.clear()
@@ -218,10 +260,9 @@ func _ensure_pool_templates() -> Array[Dictionary]:
     return []
 
 func _find_pool_cache() -> Node:
-    var tree := get_tree()
-    if tree and tree.get_root().has_node("DicePoolCache"):
-        return tree.get_root().get_node("DicePoolCache")
-    return null
+    if not is_inside_tree():
+        return null
+    return ServiceRegistry.get_dice_pool_cache()
 
 func _is_valid_index(index: int) -> bool:
     return index >= 0 and index < _dice_states.size()
@@ -248,6 +289,10 @@ func _ensure_visual_dice() -> void:
         die_instance.position = Vector3((index - (DICE_POOL_SIZE - 1) * 0.5) * 1.6, 0.6, 0)
         die_instance.reduced_motion = _reduced_motion
         add_child(die_instance)
+        var rng_service := ServiceRegistry.get_rng_service()
+        if rng_service:
+            # Physics jitter gets its own streams so it never shifts the face rolls.
+            die_instance.set_rng(rng_service.split_stream(&"dice", "die_%d" % index))
         die_instance.set_value(_dice_states[index].value, true)
         _dice_nodes.append(die_instance)
 
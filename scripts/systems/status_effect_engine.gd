@@ -0,0 +1,129 @@
+extends RefCounted
+class_name StatusEffectEngine
+
+## Active status effects on the crew, stored as parallel packed arrays and
+## evaluated in one pass per turn. A pass sums every effect into one
+## ResourceLedger.apply_deltas() call and one DiceSubsystem.apply_status_effects()
+## call; expired effects are compacted out in the same loop.
+
+const TARGET_DICE: int = -1
+
+## Resource rows effects can drain; an effect's target is an index into this.
+const RESOURCE_IDS: Array[StringName] = [&"health", &"oxygen", &"materials", &"threat"]
+
+## Status id -> [target resource or "dice", delta per turn per magnitude].
+const EFFECT_TABLE: Dictionary = {
+	&"bleed": [&"health", -1],
+	&"heat_burn": [&"health", -1],
+	&"oxygen_leak": [&"oxygen", -1],
+	&"mind_fog": [&"threat", 1],
+	&"dice_lock": [&"dice", 1],
+	&"sensor_jam": [&"dice", 1],
+	&"stagger": [&"dice", 1],
+}
+
+var _type_ids: Array[StringName] = []
+var _type_targets: PackedInt32Array = PackedInt32Array()
+var _type_deltas: PackedInt32Array = PackedInt32Array()
+var _type_lookup: Dictionary[StringName, int] = {}
+
+var _types: PackedInt32Array = PackedInt32Array()
+var _remaining: PackedInt32Array = PackedInt32Array()
+var _magnitudes: PackedInt32Array = PackedInt32Array()
+var _targets: PackedInt32Array = PackedInt32Array()
+
+func _init() -> void:
+	for status_id in EFFECT_TABLE:
+		var entry: Array = EFFECT_TABLE[status_id]
+		var target_id: StringName = entry[0]
+		_type_lookup[status_id] = _type_ids.size()
+		_type_ids.append(status_id)
+		_type_targets.append(TARGET_DICE if target_id == &"dice" else RESOURCE_IDS.find(target_id))
+		_type_deltas.append(int(entry[1]))
+
+func has_effect_type(status_id: StringName) -> bool:
+	return _type_lookup.has(status_id)
+
+## Adds or refreshes an effect. Re-applying a status keeps one entry with the
+## longer duration and the larger magnitude. Unknown statuses are ignored.
+func add_effect(status_id: StringName, duration: int, magnitude: int = 1) -> void:
+	var type: int = _type_lookup.get(status_id, -1)
+	if type < 0 or duration <= 0 or magnitude <= 0:
+		return
+	for index in _types.size():
+		if _types[index] == type:
+			_remaining[index] = max(_remaining[index], duration)
+			_magnitudes[index] = max(_magnitudes[index], magnitude)
+			return
+	_types.append(type)
+	_remaining.append(duration)
+	_magnitudes.append(magnitude)
+	_targets.append(_type_targets[type])
+
+## Adds the statuses of an attack payload ({"id", "duration", "magnitude"}).
+func add_statuses(statuses: Array) -> void:
+	for status in statuses:
+		add_effect(StringName(String(status.get("id", ""))), int(status.get("duration", 0)), int(status.get("magnitude", 1)))
+
+## Runs one turn: applies every effect, ticks durations down and drops the
+## expired ones. Returns the aggregated resource deltas.
+func evaluate_turn(ledger: Node, dice: Node) -> Dictionary:
+	var totals := PackedInt32Array()
+	totals.resize(RESOURCE_IDS.size())
+	var jammed_dice := 0
+	var write := 0
+	for index in _types.size():
+		var target := _targets[index]
+		var amount := _type_deltas[_types[index]] * _magnitudes[index]
+		if target == TARGET_DICE:
+			jammed_dice += amount
+		else:
+			totals[target] += amount
+		var remaining := _remaining[index] - 1
+		if remaining <= 0:
+			continue
+		_types[write] = _types[index]
+		_remaining[write] = remaining
+		_magnitudes[write] = _magnitudes[index]
+		_targets[write] = target
+		write += 1
+	_resize(write)
+	var deltas: Dictionary = {}
+	for slot in RESOURCE_IDS.size():
+		if totals[slot] != 0:
+			deltas[RESOURCE_IDS[slot]] = totals[slot]
+	if ledger != null and not deltas.is_empty():
+		ledger.apply_deltas(deltas)
+	if dice != null and dice.has_method("apply_status_effects"):
+		dice.apply_status_effects(jammed_dice)
+	return deltas
+
+func clear() -> void:
+	_resize(0)
+
+func get_effect_count() -> int:
+	return _types.size()
+
+func get_remaining(status_id: StringName) -> int:
+	var type: int = _type_lookup.get(status_id, -1)
+	for index in _types.size():
+		if _types[index] == type:
+			return _remaining[index]
+	return 0
+
+## Dictionary view for UI; not used on the evaluation path.
+func get_effects() -> Array[Dictionary]:
+	var effects: Array[Dictionary] = []
+	for index in _types.size():
+		effects.append({
+			"id": _type_ids[_types[index]],
+			"duration": _remaining[index],
+			"magnitude": _magnitudes[index],
+		})
+	return effects
+
+func _resize(count: int) -> void:
+	_types.resize(count)
+	_remaining.resize(count)
+	_magnitudes.resize(count)
+	_targets.resize(count)
@@ -17,6 +17,7 @@ signal clue_milestone_reached(milestone: int, event_id: String)
 signal milestone_event_resolved(event_id: String, outcome: Dictionary)
 signal threat_attack_processed(threat_id: String, attack: Dictionary)
 signal loot_awarded(loot: Dictionary)
+signal status_effects_applied(deltas: Dictionary)
 
 const CLUE_MILESTONES: Array[int] = [3, 6, 10]
 const ROOM_CYCLE_OXYGEN_COST: int = 1
@@ -36,6 +37,7 @@ var _loot_service: Node = null
 var _telemetry_hub: Node = null
 var _clues_collected: int = 0
 var _last_milestone_event_id: String = ""
+var _status_effects := StatusEffectEngine.new()
 
 func _ready() -> void:
 	_resolve_support_services()
@@ -77,32 +79,57 @@ const MILESTONE_EVENTS: Dictionary = {
 	}
 }
 
+## Rewires the manager to another dice subsystem; the previous one stops
+## driving it. A null subsystem leaves the manager unwired.
 func initialize(dice_subsystem, hud_controller) -> void:
+	_disconnect_dice_subsystem()
 	_dice_subsystem = dice_subsystem
 	_hud_controller = hud_controller
-	if not _dice_subsystem.roll_resolved.is_connected(_on_roll_resolved):
-		_dice_subsystem.roll_resolved.connect(_on_roll_resolved)
-	if not _dice_subsystem.lock_state_changed.is_connected(_on_lock_state_changed):
-		_dice_subsystem.lock_state_changed.connect(_on_lock_state_changed)
-	if _dice_subsystem.has_signal("hold_state_changed") and not _dice_subsystem.hold_state_changed.is_connected(_on_hold_state_changed):
-		_dice_subsystem.hold_state_changed.connect(_on_hold_state_changed)
+	if _dice_subsystem != null:
+		if not _dice_subsystem.roll_resolved.is_connected(_on_roll_resolved):
+			_dice_subsystem.roll_resolved.connect(_on_roll_resolved)
+		if not _dice_subsystem.lock_state_changed.is_connected(_on_lock_state_changed):
+			_dice_subsystem.lock_state_changed.connect(_on_lock_state_changed)
+		if _dice_subsystem.has_signal("hold_state_changed") and not _dice_subsystem.hold_state_changed.is_connected(_on_hold_state_changed):
+			_dice_subsystem.hold_state_changed.connect(_on_hold_state_changed)
 	_resolve_support_services()
 	_reset_state()
 
+func get_dice_subsystem():
+	return _dice_subsystem
+
+func get_hud_controller():
+	return _hud_controller
+
+func _disconnect_dice_subsystem() -> void:
+	if not is_instance_valid(_dice_subsystem):
+		return
+	if _dice_subsystem.roll_resolved.is_connected(_on_roll_resolved):
+		_dice_subsystem.roll_resolved.disconnect(_on_roll_resolved)
+	if _dice_subsystem.lock_state_changed.is_connected(_on_lock_state_changed):
+		_dice_subsystem.lock_state_changed.disconnect(_on_lock_state_changed)
+	if _dice_subsystem.has_signal("hold_state_changed") and _dice_subsystem.hold_state_changed.is_connected(_on_hold_state_changed):
+		_dice_subsystem.hold_state_changed.disconnect(_on_hold_state_changed)
+
 func start_new_run() -> void:
 	_reset_state()
 	_clues_collected = 0
 	_last_milestone_event_id = ""
+	_status_effects.clear()
 	start_turn()
 
 func start_turn() -> void:
 	_state = TurnState.ROLL_PREP
 	_exhausted_indices.clear()
 	_dice_subsystem.reset()
+	_apply_status_effects()
 	if _hud_controller != null:
 		_hud_controller.reset_hud_state()
 	turn_started.emit(_state)
 
+func get_status_effects() -> StatusEffectEngine:
+	return _status_effects
+
 func request_roll() -> void:
 	if _state in [TurnState.RESOLUTION, TurnState.ROLLING]:
 		return
@@ -198,6 +225,12 @@ func _reset_state() -> void:
 	_held_indices.clear()
 	_state = TurnState.IDLE
 
+func _apply_status_effects() -> void:
+	if _status_effects.get_effect_count() == 0:
+		return
+	var deltas := _status_effects.evaluate_turn(_get_resource_ledger(), _dice_subsystem)
+	status_effects_applied.emit(deltas)
+
 func _apply_roll_outcome() -> void:
 	var ledger = _get_resource_ledger()
 	if ledger:
@@ -206,13 +239,7 @@ func _apply_roll_outcome() -> void:
 func _get_resource_ledger():
 	if not is_inside_tree():
 		return null
-	var tree := get_tree()
-	if tree == null:
-		return null
-	var root := tree.get_root()
-	if root and root.has_node("ResourceLedger"):
-		return root.get_node("ResourceLedger")
-	return null
+	return ServiceRegistry.get_resource_ledger()
 
 func get_state() -> TurnState:
 	return _state
@@ -231,8 +258,7 @@ func cycle_top_room() -> void:
 		return
 	var ledger = _get_resource_ledger()
 	if ledger:
-		ledger.adjust_oxygen(-ROOM_CYCLE_OXYGEN_COST)
-		ledger.adjust_threat(ROOM_CYCLE_THREAT_PENALTY)
+		ledger.apply_deltas({"oxygen": -ROOM_CYCLE_OXYGEN_COST, "threat": ROOM_CYCLE_THREAT_PENALTY})
 	_record_telemetry("room_cycle", {"room_id": cycled.get("id", ""), "oxygen_cost": ROOM_CYCLE_OXYGEN_COST, "threat_penalty": ROOM_CYCLE_THREAT_PENALTY})
 	room_cycled.emit(cycled)
 
@@ -277,8 +303,10 @@ func _resolve_support_services() -> void:
 func _apply_room_rewards(room: Dictionary) -> void:
 	var ledger = _get_resource_ledger()
 	if ledger:
-		ledger.adjust_materials(int(room.get("materials_reward", 0)))
-		ledger.adjust_oxygen(-int(room.get("oxygen_cost", 0)))
+		ledger.apply_deltas({
+			"materials": int(room.get("materials_reward", 0)),
+			"oxygen": -int(room.get("oxygen_cost", 0)),
+		})
 	var clue_gain := int(room.get("clue_reward", 0))
 	if clue_gain > 0:
 		_clues_collected += clue_gain
@@ -305,12 +333,10 @@ func _handle_room_threat(room: Dictionary) -> void:
 	var threat_id: String = String(room.get("threat", ""))
 	if threat_id.is_empty():
 		return
-	var template: Dictionary = {}
-	if _threat_service.has_method("build_from_template"):
-		template = _threat_service.build_from_template(threat_id) as Dictionary
-	if template.is_empty():
-		template = {"id": threat_id, "name": threat_id.capitalize()}
-	_threat_service.latch_threat(template)
+	if _threat_service.has_method("latch_template") and _threat_service.has_template(StringName(threat_id)):
+		_threat_service.latch_template(StringName(threat_id))
+		return
+	_threat_service.latch_threat({"id": threat_id, "name": threat_id.capitalize()})
 
 func _check_clue_milestones() -> void:
 	for milestone in CLUE_MILESTONES:
@@ -338,10 +364,12 @@ func _on_event_resolved(outcome: Dictionary) -> void:
 		return
 	var ledger = _get_resource_ledger()
 	if ledger:
-		ledger.adjust_materials(int(outcome.get("materials_delta", 0)))
-		ledger.adjust_oxygen(int(outcome.get("oxygen_delta", 0)))
-		ledger.adjust_health(int(outcome.get("health_delta", 0)))
-		ledger.adjust_threat(int(outcome.get("threat_delta", 0)))
+		ledger.apply_deltas({
+			"materials": int(outcome.get("materials_delta", 0)),
+			"oxygen": int(outcome.get("oxygen_delta", 0)),
+			"health": int(outcome.get("health_delta", 0)),
+			"threat": int(outcome.get("threat_delta", 0)),
+		})
 	var clue_delta := int(outcome.get("clue_delta", 0))
 	if clue_delta != 0:
 		_clues_collected = max(0, _clues_collected + clue_delta)
@@ -350,11 +378,8 @@ func _on_event_resolved(outcome: Dictionary) -> void:
 	var spawn_threat: String = String(outcome.get("spawn_threat", ""))
 	if spawn_threat != "":
 		if _threat_service:
-			var template: Dictionary = {}
-			if _threat_service.has_method("build_from_template"):
-				template = _threat_service.build_from_template(spawn_threat) as Dictionary
-			if not template.is_empty():
-				_threat_service.latch_threat(template)
+			if _threat_service.has_method("latch_template"):
+				_threat_service.latch_template(StringName(spawn_threat))
 	_record_telemetry("milestone_resolved", {"event_id": _last_milestone_event_id, "outcome": outcome})
 	var scripted_loot: String = String(outcome.get("loot_reward", ""))
 	if not scripted_loot.is_empty():
@@ -370,8 +395,11 @@ func _on_event_resolved(outcome: Dictionary) -> void:
 func _on_threat_attack_resolved(threat_id: String, attack: Dictionary) -> void:
 	var ledger = _get_resource_ledger()
 	if ledger:
-		ledger.adjust_health(-int(attack.get("damage", 0)))
-		ledger.adjust_threat(int(attack.get("threat_delta", 0)))
+		ledger.apply_deltas({
+			"health": -int(attack.get("damage", 0)),
+			"threat": int(attack.get("threat_delta", 0)),
+		})
+	_status_effects.add_statuses(attack.get("statuses", []) as Array)
 	_record_telemetry("threat_attack", {"threat_id": threat_id, "damage": attack.get("damage", 0), "threat_delta": attack.get("threat_delta", 0)})
 	threat_attack_processed.emit(threat_id, attack.duplicate(true))
 
@@ -387,50 +415,32 @@ func _add_loot_to_inventory(loot: Dictionary) -> void:
 func _get_room_queue():
 	if not is_inside_tree():
 		return null
-	var root := get_tree().get_root()
-	if root and root.has_node("RoomQueueService"):
-		return root.get_node("RoomQueueService")
-	return null
+	return ServiceRegistry.get_room_queue_service()
 
 func _get_threat_service():
 	if not is_inside_tree():
 		return null
-	var root := get_tree().get_root()
-	if root and root.has_node("ThreatService"):
-		return root.get_node("ThreatService")
-	return null
+	return ServiceRegistry.get_threat_service()
 
 func _get_event_resolver():
 	if not is_inside_tree():
 		return null
-	var root := get_tree().get_root()
-	if root and root.has_node("EventResolver"):
-		return root.get_node("EventResolver")
-	return null
+	return ServiceRegistry.get_event_resolver()
 
 func _get_loot_service():
 	if not is_inside_tree():
 		return null
-	var root := get_tree().get_root()
-	if root and root.has_node("LootService"):
-		return root.get_node("LootService")
-	return null
+	return ServiceRegistry.get_loot_service()
 
 func _get_equipment_inventory():
 	if not is_inside_tree():
 		return null
-	var root := get_tree().get_root()
-	if root and root.has_node("EquipmentInventoryModel"):
-		return root.get_node("EquipmentInventoryModel")
-	return null
+	return ServiceRegistry.get_equipment_inventory()
 
 func _get_telemetry_hub():
 	if not is_inside_tree():
 		return null
-	var root := get_tree().get_root()
-	if root and root.has_node("TelemetryHub"):
-		return root.get_node("TelemetryHub")
-	return null
+	return ServiceRegistry.get_telemetry_hub()
 
 func _record_telemetry(event_name: String, payload: Dictionary) -> void:
 	if _telemetry_hub == null or not is_instance_valid(_telemetry_hub):
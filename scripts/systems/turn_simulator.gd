@@ -0,0 +1,229 @@
+extends Node
+class_name TurnSimulator
+
+## Headless fast-forward driver for the real turn pipeline. Pairs TurnManager
+## with a logical DiceSubsystem and no HUD, then plays whole turns in a loop:
+## roll, lock and commit until the dice are spent, enter the next room,
+## answer milestone events and tick threats. Runs that run out of health or
+## oxygen restart with the next seed. While set up, the live TelemetryHub keeps
+## buffering but stops writing its log; teardown() hands the turn manager, RNG
+## and log back. Drive it from scripts/tools/run_simulation.gd or directly
+## from tests.
+
+signal run_ended(run_index: int, turns: int)
+
+## Pass on the command line (after --) to keep GameDirector from building
+## the run HUD.
+const SIM_FLAG := "--sim"
+
+## Chooses which dice to lock after a roll: (results: Array[int]) -> Array[int]
+## of indices. Defaults to locking every die.
+var lock_policy: Callable = Callable()
+## Picks a milestone choice: (event: Dictionary) -> String choice id.
+## Defaults to the first choice.
+var event_policy: Callable = Callable()
+var restart_on_run_end: bool = true
+
+var _turn_manager: TurnManager = null
+var _dice: DiceSubsystem = null
+var _run_seed: int = 0
+var _run_index: int = 0
+var _run_turns: int = 0
+var _stats: Dictionary = {}
+var _telemetry_hub: Node = null
+var _telemetry_log_path: String = ""
+# Wiring and RNG state replaced by setup(), restored by teardown(). Untyped
+# because the previous HUD or dice may be freed by then.
+var _previous_dice = null
+var _previous_hud = null
+var _rng_snapshot: Dictionary = {}
+
+static func is_requested() -> bool:
+	return OS.get_cmdline_user_args().has(SIM_FLAG)
+
+## Wires the simulator. Without a manager the TurnManagerSingleton autoload
+## is used so threat and event handlers are not connected twice.
+func setup(turn_manager: TurnManager = null) -> void:
+	_suspend_telemetry_log()
+	_dice = DiceSubsystem.new()
+	_dice.logical_only = true
+	add_child(_dice)
+	_turn_manager = turn_manager if turn_manager != null else ServiceRegistry.get_turn_manager()
+	if _turn_manager == null:
+		_turn_manager = TurnManager.new()
+	if not _turn_manager.is_inside_tree():
+		add_child(_turn_manager)
+	_previous_dice = _turn_manager.get_dice_subsystem()
+	_previous_hud = _turn_manager.get_hud_controller()
+	var rng_service := ServiceRegistry.get_rng_service()
+	if rng_service:
+		_rng_snapshot = rng_service.get_snapshot()
+	_turn_manager.initialize(_dice, null)
+	if not _turn_manager.room_entered.is_connected(_on_room_entered):
+		_turn_manager.room_entered.connect(_on_room_entered)
+		_turn_manager.loot_awarded.connect(_on_loot_awarded)
+		_turn_manager.threat_attack_processed.connect(_on_threat_attack_processed)
+	_reset_stats()
+
+func start_run(run_seed: int = 0) -> void:
+	var rng_service := ServiceRegistry.get_rng_service()
+	if rng_service:
+		rng_service.start_run(run_seed)
+		_run_seed = rng_service.get_run_seed()
+	var ledger := ServiceRegistry.get_resource_ledger()
+	if ledger:
+		ledger.start_new_run(true)
+	var room_queue := ServiceRegistry.get_room_queue_service()
+	if room_queue:
+		room_queue.reset(true)
+	var threat_service := ServiceRegistry.get_threat_service()
+	if threat_service:
+		threat_service.reset()
+	var inventory := ServiceRegistry.get_equipment_inventory()
+	if inventory:
+		inventory.reset()
+	_run_turns = 0
+	_turn_manager.start_new_run()
+
+## Plays count turns and returns the totals so far. Stops early when a run
+## ends and restart_on_run_end is off.
+func run_turns(count: int) -> Dictionary:
+	if _turn_manager == null:
+		setup()
+		start_run()
+	var started := Time.get_ticks_usec()
+	for _i in count:
+		_play_turn()
+		if _is_run_over():
+			_stats["runs_ended"] += 1
+			run_ended.emit(_run_index, _run_turns)
+			_run_index += 1
+			if not restart_on_run_end:
+				break
+			start_run(_run_seed + 1)
+	_stats["elapsed_usec"] += Time.get_ticks_usec() - started
+	return get_stats()
+
+## Undoes setup(): the turn manager gets its previous dice subsystem and HUD
+## back, the RNG returns to its pre-simulation state and telemetry logging
+## resumes. Safe to call more than once; also runs on leaving the tree.
+func teardown() -> void:
+	if _turn_manager != null and is_instance_valid(_turn_manager):
+		if _turn_manager.room_entered.is_connected(_on_room_entered):
+			_turn_manager.room_entered.disconnect(_on_room_entered)
+			_turn_manager.loot_awarded.disconnect(_on_loot_awarded)
+			_turn_manager.threat_attack_processed.disconnect(_on_threat_attack_processed)
+		if _turn_manager.get_dice_subsystem() == _dice:
+			var previous_dice = _previous_dice if is_instance_valid(_previous_dice) else null
+			var previous_hud = _previous_hud if is_instance_valid(_previous_hud) else null
+			_turn_manager.initialize(previous_dice, previous_hud)
+	_turn_manager = null
+	_previous_dice = null
+	_previous_hud = null
+	if not _rng_snapshot.is_empty():
+		var rng_service := ServiceRegistry.get_rng_service()
+		if rng_service:
+			rng_service.apply_snapshot(_rng_snapshot)
+		_rng_snapshot = {}
+	_restore_telemetry_log()
+
+func _exit_tree() -> void:
+	teardown()
+
+func get_stats() -> Dictionary:
+	return _stats.duplicate()
+
+func get_turn_manager() -> TurnManager:
+	return _turn_manager
+
+func _play_turn() -> void:
+	if _run_turns > 0:
+		_turn_manager.start_turn()
+	# A turn gets at most one roll per die, even if the policy holds dice back.
+	for _pass in DiceSubsystem.DICE_POOL_SIZE:
+		if _turn_manager.get_state() == TurnManager.TurnState.RESOLUTION:
+			break
+		_turn_manager.request_roll()
+		for index in _choose_locks(_turn_manager.get_current_results()):
+			_turn_manager.set_lock(index, true)
+		_turn_manager.commit_dice()
+	if _turn_manager.get_state() != TurnManager.TurnState.RESOLUTION:
+		_stats["stalled_turns"] += 1
+		_force_resolution()
+	_turn_manager.enter_next_room()
+	var resolver := ServiceRegistry.get_event_resolver()
+	if resolver and resolver.has_active_event():
+		resolver.resolve_choice(_choose_event(resolver.get_active_event()))
+	var threat_service := ServiceRegistry.get_threat_service()
+	if threat_service:
+		threat_service.tick_timers()
+	_stats["turns"] += 1
+	_run_turns += 1
+
+## The policy ran out of rolls without locking the whole pool: roll once more
+## and commit every die so the room is entered from a resolved turn.
+func _force_resolution() -> void:
+	if _turn_manager.get_state() != TurnManager.TurnState.ACTION:
+		_turn_manager.request_roll()
+	for index in DiceSubsystem.DICE_POOL_SIZE:
+		_turn_manager.set_lock(index, true)
+	_turn_manager.commit_dice()
+
+func _choose_locks(results: Array[int]) -> Array:
+	if lock_policy.is_valid():
+		return lock_policy.call(results)
+	return range(results.size())
+
+func _choose_event(event: Dictionary) -> String:
+	if event_policy.is_valid():
+		return String(event_policy.call(event))
+	var choices: Array = event.get("choices", [])
+	return String(choices[0].get("id", "")) if not choices.is_empty() else ""
+
+func _is_run_over() -> bool:
+	var ledger := ServiceRegistry.get_resource_ledger()
+	if ledger == null:
+		return false
+	return ledger.get_health() <= 0 or ledger.get_oxygen() <= 0
+
+func _reset_stats() -> void:
+	_stats = {
+		"turns": 0,
+		"runs_ended": 0,
+		"rooms_entered": 0,
+		"loot_awarded": 0,
+		"threat_attacks": 0,
+		"stalled_turns": 0,
+		"elapsed_usec": 0,
+	}
+
+## Simulated events still reach the hub's buffer, but nothing is appended to
+## the player's telemetry log until the simulator leaves the tree.
+func _suspend_telemetry_log() -> void:
+	if _telemetry_hub != null:
+		return
+	var hub := ServiceRegistry.get_telemetry_hub()
+	if hub == null:
+		return
+	hub.flush()
+	_telemetry_hub = hub
+	_telemetry_log_path = hub.log_path
+	hub.log_path = ""
+
+func _restore_telemetry_log() -> void:
+	if _telemetry_hub == null:
+		return
+	if is_instance_valid(_telemetry_hub):
+		# Drop the simulated events before logging resumes.
+		_telemetry_hub.flush()
+		_telemetry_hub.log_path = _telemetry_log_path
+	_telemetry_hub = null
+
+func _on_room_entered(_room: Dictionary) -> void:
+	_stats["rooms_entered"] += 1
+
+func _on_loot_awarded(_loot: Dictionary) -> void:
+	_stats["loot_awarded"] += 1
+
+func _on_threat_attack_processed(_threat_id: String, _attack: Dictionary) -> void:
+	_stats["threat_attacks"] += 1
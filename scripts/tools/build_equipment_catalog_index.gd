@@ -0,0 +1,17 @@
+extends SceneTree
+
+## Rebuilds the equipment catalog index after adding or editing modules:
+## godot --headless --script res://scripts/tools/build_equipment_catalog_index.gd
+
+const MODULES_PATH := "res://resources/equipment"
+const INDEX_PATH := "res://resources/config/equipment_catalog_index.tres"
+
+func _init():
+	var index := EquipmentCatalogIndex.build_from_directory(MODULES_PATH)
+	var error := ResourceSaver.save(index, INDEX_PATH)
+	if error != OK:
+		print("Failed to save catalog index to", INDEX_PATH, "error", error)
+		quit(1)
+		return
+	print("Indexed %d equipment modules into %s" % [index.size(), INDEX_PATH])
+	quit()
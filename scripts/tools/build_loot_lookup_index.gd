@@ -0,0 +1,27 @@
+extends SceneTree
+
+## Recompiles the loot lookup after editing loot tables or rooms:
+## godot --headless --script res://scripts/tools/build_loot_lookup_index.gd
+
+const LOOT_TABLE_PATH := "res://resources/loot/default_loot_table.tres"
+const ROOM_INDEX_PATH := "res://resources/config/room_deck_index.tres"
+const INDEX_PATH := "res://resources/config/loot_lookup_index.tres"
+
+func _init():
+	var table := load(LOOT_TABLE_PATH) as LootTableDefinition
+	if table == null:
+		print("Failed to load loot table from", LOOT_TABLE_PATH)
+		quit(1)
+		return
+	var room_tag_sets: Array = []
+	var rooms := load(ROOM_INDEX_PATH) as RoomDeckIndex
+	if rooms != null:
+		room_tag_sets.append_array(rooms.tag_lists)
+	var index := LootLookupIndex.compile(table, room_tag_sets)
+	var error := ResourceSaver.save(index, INDEX_PATH)
+	if error != OK:
+		print("Failed to save loot lookup to", INDEX_PATH, "error", error)
+		quit(1)
+		return
+	print("Compiled %d loot items and %d tag masks into %s" % [index.size(), index.mask_keys.size(), INDEX_PATH])
+	quit()
@@ -0,0 +1,17 @@
+extends SceneTree
+
+## Rebuilds the room deck index after adding or editing rooms:
+## godot --headless --script res://scripts/tools/build_room_deck_index.gd
+
+const ROOMS_PATH := "res://resources/rooms"
+const INDEX_PATH := "res://resources/config/room_deck_index.tres"
+
+func _init():
+	var index := RoomDeckIndex.build_from_directory(ROOMS_PATH)
+	var error := ResourceSaver.save(index, INDEX_PATH)
+	if error != OK:
+		print("Failed to save room deck index to", INDEX_PATH, "error", error)
+		quit(1)
+		return
+	print("Indexed %d rooms into %s" % [index.size(), INDEX_PATH])
+	quit()
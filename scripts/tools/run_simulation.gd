@@ -0,0 +1,43 @@
+extends SceneTree
+
+## Fast-forwards the real turn pipeline without HUD or dice physics:
+## godot --headless --script res://scripts/tools/run_simulation.gd -- --sim --turns=10000 --seed=42
+
+const DEFAULT_TURNS := 1000
+
+func _initialize():
+	if not TurnSimulator.is_requested():
+		print("Pass %s after -- so GameDirector skips the run HUD." % TurnSimulator.SIM_FLAG)
+		quit(1)
+		return
+	# _initialize runs before the first frame, when autoloads such as
+	# ServiceRegistry, RngService and ResourceLedger may not have finished
+	# _ready; lookups made now could return null.
+	await process_frame
+	var turns := DEFAULT_TURNS
+	var run_seed := 0
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--turns="):
+			turns = int(arg.get_slice("=", 1))
+		elif arg.begins_with("--seed="):
+			run_seed = int(arg.get_slice("=", 1))
+	var simulator := TurnSimulator.new()
+	root.add_child(simulator)
+	simulator.setup()
+	simulator.start_run(run_seed)
+	var stats := simulator.run_turns(turns)
+	simulator.teardown()
+	var elapsed_sec: float = max(float(stats["elapsed_usec"]) / 1000000.0, 0.000001)
+	print("Simulated %d turns (%d runs ended) in %.3fs, %.0f turns/sec" % [
+		stats["turns"],
+		stats["runs_ended"],
+		elapsed_sec,
+		stats["turns"] / elapsed_sec,
+	])
+	print("Rooms entered: %d, loot awarded: %d, threat attacks: %d, stalled turns: %d" % [
+		stats["rooms_entered"],
+		stats["loot_awarded"],
+		stats["threat_attacks"],
+		stats["stalled_turns"],
+	])
+	quit()
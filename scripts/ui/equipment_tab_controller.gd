@@ -2,6 +2,7 @@ extends VBoxContainer
 
 const VALID_PREVIEW_COLOR := Color(0.24, 0.95, 0.87, 0.85)
 const INVALID_PREVIEW_COLOR := Color(0.96, 0.33, 0.33, 0.85)
+const NEUTRAL_PREVIEW_COLOR := Color(0.82, 0.82, 0.82, 0.6)
 const OCCUPIED_COLOR := Color(0.82, 0.82, 0.82, 1.0)
 const DEFAULT_COLOR := Color(1, 1, 1, 1)
 
@@ -17,11 +18,13 @@ const DEFAULT_COLOR := Color(1, 1, 1, 1)
 @onready var _hint_label: Label = $"Content/InventoryPanel/HintLabel"
 
 var _grid_buttons: Dictionary = {}
+var _inventory_buttons: Dictionary[StringName, Button] = {}
 var _selected_item_id: StringName = &""
 var _current_rotation: int = 0
 var _hovered_cells: Array[Vector2i] = []
 var _carried_catalog: Dictionary = {}
 var _burden_thresholds: Dictionary = {}
+var _overlay_host: Control = null
 
 func _ready() -> void:
 	_populate_grid_buttons()
@@ -29,99 +32,149 @@ func _ready() -> void:
 	_rotate_right_button.pressed.connect(_on_rotate_right)
 	_remove_button.pressed.connect(_on_remove_pressed)
 	_clear_button.pressed.connect(_on_clear_pressed)
+	visibility_changed.connect(_on_visibility_changed)
 	var inventory: Node = _get_inventory()
 	if inventory != null:
 		inventory.inventory_changed.connect(_on_inventory_changed)
-		inventory.grid_updated.connect(_on_grid_updated)
+		inventory.grid_cells_changed.connect(_on_grid_cells_changed)
 		inventory.burden_changed.connect(_on_burden_changed)
 		inventory.loadout_changed.connect(_on_loadout_changed)
 		_burden_thresholds = inventory.get_burden_thresholds()
 		_on_inventory_changed(inventory.get_carry_items(), inventory.get_installed_items())
 		_on_grid_updated(inventory.get_grid())
 		_on_burden_changed(inventory.get_total_burden(), inventory.get_burden_state())
+		if is_visible_in_tree():
+			inventory.prefetch_modules(inventory.get_loot_module_ids())
 	var feedback: Node = _get_feedback_service()
 	if feedback:
 		feedback.preview_cleared.connect(_clear_preview)
 		feedback.preview_updated.connect(_on_feedback_preview)
+		_attach_overlays(feedback)
 
+func _exit_tree() -> void:
+	var feedback: Node = _get_feedback_service()
+	if feedback and _overlay_host:
+		feedback.detach_overlay_host()
+
+## Opening the tab warms the modules loot can award, so picking one up later
+## does not block on a synchronous load.
+func _on_visibility_changed() -> void:
+	if not is_visible_in_tree():
+		return
+	var inventory: Node = _get_inventory()
+	if inventory != null:
+		inventory.prefetch_modules(inventory.get_loot_module_ids())
+
+func _attach_overlays(feedback: Node) -> void:
+	# Top-level so the grid container does not lay it out as a cell.
+	_overlay_host = Control.new()
+	_overlay_host.top_level = true
+	_overlay_host.mouse_filter = Control.MOUSE_FILTER_IGNORE
+	_grid_container.add_child(_overlay_host)
+	feedback.attach_overlay_host(_overlay_host, _grid_buttons.size(), _get_cell_rect)
+
+func _get_cell_rect(cell: Vector2i) -> Rect2:
+	var button: Button = _grid_buttons.get(cell, null)
+	return button.get_global_rect() if button else Rect2()
+
+## Reuses existing cell buttons keyed by coordinate; only cells that appear or
+## disappear with a grid resize create or free nodes.
 func _populate_grid_buttons() -> void:
-	_grid_buttons.clear()
-	for child in _grid_container.get_children():
-		child.queue_free()
 	var inventory: Node = _get_inventory()
-	var grid: Array = []
-	if inventory:
-		grid = inventory.get_grid()
 	var height: int = 5
 	var width: int = 6
-	if not grid.is_empty():
-		height = grid.size()
-		width = (grid[0] as Array).size()
+	if inventory:
+		var size: Vector2i = inventory.get_grid_size()
+		width = size.x
+		height = size.y
 	_grid_container.columns = width
 	_grid_container.custom_minimum_size = Vector2(width * 64, height * 64)
+	for cell in _grid_buttons.keys():
+		if cell.x >= width or cell.y >= height:
+			_grid_buttons[cell].queue_free()
+			_grid_buttons.erase(cell)
 	for y in height:
 		for x in width:
-			var button := Button.new()
-			button.focus_mode = Control.FOCUS_NONE
-			button.toggle_mode = false
-			button.text = ""
-			button.tooltip_text = "Slot %d,%d" % [x, y]
-			button.pressed.connect(_on_grid_cell_pressed.bind(Vector2i(x, y)))
-			button.mouse_entered.connect(_on_grid_cell_hovered.bind(Vector2i(x, y)))
-			button.mouse_exited.connect(_clear_preview)
-			_grid_container.add_child(button)
-			_grid_buttons[Vector2i(x, y)] = button
+			var cell := Vector2i(x, y)
+			var button: Button = _grid_buttons.get(cell, null)
+			if button == null:
+				button = Button.new()
+				button.focus_mode = Control.FOCUS_NONE
+				button.toggle_mode = false
+				button.text = ""
+				button.tooltip_text = "Slot %d,%d" % [x, y]
+				button.pressed.connect(_on_grid_cell_pressed.bind(cell))
+				button.mouse_entered.connect(_on_grid_cell_hovered.bind(cell))
+				button.mouse_exited.connect(_dismiss_preview)
+				_grid_container.add_child(button)
+				_grid_buttons[cell] = button
+			# GridContainer places children in row-major order.
+			var index := y * width + x
+			if button.get_index() != index:
+				_grid_container.move_child(button, index)
 
 func _on_grid_cell_pressed(cell: Vector2i) -> void:
 	var inventory: Node = _get_inventory()
 	if inventory == null:
 		return
-	var grid: Array = inventory.get_grid()
 	var feedback: Node = _get_feedback_service()
-	if cell.y < grid.size():
-		var row: Array = grid[cell.y] as Array
-		if cell.x < row.size() and row[cell.x] != null:
-			inventory.remove_installed(StringName(row[cell.x]))
-			if feedback:
-				feedback.play_action_feedback(&"module_removed")
-			return
+	var occupant: StringName = inventory.get_module_at(cell)
+	if not occupant.is_empty():
+		inventory.remove_installed(occupant)
+		if feedback:
+			feedback.play_action_feedback(&"module_removed")
+		return
 	if _selected_item_id.is_empty():
 		return
 	var result: Dictionary = inventory.evaluate_placement(_selected_item_id, cell, _current_rotation)
 	if bool(result.get("valid", false)):
 		inventory.place_item(_selected_item_id, cell, _current_rotation)
 		_selected_item_id = StringName("")
+		_dismiss_preview()
 		_refresh_inventory_selection()
 		if feedback:
 			feedback.play_action_feedback(&"module_equipped")
 	else:
-		_apply_preview(result.get("footprint", []), result.get("conflicts", []), false)
+		_show_placement_preview(result)
 		if feedback:
 			feedback.play_action_feedback(&"module_invalid")
 
 func _on_grid_cell_hovered(cell: Vector2i) -> void:
 	if _selected_item_id.is_empty():
-		_clear_preview()
+		_dismiss_preview()
 		return
 	var inventory: Node = _get_inventory()
 	if inventory == null:
 		return
-	var result: Dictionary = inventory.evaluate_placement(_selected_item_id, cell, _current_rotation)
+	_show_placement_preview(inventory.preview_placement(_selected_item_id, cell, _current_rotation))
+
+func _dismiss_preview() -> void:
+	var feedback: Node = _get_feedback_service()
+	if feedback:
+		feedback.clear_preview()
+	_clear_preview()
+
+## Draws through the feedback service's pooled overlays when attached, which
+## coalesces rapid hovers to one redraw per frame.
+func _show_placement_preview(result: Dictionary) -> void:
 	var footprint: Array = result.get("footprint", []) as Array
 	var conflicts: Array = result.get("conflicts", []) as Array
 	var valid: bool = bool(result.get("valid", false))
-	_apply_preview(footprint, conflicts, valid)
 	var feedback: Node = _get_feedback_service()
-	if valid:
-		if feedback:
+	if feedback and feedback.has_overlay_host():
+		if valid:
 			feedback.show_valid_preview(footprint)
-	else:
-		if feedback:
-			feedback.show_invalid_preview(conflicts)
+		else:
+			feedback.show_invalid_preview(footprint, conflicts)
+		return
+	_apply_preview(footprint, conflicts, valid)
 
 func _apply_preview(cells: Array, conflicts: Array, valid: bool) -> void:
 	_clear_preview()
-	var highlight_color := VALID_PREVIEW_COLOR if valid else INVALID_PREVIEW_COLOR
+	# Invalid previews only mark the blocking cells red.
+	var highlight_color := VALID_PREVIEW_COLOR
+	if not valid:
+		highlight_color = NEUTRAL_PREVIEW_COLOR if not conflicts.is_empty() else INVALID_PREVIEW_COLOR
 	for cell_variant in cells:
 		var cell := Vector2i(cell_variant)
 		var button: Button = _grid_buttons.get(cell, null)
@@ -142,23 +195,44 @@ func _clear_preview() -> void:
 	for cell in _hovered_cells:
 		var button: Button = _grid_buttons.get(cell, null)
 		if button:
-			button.self_modulate = DEFAULT_COLOR
+			button.self_modulate = OCCUPIED_COLOR if not button.text.is_empty() else DEFAULT_COLOR
 	_hovered_cells.clear()
 
+## Diffs the carry list against the existing rows: rows for items still
+## carried keep their node and connection and only have text, tooltip and
+## order refreshed.
 func _on_inventory_changed(carry: Array, _installed: Dictionary) -> void:
 	_carried_catalog.clear()
-	_clear_inventory_list()
+	for entry in carry:
+		_carried_catalog[StringName(entry.get("id", ""))] = entry
+	for item_id in _inventory_buttons.keys():
+		if not _carried_catalog.has(item_id):
+			_inventory_buttons[item_id].queue_free()
+			_inventory_buttons.erase(item_id)
+	var index := 0
 	for entry in carry:
 		var item_id := StringName(entry.get("id", ""))
-		_carried_catalog[item_id] = entry
-		var button := Button.new()
-		button.text = "%s · %d load" % [entry.get("name", "Module"), int(entry.get("burden", 0))]
-		button.size_flags_horizontal = Control.SIZE_FILL
-		button.tooltip_text = _build_item_tooltip(entry)
-		button.toggle_mode = true
-		button.set_meta("item_id", item_id)
-		button.pressed.connect(_on_inventory_item_pressed.bind(item_id))
-		_inventory_list.add_child(button)
+		var button: Button = _inventory_buttons.get(item_id, null)
+		if button == null:
+			button = Button.new()
+			button.size_flags_horizontal = Control.SIZE_FILL
+			button.toggle_mode = true
+			button.set_meta("item_id", item_id)
+			button.pressed.connect(_on_inventory_item_pressed.bind(item_id))
+			_inventory_list.add_child(button)
+			_inventory_buttons[item_id] = button
+		var text := "%s · %d load" % [entry.get("name", "Module"), int(entry.get("burden", 0))]
+		var count := int(entry.get("count", 1))
+		if count > 1:
+			text += " ×%d" % count
+		if button.text != text:
+			button.text = text
+		var tooltip := _build_item_tooltip(entry)
+		if button.tooltip_text != tooltip:
+			button.tooltip_text = tooltip
+		if button.get_index() != index:
+			_inventory_list.move_child(button, index)
+		index += 1
 	_refresh_inventory_selection()
 
 func _on_grid_updated(grid: Array) -> void:
@@ -177,6 +251,16 @@ func _on_grid_updated(grid: Array) -> void:
 					button.text = "●"
 					button.self_modulate = OCCUPIED_COLOR
 
+func _on_grid_cells_changed(_version: int, cells: Array[Vector2i], module_ids: Array[StringName]) -> void:
+	_clear_preview()
+	for index in cells.size():
+		var button: Button = _grid_buttons.get(cells[index], null)
+		if button == null:
+			continue
+		var occupied := not module_ids[index].is_empty()
+		button.text = "●" if occupied else ""
+		button.self_modulate = OCCUPIED_COLOR if occupied else DEFAULT_COLOR
+
 func _on_inventory_item_pressed(item_id: StringName) -> void:
 	if _selected_item_id == item_id:
 		_selected_item_id = StringName("")
@@ -188,14 +272,11 @@ func _on_inventory_item_pressed(item_id: StringName) -> void:
 			_format_costs(entry.get("dice_costs", []))
 		]
 	_refresh_inventory_selection()
-	_clear_preview()
+	_dismiss_preview()
 
 func _refresh_inventory_selection() -> void:
-	for child in _inventory_list.get_children():
-		if child is Button:
-			var button: Button = child
-			var item_id: StringName = StringName(button.get_meta("item_id", ""))
-			button.button_pressed = (item_id == _selected_item_id)
+	for item_id in _inventory_buttons:
+		_inventory_buttons[item_id].set_pressed_no_signal(item_id == _selected_item_id)
 
 func _on_rotate_left() -> void:
 	_current_rotation = int((_current_rotation + 270) % 360)
@@ -214,16 +295,18 @@ func _on_remove_pressed() -> void:
 	inventory.remove_installed(_selected_item_id)
 	_selected_item_id = StringName("")
 	_refresh_inventory_selection()
-	_clear_preview()
+	_dismiss_preview()
 
 func _on_clear_pressed() -> void:
 	var inventory: Node = _get_inventory()
 	if inventory == null:
 		return
 	var installed: Dictionary = inventory.get_installed_items()
+	inventory.begin_batch()
 	for module_id in installed.keys():
 		inventory.remove_installed(StringName(module_id))
-	_clear_preview()
+	inventory.commit()
+	_dismiss_preview()
 
 func _on_burden_changed(total: int, state: StringName) -> void:
 	var critical := int(_burden_thresholds.get("critical", max(1, total)))
@@ -251,8 +334,8 @@ func _on_loadout_changed(loadout: Dictionary) -> void:
 	_hint_label.text = "\n".join(lines)
 
 func _on_feedback_preview(_state: StringName, _cells: Array) -> void:
-	# Preview already handled locally; hook retained for overlay pooling.
-	pass
+	# Overlays now carry the preview; drop any local tint from the fallback path.
+	_clear_preview()
 
 func _build_item_tooltip(entry: Dictionary) -> String:
 	var burden := int(entry.get("burden", 0))
@@ -275,24 +358,8 @@ func _format_costs(costs: Array) -> String:
 		parts.append(String(cost).capitalize())
 	return ", ".join(parts)
 
-func _clear_inventory_list() -> void:
-	for node in _inventory_list.get_children():
-		node.queue_free()
-
 func _get_inventory():
-	var tree := get_tree()
-	if tree:
-		var root := tree.get_root()
-		var path := NodePath("EquipmentInventoryModel")
-		if root.has_node(path):
-			return root.get_node(path)
-	return null
+	return ServiceRegistry.get_equipment_inventory()
 
 func _get_feedback_service():
-	var tree := get_tree()
-	if tree:
-		var root := tree.get_root()
-		var path := NodePath("EquipmentFeedbackService")
-		if root.has_node(path):
-			return root.get_node(path)
-	return null
+	return ServiceRegistry.get_equipment_feedback()
@@ -50,11 +50,12 @@ func refresh() -> void:
 	var threat_meter = _get_threat_meter()
 	if not ledger:
 		return
-	_on_health_changed(ledger.get_health(), ledger.max_health)
-	_on_materials_changed(ledger.get_materials(), ledger.max_materials)
-	_on_oxygen_changed(ledger.get_oxygen(), ledger.max_oxygen)
+	var view: PackedInt32Array = ledger.get_packed_view()
+	_on_health_changed(view[ResourceLedgerSingleton.VIEW_HEALTH], view[ResourceLedgerSingleton.VIEW_MAX_HEALTH])
+	_on_materials_changed(view[ResourceLedgerSingleton.VIEW_MATERIALS], view[ResourceLedgerSingleton.VIEW_MAX_MATERIALS])
+	_on_oxygen_changed(view[ResourceLedgerSingleton.VIEW_OXYGEN], view[ResourceLedgerSingleton.VIEW_MAX_OXYGEN])
 	if threat_meter and threat_meter.has_method("update_threat"):
-		threat_meter.update_threat(ledger.get_threat(), ledger.max_threat)
+		threat_meter.update_threat(view[ResourceLedgerSingleton.VIEW_THREAT], view[ResourceLedgerSingleton.VIEW_MAX_THREAT])
 
 func _on_health_changed(current: int, max_value: int) -> void:
 	_update_meter(_health_bar, _health_label, "Health", current, max_value, "health")
@@ -119,13 +120,7 @@ func _color_for_status(status: StringName) -> Color:
 			return NORMAL_COLOR
 
 func _get_resource_ledger():
-	var tree := get_tree()
-	if tree == null:
-		return null
-	var root := tree.get_root()
-	if root and root.has_node("ResourceLedger"):
-		return root.get_node("ResourceLedger")
-	return null
+	return ServiceRegistry.get_resource_ledger()
 
 func _get_threat_meter():
 	if _threat_meter_node and _threat_meter_node.has_method("update_threat"):
@@ -109,8 +109,8 @@ func _connect_services() -> void:
 		_on_room_queue_updated(_room_queue_service.get_queue())
 	_threat_service = _get_threat_service()
 	if _threat_service != null:
-		if not _threat_service.threats_updated.is_connected(_on_threats_updated):
-			_threat_service.threats_updated.connect(_on_threats_updated)
+		if not _threat_service.threats_changed.is_connected(_on_threats_changed):
+			_threat_service.threats_changed.connect(_on_threats_changed)
 		_on_threats_updated(_threat_service.get_threats())
 	_event_resolver = _get_event_resolver()
 	if _event_resolver != null:
@@ -502,6 +502,30 @@ func _on_threats_updated(threats: Array[Dictionary]) -> void:
 	if _selected_room.is_empty() and not _current_threats.is_empty():
 		_select_threat_index(0)
 
+func _on_threats_changed(turn: int, changed: Array[Dictionary], removed: PackedStringArray) -> void:
+	for threat_id in removed:
+		for index in _current_threats.size():
+			if String(_current_threats[index].get("id", "")) == threat_id:
+				_current_threats.remove_at(index)
+				break
+		if threat_id == _selected_threat_id:
+			_selected_threat_id = ""
+	for threat in changed:
+		var threat_id := String(threat.get("id", ""))
+		var replaced := false
+		for index in _current_threats.size():
+			if String(_current_threats[index].get("id", "")) == threat_id:
+				_current_threats[index] = threat
+				replaced = true
+				break
+		if not replaced:
+			_current_threats.append(threat)
+	for threat in _current_threats:
+		threat["timer"] = max(0, int(threat.get("next_attack_turn", turn + 1)) - turn - 1)
+	_refresh_threat_list()
+	if _selected_room.is_empty() and _selected_threat_id.is_empty() and not _current_threats.is_empty():
+		_select_threat_index(0)
+
 func _on_room_selected(index: int, room: Dictionary) -> void:
 	_selected_room = room
 	var summary: String = String(room.get("summary", "Uncharted module."))
@@ -541,40 +565,22 @@ func _clear_children(container: Node) -> void:
 		node.queue_free()
 
 func _get_room_service():
-	var tree := get_tree()
-	if tree and tree.get_root().has_node("RoomQueueService"):
-		return tree.get_root().get_node("RoomQueueService")
-	return null
+	return ServiceRegistry.get_room_queue_service()
 
 func _get_threat_service():
-	var tree := get_tree()
-	if tree and tree.get_root().has_node("ThreatService"):
-		return tree.get_root().get_node("ThreatService")
-	return null
+	return ServiceRegistry.get_threat_service()
 
 func _get_event_resolver():
-	var tree := get_tree()
-	if tree and tree.get_root().has_node("EventResolver"):
-		return tree.get_root().get_node("EventResolver")
-	return null
+	return ServiceRegistry.get_event_resolver()
 
 func _get_inventory_model() -> Node:
-	var tree := get_tree()
-	if tree and tree.get_root().has_node("EquipmentInventoryModel"):
-		return tree.get_root().get_node("EquipmentInventoryModel")
-	return null
+	return ServiceRegistry.get_equipment_inventory()
 
 func _get_tutorial_service() -> Node:
-	var tree := get_tree()
-	if tree and tree.get_root().has_node("TutorialService"):
-		return tree.get_root().get_node("TutorialService")
-	return null
+	return ServiceRegistry.get_tutorial_service()
 
 func _get_telemetry_hub() -> Node:
-	var tree := get_tree()
-	if tree and tree.get_root().has_node("TelemetryHub"):
-		return tree.get_root().get_node("TelemetryHub")
-	return null
+	return ServiceRegistry.get_telemetry_hub()
 
 func _record_ui_event(event_name: String, payload: Dictionary) -> void:
 	if _telemetry_hub and _telemetry_hub.has_method("record"):
@@ -684,10 +690,10 @@ func _on_loot_awarded(loot: Dictionary) -> void:
 	var item_id: String = String(loot.get("id", ""))
 	var display_name: String = item_id
 	var inventory: Node = _get_inventory_model()
-	if inventory and inventory.has_method("get_catalog"):
-		var catalog: Dictionary = inventory.get_catalog()
-		if catalog.has(item_id):
-			display_name = catalog[item_id].get("name", item_id.capitalize())
+	if inventory and inventory.has_method("get_module_name"):
+		var module_name: String = inventory.get_module_name(StringName(item_id))
+		if not module_name.is_empty():
+			display_name = module_name
 	_show_banner("Loot acquired: %s" % display_name, false)
 
 func _on_equipment_placement_failed(reason: String) -> void:
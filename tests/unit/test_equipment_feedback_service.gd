@@ -0,0 +1,66 @@
+extends GutTest
+
+var feedback_script := load("res://scripts/services/equipment_feedback_service.gd")
+var feedback: Node = null
+var host: Control = null
+
+func before_each() -> void:
+	feedback = feedback_script.new()
+	add_child_autofree(feedback)
+	host = Control.new()
+	add_child_autofree(host)
+	feedback.attach_overlay_host(host, 4, func(cell: Vector2i) -> Rect2:
+		return Rect2(Vector2(cell) * 64.0, Vector2(64, 64))
+	)
+	await wait_for_frames(1)
+
+func after_each() -> void:
+	feedback = null
+	host = null
+
+func test_overlays_are_prewarmed_per_cell() -> void:
+	assert_eq(host.get_child_count(), 12, "One valid, one invalid and one neutral overlay per cell.")
+	assert_eq(feedback.get_active_overlay_count(), 0)
+
+func test_only_last_preview_per_frame_is_drawn() -> void:
+	var updates: Array = []
+	feedback.preview_updated.connect(func(state: StringName, cells: Array) -> void:
+		updates.append([state, cells.size()])
+	)
+	feedback.show_valid_preview([Vector2i(0, 0), Vector2i(1, 0)])
+	feedback.show_invalid_preview([Vector2i(0, 0), Vector2i(0, 1), Vector2i(1, 1)])
+	await wait_for_frames(1)
+	assert_eq(updates.size(), 1)
+	assert_eq(updates[0][0], &"invalid")
+	assert_eq(feedback.get_active_overlay_count(), 3)
+	assert_eq(host.get_child_count(), 12, "Previews reuse pooled overlays.")
+
+func test_clear_returns_overlays_to_pool() -> void:
+	feedback.show_valid_preview([Vector2i(0, 0)])
+	feedback.flush_preview()
+	assert_eq(feedback.get_active_overlay_count(), 1)
+	feedback.clear_preview()
+	feedback.flush_preview()
+	assert_eq(feedback.get_active_overlay_count(), 0)
+	feedback.show_valid_preview([Vector2i(0, 0), Vector2i(1, 0), Vector2i(0, 1), Vector2i(1, 1)])
+	feedback.flush_preview()
+	assert_eq(feedback.get_active_overlay_count(), 4)
+
+func test_invalid_preview_only_tints_conflicts() -> void:
+	feedback.show_invalid_preview([Vector2i(0, 0), Vector2i(1, 0), Vector2i(1, 1)], [Vector2i(1, 1)])
+	feedback.flush_preview()
+	var red := 0
+	var neutral := 0
+	for overlay in host.get_children():
+		if not overlay.visible:
+			continue
+		if overlay.color == feedback_script.INVALID_OVERLAY_COLOR:
+			red += 1
+		elif overlay.color == feedback_script.NEUTRAL_OVERLAY_COLOR:
+			neutral += 1
+	assert_eq(red, 1)
+	assert_eq(neutral, 2)
+
+func wait_for_frames(count: int) -> void:
+	for _i in count:
+		await get_tree().process_frame
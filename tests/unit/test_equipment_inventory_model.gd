@@ -17,6 +17,7 @@ func test_add_loot_moves_item_to_carry() -> void:
 	assert_eq(carry.size(), 1, "Carry should contain one entry.")
 	assert_eq(carry[0].get("id"), "ion_blaster")
 	assert_eq(int(carry[0].get("burden", -1)), 2)
+	assert_eq(carry[0].get("rarity"), &"common", "Rarity comes from the shared loot lookup.")
 
 func test_place_item_marks_grid_and_updates_burden() -> void:
 	inventory.add_loot(&"ion_blaster")
@@ -52,6 +53,162 @@ func test_slot_bindings_emit_for_module() -> void:
 	inventory.place_item(&"ion_blaster", Vector2i(0, 0), 0)
 	assert_true(observed_slots.has(&"die_strength"), "Strength slot should be bound when Ion Blaster equipped.")
 
+func test_occupancy_queries_follow_placement_and_removal() -> void:
+	inventory.add_loot(&"seeker_array")
+	assert_true(inventory.place_item(&"seeker_array", Vector2i(5, 2), 0))
+	assert_true(inventory.is_cell_occupied(Vector2i(5, 4)))
+	assert_eq(inventory.get_module_at(Vector2i(5, 3)), &"seeker_array")
+	assert_false(inventory.is_cell_occupied(Vector2i(4, 3)))
+	var blocked: Dictionary = inventory.evaluate_placement(&"seeker_array", Vector2i(5, 0), 0)
+	assert_eq(blocked.get("reason"), &"occupied")
+	assert_eq((blocked.get("conflicts", []) as Array).size(), 1)
+	var overflow: Dictionary = inventory.evaluate_placement(&"seeker_array", Vector2i(0, 3), 0)
+	assert_eq(overflow.get("reason"), &"out_of_bounds")
+	inventory.remove_installed(&"seeker_array")
+	assert_false(inventory.is_cell_occupied(Vector2i(5, 4)))
+	assert_eq(inventory.get_module_at(Vector2i(5, 3)), &"")
+
+func test_reload_catalog_rebuilds_rotated_masks() -> void:
+	inventory.reload_catalog()
+	assert_true(inventory.can_place(&"seeker_array", Vector2i(3, 4), 90))
+	assert_false(inventory.can_place(&"seeker_array", Vector2i(4, 4), 90))
+	assert_true(inventory.can_place(&"seeker_array", Vector2i(0, 2), 180))
+	assert_false(inventory.can_place(&"seeker_array", Vector2i(0, 3), 180))
+
+func test_placement_map_matches_evaluate_and_refreshes_on_mutation() -> void:
+	var empty_map: PackedByteArray = inventory.compute_placement_map(&"seeker_array", 0)
+	assert_eq(empty_map.size(), 30)
+	assert_eq(empty_map[0], 1)
+	assert_eq(empty_map[3 * 6], 0, "Vertical piece cannot start on row 3 of a 5-row grid.")
+	inventory.add_loot(&"ion_blaster")
+	inventory.place_item(&"ion_blaster", Vector2i(0, 0), 0)
+	var placement_map: PackedByteArray = inventory.compute_placement_map(&"seeker_array", 0)
+	for y in 5:
+		for x in 6:
+			var expected: bool = inventory.can_place(&"seeker_array", Vector2i(x, y), 0)
+			assert_eq(placement_map[y * 6 + x] == 1, expected, "Mismatch at %d,%d" % [x, y])
+
+func test_preview_placement_matches_evaluate() -> void:
+	inventory.add_loot(&"ion_blaster")
+	inventory.place_item(&"ion_blaster", Vector2i(0, 0), 0)
+	for origin in [Vector2i(0, 0), Vector2i(2, 1), Vector2i(5, 4), Vector2i(-1, 0)]:
+		var preview: Dictionary = inventory.preview_placement(&"seeker_array", origin, 0)
+		var evaluated: Dictionary = inventory.evaluate_placement(&"seeker_array", origin, 0)
+		assert_eq(preview["valid"], evaluated["valid"], "Validity mismatch at %s" % origin)
+		assert_eq(preview["footprint"], evaluated["footprint"], "Footprint mismatch at %s" % origin)
+
+func test_grid_cells_changed_reports_only_footprint() -> void:
+	var deltas: Array = []
+	inventory.grid_cells_changed.connect(func(version: int, cells: Array[Vector2i], module_ids: Array[StringName]) -> void:
+		deltas.append({"version": version, "cells": cells, "module_ids": module_ids})
+	)
+	var start_version: int = inventory.get_grid_version()
+	inventory.add_loot(&"seeker_array")
+	inventory.place_item(&"seeker_array", Vector2i(2, 1), 0)
+	assert_eq(deltas.size(), 1)
+	assert_eq(deltas[0]["version"], start_version + 1)
+	assert_eq((deltas[0]["cells"] as Array).size(), 3)
+	assert_true((deltas[0]["cells"] as Array).has(Vector2i(2, 3)))
+	assert_eq(deltas[0]["module_ids"][0], &"seeker_array")
+	inventory.remove_installed(&"seeker_array")
+	assert_eq(deltas.size(), 2)
+	assert_eq((deltas[1]["cells"] as Array).size(), 3)
+	assert_eq(deltas[1]["module_ids"][2], &"")
+	assert_eq(inventory.get_grid_version(), start_version + 2)
+
+func test_find_placement_prefers_corner_on_empty_grid() -> void:
+	var suggestion: Dictionary = inventory.find_placement(&"ion_blaster")
+	assert_true(suggestion.get("valid", false))
+	assert_eq(suggestion.get("origin"), Vector2i(0, 0))
+	assert_eq(suggestion.get("rotation"), 0)
+	assert_eq(suggestion.get("burden_state"), &"safe")
+
+func test_auto_arrange_packs_carry_within_budget() -> void:
+	var finished: Array = []
+	inventory.auto_arrange_finished.connect(func(placements: Array[Dictionary], unplaced: Array[StringName]) -> void:
+		finished.append([placements, unplaced])
+	)
+	inventory.add_loot(&"ion_blaster")
+	inventory.add_loot(&"seeker_array")
+	inventory.add_loot(&"oxygen_siphon")
+	inventory.start_auto_arrange()
+	assert_true(inventory.is_arranging())
+	var steps := 0
+	while not inventory.step_auto_arrange(200):
+		steps += 1
+		assert_lt(steps, 1000, "Search should settle well inside the time budget.")
+	assert_false(inventory.is_arranging())
+	assert_eq(finished.size(), 1)
+	assert_eq((finished[0][0] as Array).size(), 3)
+	assert_eq((finished[0][1] as Array).size(), 0)
+	assert_eq(inventory.get_carry_items().size(), 0)
+	assert_eq(inventory.get_total_burden(), 9)
+
+func test_catalog_index_answers_without_loading_modules() -> void:
+	assert_true(inventory.has_module(&"oxygen_siphon"))
+	assert_false(inventory.has_module(&"missing_module"))
+	assert_eq(inventory.get_module_name(&"seeker_array"), "Seeker Array")
+	var loot_ids: Array[StringName] = inventory.get_loot_module_ids()
+	assert_true(loot_ids.has(&"oxygen_siphon"))
+	inventory.prefetch_modules(loot_ids)
+	inventory.add_loot(&"oxygen_siphon")
+	var carry: Array = inventory.get_carry_items()
+	assert_eq(carry.size(), 1)
+	assert_eq(int(carry[0].get("burden", -1)), 4)
+
+func test_carry_stacks_duplicates_with_stable_handle() -> void:
+	inventory.add_loot(&"ion_blaster")
+	var handle: int = inventory.get_carry_handle(&"ion_blaster")
+	var first_view: Array = inventory.get_carry_items()
+	assert_same(inventory.get_carry_items(), first_view, "View is shared until the carry changes.")
+	inventory.add_loot(&"ion_blaster")
+	inventory.add_loot(&"seeker_array")
+	var carry: Array = inventory.get_carry_items()
+	assert_eq(carry.size(), 2)
+	assert_eq(int(carry[0].get("count", 0)), 2)
+	assert_eq(int(carry[0].get("handle", 0)), handle)
+	assert_eq(first_view.size(), 1, "Earlier views are left untouched.")
+	inventory.place_item(&"ion_blaster", Vector2i(0, 0), 0)
+	assert_eq(inventory.get_carry_count(&"ion_blaster"), 1)
+	assert_eq(inventory.get_carry_handle(&"ion_blaster"), handle)
+
+func test_batch_coalesces_signals_until_commit() -> void:
+	var counts := {"inventory": 0, "grid": 0, "burden": 0}
+	inventory.inventory_changed.connect(func(_carry: Array[Dictionary], _installed: Dictionary) -> void:
+		counts["inventory"] += 1
+	)
+	inventory.grid_cells_changed.connect(func(_version: int, _cells: Array[Vector2i], _ids: Array[StringName]) -> void:
+		counts["grid"] += 1
+	)
+	inventory.burden_changed.connect(func(_total: int, _state: StringName) -> void:
+		counts["burden"] += 1
+	)
+	inventory.begin_batch()
+	inventory.add_loot(&"ion_blaster")
+	inventory.add_loot(&"seeker_array")
+	inventory.place_item(&"ion_blaster", Vector2i(0, 0), 0)
+	inventory.place_item(&"seeker_array", Vector2i(5, 0), 0)
+	assert_true(inventory.is_batching())
+	assert_eq(counts["inventory"], 0)
+	inventory.commit()
+	assert_false(inventory.is_batching())
+	assert_eq(counts["inventory"], 1)
+	assert_eq(counts["grid"], 1)
+	assert_eq(counts["burden"], 1)
+	assert_eq(inventory.get_total_burden(), 5)
+
+func test_apply_snapshot_emits_once() -> void:
+	inventory.add_loot(&"ion_blaster")
+	inventory.place_item(&"ion_blaster", Vector2i(1, 1), 0)
+	var snapshot: Dictionary = inventory.get_snapshot()
+	var emissions: Array = [0]
+	inventory.inventory_changed.connect(func(_carry: Array[Dictionary], _installed: Dictionary) -> void:
+		emissions[0] += 1
+	)
+	inventory.apply_snapshot(snapshot)
+	assert_eq(emissions[0], 1)
+	assert_eq(inventory.get_module_at(Vector2i(2, 1)), &"ion_blaster")
+
 func wait_for_frames(count: int) -> void:
 	for _i in count:
 		await get_tree().process_frame
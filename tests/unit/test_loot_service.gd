@@ -17,6 +17,34 @@ func test_roll_loot_returns_candidate() -> void:
 	assert_true(loot.has("id"))
 	assert_true(loot.get("id") != "")
 
+func test_loot_reports_rarity_from_index() -> void:
+	var loot: Dictionary = loot_service.roll_loot_for_room({"id": "vault", "tags": ["clue"]})
+	assert_eq(loot.get("id"), "seeker_array")
+	assert_eq(loot.get("rarity"), "uncommon")
+	assert_eq(loot_service.get_rarity("ion_blaster"), "common")
+
+func test_rarity_weights_shape_rolls() -> void:
+	var table := LootTableDefinition.new()
+	table.rarity_weights = {&"common": 1.0, &"mythic": 0.0}
+	for entry_data in [["scrap", &"common"], ["relic", &"mythic"]]:
+		var module := EquipmentModuleResource.new()
+		module.module_id = StringName(entry_data[0])
+		var entry := LootEntryDefinition.new()
+		entry.module = module
+		entry.rarity = entry_data[1]
+		entry.room_tags = [&"cache"]
+		table.entries.append(entry)
+	loot_service.set_loot_table(table)
+	for _i in 20:
+		var loot: Dictionary = loot_service.roll_loot_for_room({"id": "hold", "tags": ["cache"]})
+		assert_eq(loot.get("id"), "scrap", "Zero-weight rarities never drop while others can.")
+
+func test_loot_ids_match_equipment_catalog() -> void:
+	var index: LootLookupIndex = loot_service.get_lookup_index()
+	var catalog := load("res://resources/config/equipment_catalog_index.tres") as EquipmentCatalogIndex
+	for item_id in index.item_ids:
+		assert_true(catalog.find(item_id) >= 0, "Loot item %s should be an equipment module." % item_id)
+
 func wait_for_frames(count: int) -> void:
 	for _i in count:
 		await get_tree().process_frame
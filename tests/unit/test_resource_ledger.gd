@@ -28,6 +28,7 @@ func test_setters_clamp_and_emit() -> void:
 func test_snapshot_persistence_roundtrip() -> void:
 	ledger.adjust_materials(-4)
 	ledger.adjust_oxygen(-2)
+	ledger.flush_now()
 	var snapshot := save_service.get_run_snapshot()
 	assert_not_null(snapshot)
 	assert_eq(snapshot.materials, ledger.get_materials())
@@ -48,3 +49,139 @@ func test_threshold_cross_emits() -> void:
 	ledger.set_threat(95)
 	assert_true(levels.has("warning"))
 	assert_true(levels.has("critical"))
+
+func test_apply_deltas_persists_once_and_coalesces_signals() -> void:
+	var counts := {"saves": 0, "health": 0, "threat": 0}
+	save_service.snapshot_updated.connect(func(_snapshot: ResourceSnapshot) -> void:
+		counts.saves += 1
+	)
+	ledger.health_changed.connect(func(_current: int, _max: int) -> void:
+		counts.health += 1
+	)
+	ledger.threat_changed.connect(func(_current: int, _max: int) -> void:
+		counts.threat += 1
+	)
+	ledger.apply_deltas({"materials": -2, "oxygen": -1, "health": -1, "threat": 3})
+	ledger.flush_now()
+	assert_eq(counts.saves, 1, "Batched deltas should persist exactly once.")
+	assert_eq(counts.health, 1)
+	assert_eq(counts.threat, 1)
+	assert_eq(ledger.get_health(), ledger.max_health - 1)
+	assert_eq(save_service.get_run_snapshot().threat, 3)
+
+func test_nested_batch_flushes_on_outer_commit() -> void:
+	var levels: Array[StringName] = []
+	ledger.threat_threshold_crossed.connect(func(level: StringName) -> void:
+		levels.append(level)
+	)
+	ledger.begin_batch()
+	ledger.set_threat(70)
+	ledger.begin_batch()
+	ledger.set_threat(90)
+	ledger.commit()
+	assert_true(levels.is_empty(), "Inner commit should not flush.")
+	ledger.commit()
+	assert_eq(levels.size(), 1, "Threshold crossing should be reported once per batch.")
+	assert_eq(levels[0], &"critical")
+	assert_false(ledger.is_batching())
+
+func test_persistence_is_deferred_until_flush() -> void:
+	ledger.flush_now()
+	var saves := {"count": 0}
+	save_service.snapshot_updated.connect(func(_snapshot: ResourceSnapshot) -> void:
+		saves.count += 1
+	)
+	for _i in 5:
+		ledger.adjust_health(-1)
+	assert_eq(saves.count, 0, "Changes should not hit the save service synchronously.")
+	assert_true(ledger.has_pending_persist())
+	await get_tree().process_frame
+	assert_eq(saves.count, 1, "Pending changes should collapse into one end-of-frame write.")
+	assert_eq(save_service.get_run_snapshot().health, ledger.get_health())
+	assert_false(ledger.has_pending_persist())
+
+func test_snapshot_is_shared_until_version_changes() -> void:
+	var first := ledger.get_snapshot()
+	var version := ledger.get_version()
+	assert_same(ledger.get_snapshot(), first, "Unchanged ledger should hand out the cached snapshot.")
+	ledger.adjust_materials(-1)
+	assert_gt(ledger.get_version(), version)
+	var second := ledger.get_snapshot()
+	assert_not_same(second, first)
+	assert_eq(second.materials, ledger.get_materials())
+	var view := ledger.get_packed_view()
+	assert_eq(view[ResourceLedgerSingleton.VIEW_MATERIALS], ledger.get_materials())
+	assert_eq(view[ResourceLedgerSingleton.VIEW_MAX_THREAT], ledger.max_threat)
+
+func test_configured_resource_uses_generic_paths() -> void:
+	var definitions: Array[ResourceDefinition] = []
+	for id in [&"health", &"materials", &"oxygen", &"threat", &"experience"]:
+		var definition := ResourceDefinition.new()
+		definition.resource_id = id
+		definition.max_value = 10
+		definition.start_full = id != &"experience" and id != &"threat"
+		definition.rising_is_danger = id == &"threat"
+		definitions.append(definition)
+	ledger.configure(definitions)
+	ledger.reset()
+	var changes: Array = []
+	ledger.resource_changed.connect(func(id: StringName, current: int, _max: int) -> void:
+		changes.append([id, current])
+	)
+	var subscribed := {"value": -1}
+	ledger.subscribe(&"experience", func(current: int, _max: int) -> void:
+		subscribed.value = current
+	)
+	ledger.apply_deltas({"experience": 4, "health": -1})
+	assert_eq(ledger.get_value(&"experience"), 4)
+	assert_eq(subscribed.value, 4)
+	assert_eq(changes.size(), 2, "Each changed resource should emit resource_changed once.")
+	var view := ledger.get_packed_view()
+	assert_eq(view[ResourceLedgerSingleton.VIEW_HEALTH], 9)
+	assert_eq(view[8], 4, "Extra resources follow the core block in the packed view.")
+	ledger.flush_now()
+	assert_eq(save_service.get_run_snapshot().extra_resources.get(&"experience", Vector2i.ZERO), Vector2i(4, 10))
+
+func test_states_follow_shared_thresholds() -> void:
+	var thresholds: ResourceThresholds = load(ledger.thresholds_path)
+	var max_materials := ledger.get_max(&"materials")
+	ledger.set_materials(int(floor(max_materials * thresholds.materials_warning)) + 1)
+	assert_eq(ledger.get_state(&"materials"), &"normal")
+	ledger.set_materials(int(floor(max_materials * thresholds.materials_warning)))
+	assert_eq(ledger.get_state(&"materials"), &"warning")
+	ledger.set_materials(int(floor(max_materials * thresholds.materials_critical)))
+	assert_eq(ledger.get_state(&"materials"), &"critical")
+
+func test_saved_snapshot_is_isolated_from_callers() -> void:
+	ledger.set_health(5)
+	ledger.flush_now()
+	var loaded := save_service.get_run_snapshot()
+	assert_not_same(loaded, ledger.get_snapshot())
+	loaded.health = 1
+	loaded.threshold_states[&"health"] = &"critical"
+	assert_eq(save_service.get_run_snapshot().health, 5)
+	assert_ne(save_service.get_run_snapshot().state_for(&"health"), &"critical")
+
+func test_lowering_max_clamps_value_and_updates_state() -> void:
+	var crossings: Array = []
+	ledger.threshold_crossed.connect(func(id: StringName, level: StringName) -> void:
+		crossings.append([id, level])
+	)
+	ledger.set_threat(50)
+	ledger.flush_now()
+	ledger.set_max(&"threat", 40)
+	assert_eq(ledger.get_threat(), 40)
+	assert_eq(ledger.get_state(&"threat"), &"critical")
+	assert_eq(crossings.back(), [&"threat", &"critical"])
+	assert_true(ledger.has_pending_persist())
+	ledger.flush_now()
+	assert_eq(save_service.get_run_snapshot().max_threat, 40)
+
+func test_reset_reports_threshold_drop() -> void:
+	ledger.set_threat(90)
+	var levels: Array = []
+	ledger.threat_threshold_crossed.connect(func(level: StringName) -> void:
+		levels.append(level)
+	)
+	ledger.reset()
+	assert_eq(levels, [&"normal"])
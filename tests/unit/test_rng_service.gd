@@ -0,0 +1,46 @@
+extends GutTest
+
+var rng_script := load("res://scripts/autoload/rng_service.gd")
+var rng_service: Node = null
+
+func before_each() -> void:
+	rng_service = rng_script.new()
+	add_child_autofree(rng_service)
+	await wait_for_frames(1)
+
+func after_each() -> void:
+	rng_service = null
+
+func test_same_seed_reproduces_each_stream() -> void:
+	rng_service.start_run(1234)
+	var rooms: RandomNumberGenerator = rng_service.get_stream(&"room_queue")
+	var first := [rooms.randi(), rooms.randi(), rooms.randi()]
+	rng_service.start_run(1234)
+	assert_same(rng_service.get_stream(&"room_queue"), rooms, "Streams are reseeded in place.")
+	assert_eq([rooms.randi(), rooms.randi(), rooms.randi()], first)
+
+func test_streams_do_not_affect_each_other() -> void:
+	rng_service.start_run(99)
+	var loot: RandomNumberGenerator = rng_service.get_stream(&"loot")
+	var expected := loot.randi()
+	rng_service.start_run(99)
+	var dice: RandomNumberGenerator = rng_service.get_stream(&"dice")
+	for _i in 10:
+		dice.randi()
+	rng_service.split_stream(&"dice", "die_0").randi()
+	assert_eq(loot.randi(), expected)
+
+func test_snapshot_restores_stream_state() -> void:
+	rng_service.start_run(7)
+	var stream: RandomNumberGenerator = rng_service.get_stream(&"loot")
+	stream.randi()
+	var snapshot: Dictionary = rng_service.get_snapshot()
+	var next := stream.randi()
+	rng_service.start_run(8)
+	rng_service.apply_snapshot(snapshot)
+	assert_eq(rng_service.get_run_seed(), 7)
+	assert_eq(stream.randi(), next)
+
+func wait_for_frames(count: int) -> void:
+	for _i in count:
+		await get_tree().process_frame
@@ -31,6 +31,69 @@ func test_cycle_replaces_top_room() -> void:
 	else:
 		assert_true(true, "Top room replaced.")
 
+func test_deck_deals_every_room_before_repeating() -> void:
+	var rooms: Array[Dictionary] = []
+	for index in 5:
+		rooms.append({"id": "room_%d" % index, "name": "Room %d" % index, "tags": ["cache"]})
+	room_service.set_room_table(rooms)
+	var seen: Dictionary = {}
+	for room in room_service.get_queue():
+		seen[room.get("id")] = true
+	seen[room_service.draw_next_room().get("id")] = true
+	seen[room_service.draw_next_room().get("id")] = true
+	for room in room_service.get_queue():
+		seen[room.get("id")] = true
+	assert_eq(seen.size(), 5, "First five draws cover the whole deck.")
+
+func test_rooms_are_shared_read_only_records() -> void:
+	var top: Dictionary = room_service.peek_next_room()
+	assert_true(top.is_read_only())
+	var entered: Dictionary = room_service.draw_next_room()
+	assert_same(entered, top)
+
+func test_queued_rooms_stream_full_definitions() -> void:
+	assert_false(room_service.peek_next_room().get("summary", "").is_empty(), "Peeking waits for the top room to load.")
+	var frames := 0
+	while room_service.is_loading() and frames < 120:
+		await wait_for_frames(1)
+		frames += 1
+	for room in room_service.get_queue():
+		assert_true(room.has("summary"), "Queued rooms are upgraded once their definition loads.")
+
+func test_weighted_draws_favor_heavy_rooms() -> void:
+	room_service.set_profile_weights(&"skewed", {"hazard": 50.0, "cache": 0.01})
+	room_service.set_weight_profile(&"skewed")
+	var rooms: Array[Dictionary] = []
+	for index in 10:
+		var tag := "hazard_high" if index == 0 else "cache"
+		rooms.append({"id": "room_%d" % index, "name": "Room %d" % index, "tags": [tag]})
+	room_service.set_room_table(rooms)
+	var hazard_first := 0
+	for _round in 20:
+		room_service.reset(true)
+		if room_service.peek_next_room().get("id") == "room_0":
+			hazard_first += 1
+	assert_gt(hazard_first, 15, "A heavily weighted room should usually be dealt first.")
+
+func test_weight_profile_ignores_unknown_names() -> void:
+	var before: StringName = room_service.get_weight_profile()
+	room_service.set_weight_profile(&"missing_profile")
+	assert_eq(room_service.get_weight_profile(), before)
+
+func test_restart_resyncs_profile_with_threat() -> void:
+	var ledger := ServiceRegistry.get_resource_ledger()
+	ledger.set_threat(ledger.max_threat)
+	assert_eq(room_service.get_weight_profile(), &"critical")
+	ledger.start_new_run(true)
+	room_service.reset(true)
+	assert_eq(room_service.get_weight_profile(), &"normal")
+	# A restored save can already be critical without a crossing being seen.
+	ledger.set_threat(ledger.max_threat)
+	room_service.set_weight_profile(&"normal")
+	room_service.reset(true)
+	assert_eq(room_service.get_weight_profile(), &"critical")
+	ledger.start_new_run(true)
+
 func wait_for_frames(count: int) -> void:
 	for _i in count:
 		await get_tree().process_frame
@@ -36,6 +36,23 @@ func test_turn_cycle_updates_ledger_and_hud_display() -> void:
 	var token_label: Label = hud.get_node("MainLayout/DiceDock/DiceViewportFrame/ViewportOverlay/DiceOverlay/OverlayVBox/AvailableDiceRow/DieToken0/VBox/ValueLabel")
 	assert_eq(token_label.text.to_int(), results[0])
 
+func test_equipment_tab_reuses_inventory_rows() -> void:
+	var inventory: Node = _fetch_autoload("EquipmentInventoryModel")
+	inventory.reset()
+	var hud: RunHudController = RUN_HUD_SCENE.instantiate()
+	add_child_autofree(hud)
+	await wait_for_frames(1)
+	var list: VBoxContainer = hud.get_node("MainLayout/MainBody/RightColumn/TabContainer/Equipment/Content/InventoryPanel/InventoryScroll/InventoryList")
+	inventory.add_loot(&"ion_blaster")
+	assert_eq(list.get_child_count(), 1)
+	var first_row: Button = list.get_child(0)
+	inventory.add_loot(&"seeker_array")
+	inventory.add_loot(&"ion_blaster")
+	assert_eq(list.get_child_count(), 2)
+	assert_same(list.get_child(0), first_row, "Existing rows are updated in place.")
+	assert_string_contains(first_row.text, "×2")
+	inventory.reset()
+
 func wait_for_frames(count: int) -> void:
 	for _i in range(count):
 		await get_tree().process_frame
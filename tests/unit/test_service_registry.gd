@@ -0,0 +1,41 @@
+extends GutTest
+
+var registry_script := load("res://scripts/autoload/service_registry.gd")
+var registry: Node = null
+
+func before_each() -> void:
+	registry = registry_script.new()
+	add_child_autofree(registry)
+	await wait_for_frames(1)
+
+func after_each() -> void:
+	registry = null
+
+func test_resolves_and_caches_autoload() -> void:
+	var ledger: Node = registry.get_service(&"ResourceLedger")
+	assert_not_null(ledger)
+	assert_same(ledger, get_tree().get_root().get_node("ResourceLedger"))
+	assert_same(ledger, registry.get_resource_ledger())
+
+func test_override_replaces_lookup_until_cleared() -> void:
+	# Typed getters cast overrides to the service script, so fakes extend it.
+	var fake: Node = load("res://scripts/services/telemetry_hub.gd").new()
+	add_child_autofree(fake)
+	registry.set_override(&"TelemetryHub", fake)
+	assert_same(registry.get_telemetry_hub(), fake)
+	registry.clear_overrides()
+	assert_not_same(registry.get_telemetry_hub(), fake)
+
+func test_freed_override_falls_back_to_tree() -> void:
+	var fake := Node.new()
+	registry.set_override(&"SaveService", fake)
+	fake.free()
+	assert_same(registry.get_save_service(), get_tree().get_root().get_node("SaveService"))
+
+func test_unknown_service_returns_null() -> void:
+	assert_null(registry.get_service(&"MissingService"))
+	assert_false(registry.has_service(&"MissingService"))
+
+func wait_for_frames(count: int) -> void:
+	for _i in count:
+		await get_tree().process_frame
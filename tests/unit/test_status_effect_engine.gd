@@ -0,0 +1,47 @@
+extends GutTest
+
+class FakeLedger:
+	extends Node
+	var calls: Array[Dictionary] = []
+
+	func apply_deltas(deltas: Dictionary) -> void:
+		calls.append(deltas.duplicate())
+
+var engine: StatusEffectEngine = null
+var ledger: FakeLedger = null
+
+func before_each() -> void:
+	engine = StatusEffectEngine.new()
+	ledger = FakeLedger.new()
+	add_child_autofree(ledger)
+
+func after_each() -> void:
+	engine = null
+	ledger = null
+
+func test_effects_aggregate_into_one_ledger_call() -> void:
+	engine.add_statuses([
+		{"id": "bleed", "label": "Bleed", "duration": 2},
+		{"id": "heat_burn", "label": "Burn", "duration": 1},
+		{"id": "oxygen_leak", "label": "Oxygen Leak", "duration": 1},
+	])
+	engine.evaluate_turn(ledger, null)
+	assert_eq(ledger.calls.size(), 1)
+	assert_eq(ledger.calls[0].get(&"health"), -2)
+	assert_eq(ledger.calls[0].get(&"oxygen"), -1)
+	assert_eq(engine.get_effect_count(), 1, "Expired effects are dropped in the same pass.")
+	engine.evaluate_turn(ledger, null)
+	assert_eq(ledger.calls[1].get(&"health"), -1)
+	assert_eq(engine.get_effect_count(), 0)
+
+func test_reapplying_status_refreshes_single_entry() -> void:
+	engine.add_effect(&"bleed", 1)
+	engine.add_effect(&"bleed", 3)
+	assert_eq(engine.get_effect_count(), 1)
+	assert_eq(engine.get_remaining(&"bleed"), 3)
+
+func test_unknown_statuses_are_ignored() -> void:
+	engine.add_effect(&"not_a_status", 2)
+	assert_eq(engine.get_effect_count(), 0)
+	engine.evaluate_turn(ledger, null)
+	assert_eq(ledger.calls.size(), 0)
@@ -51,6 +51,77 @@ func test_status_application_tracks_effects() -> void:
 	effects = threats[0].get("status_effects", []) as Array
 	assert_eq(effects.size(), 0)
 
+func test_attacks_follow_cooldown_schedule() -> void:
+	var attacks: Array[String] = []
+	threat_service.threat_attack_resolved.connect(func(threat_id: String, _attack: Dictionary) -> void:
+		attacks.append(threat_id)
+	)
+	threat_service.latch_threat({"id": "fast", "timer": 0, "attack_pattern": {"cooldown": 1}})
+	threat_service.latch_threat({"id": "slow", "timer": 2, "attack_pattern": {"cooldown": 2}})
+	for _turn in 5:
+		threat_service.tick_timers()
+	assert_eq(",".join(attacks), "fast,slow,fast,fast")
+
+func test_repeated_threats_get_unique_ids() -> void:
+	threat_service.latch_threat({"id": "stalker"})
+	threat_service.latch_threat({"id": "stalker"})
+	var threats := threat_service.get_threats() as Array
+	assert_eq(threats.size(), 2)
+	assert_ne(threats[0].get("id"), threats[1].get("id"))
+	threat_service.resolve_threat("stalker")
+	assert_eq(threat_service.get_threat_count(), 1)
+	assert_false(threat_service.has_threat("stalker"))
+
+func test_changes_are_coalesced_into_one_delta() -> void:
+	threat_service.flush_updates()
+	var deltas: Array = []
+	threat_service.threats_changed.connect(func(turn: int, changed: Array[Dictionary], removed: PackedStringArray) -> void:
+		deltas.append({"turn": turn, "changed": changed, "removed": removed})
+	)
+	threat_service.latch_threat({"id": "alpha", "timer": 2})
+	threat_service.latch_threat({"id": "beta", "timer": 2})
+	threat_service.apply_status("alpha", {"id": "bleed", "duration": 1})
+	threat_service.resolve_threat("beta")
+	threat_service.tick_timers()
+	await wait_for_frames(1)
+	assert_eq(deltas.size(), 1)
+	assert_eq(deltas[0].turn, 1)
+	assert_eq((deltas[0].changed as Array).size(), 1)
+	assert_eq((deltas[0].changed as Array)[0].get("timer"), 1)
+	assert_eq(",".join(deltas[0].removed), "beta")
+
+func test_templates_are_shared_between_instances() -> void:
+	assert_true(threat_service.has_template(&"lurking_stalker"), "Templates load from resources/threats.")
+	var attacks: Array[Dictionary] = []
+	threat_service.threat_attack_resolved.connect(func(_threat_id: String, attack: Dictionary) -> void:
+		attacks.append(attack)
+	)
+	var first: String = threat_service.latch_template(&"lurking_stalker")
+	var second: String = threat_service.latch_template(&"lurking_stalker")
+	assert_ne(first, second)
+	assert_eq(threat_service.get_threat(second).get("template_id"), "lurking_stalker")
+	assert_eq(threat_service.get_threat(first).get("timer"), 2)
+	for _turn in 3:
+		threat_service.tick_timers()
+	assert_eq(attacks.size(), 2)
+	assert_same(attacks[0], attacks[1])
+	assert_true(attacks[0].is_read_only())
+
+func test_change_deltas_share_attack_patterns() -> void:
+	threat_service.flush_updates()
+	var changed: Array[Dictionary] = []
+	threat_service.threats_changed.connect(func(_turn: int, delta: Array[Dictionary], _removed: PackedStringArray) -> void:
+		changed.append_array(delta)
+	)
+	threat_service.latch_template(&"lurking_stalker")
+	threat_service.latch_template(&"lurking_stalker")
+	threat_service.flush_updates()
+	assert_eq(changed.size(), 2)
+	assert_same(changed[0]["attack_pattern"], changed[1]["attack_pattern"])
+	assert_true((changed[0]["attack_pattern"] as Dictionary).is_read_only())
+	var copy: Dictionary = threat_service.get_threats()[0]["attack_pattern"]
+	assert_false(copy.is_read_only(), "Getters hand out editable copies.")
+
 func wait_for_frames(count: int) -> void:
 	for _i in count:
 		await get_tree().process_frame
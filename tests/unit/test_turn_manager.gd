@@ -46,6 +46,15 @@ func test_refresh_returns_exhausted_dice_on_next_roll() -> void:
     var results := turn_manager.get_current_results()
     assert_eq(results.size(), DiceSubsystem.DICE_POOL_SIZE, "Dice count remains stable after refresh")
 
+func test_status_effects_jam_dice_for_their_duration() -> void:
+    turn_manager.get_status_effects().add_effect(&"dice_lock", 2)
+    turn_manager.start_turn()
+    assert_true(dice_subsystem.is_die_jammed(2), "Jam status should lock a die at turn start")
+    turn_manager.start_turn()
+    assert_true(dice_subsystem.is_die_jammed(2), "Jam lasts for its full duration")
+    turn_manager.start_turn()
+    assert_eq(dice_subsystem.get_jammed_indices().size(), 0, "Expired jam releases the die")
+
 func test_hold_prevents_reroll_until_released() -> void:
     turn_manager.request_roll()
     await _await_roll()
@@ -75,5 +84,14 @@ func test_roll_cycle_stays_within_reasonable_time_budget() -> void:
             max_duration_ms = duration
     assert_lt(max_duration_ms, 650.0, "Physics-driven roll should settle within 650ms")
 
+func test_initialize_releases_previous_dice_subsystem() -> void:
+    var replacement := DiceSubsystem.new()
+    add_child_autofree(replacement)
+    turn_manager.initialize(replacement, null)
+    assert_false(dice_subsystem.roll_resolved.is_connected(turn_manager._on_roll_resolved))
+    assert_false(dice_subsystem.lock_state_changed.is_connected(turn_manager._on_lock_state_changed))
+    assert_true(replacement.roll_resolved.is_connected(turn_manager._on_roll_resolved))
+    assert_same(turn_manager.get_dice_subsystem(), replacement)
+
 func _await_roll() -> void:
     await dice_subsystem.roll_resolved
@@ -0,0 +1,70 @@
+extends GutTest
+
+var simulator: TurnSimulator = null
+
+func before_each() -> void:
+	simulator = TurnSimulator.new()
+	add_child_autofree(simulator)
+	# The autoload manager already handles threat and event signals; a second
+	# manager would apply every attack and outcome twice.
+	simulator.setup()
+	simulator.start_run(1234)
+
+func after_each() -> void:
+	# Hands the autoload its previous wiring and the RNG its state back, so
+	# later suites do not inherit the simulator's dice.
+	simulator.teardown()
+	simulator = null
+
+func test_turns_run_without_hud_or_physics() -> void:
+	var stats: Dictionary = simulator.run_turns(50)
+	assert_eq(int(stats["turns"]), 50)
+	assert_eq(int(stats["rooms_entered"]), 50, "Every simulated turn enters a room.")
+	assert_eq(simulator.get_turn_manager().get_current_results().size(), DiceSubsystem.DICE_POOL_SIZE)
+
+func test_lock_policy_is_consulted_each_roll() -> void:
+	var rolls := [0]
+	simulator.lock_policy = func(results: Array[int]) -> Array:
+		rolls[0] += 1
+		for index in results.size():
+			if results[index] > 0:
+				return [index]
+		return []
+	simulator.run_turns(1)
+	assert_eq(rolls[0], DiceSubsystem.DICE_POOL_SIZE, "Rolls per turn are capped at one per die.")
+
+func test_teardown_restores_turn_manager_and_rng() -> void:
+	simulator.teardown()
+	var manager := ServiceRegistry.get_turn_manager()
+	var rng_service := ServiceRegistry.get_rng_service()
+	var previous_dice = manager.get_dice_subsystem()
+	var previous_seed := rng_service.get_run_seed()
+	var other := TurnSimulator.new()
+	add_child_autofree(other)
+	other.setup()
+	other.start_run(previous_seed + 1)
+	assert_ne(manager.get_dice_subsystem(), previous_dice)
+	other.teardown()
+	assert_eq(manager.get_dice_subsystem(), previous_dice)
+	assert_eq(rng_service.get_run_seed(), previous_seed)
+
+func test_threat_attack_costs_damage_once() -> void:
+	var ledger := ServiceRegistry.get_resource_ledger()
+	var threat_service := ServiceRegistry.get_threat_service()
+	var damage := 2
+	threat_service.latch_threat({"id": "sim_probe", "timer": 0, "attack_pattern": {"damage": damage, "threat_delta": 0, "cooldown": 3, "statuses": []}})
+	var health_before: int = ledger.get_health()
+	threat_service.tick_timers()
+	assert_eq(ledger.get_health(), health_before - damage, "One attack should cost exactly its damage.")
+
+func test_policy_that_never_locks_is_forced_to_resolve() -> void:
+	var resolved := [0]
+	var on_completed := func() -> void:
+		resolved[0] += 1
+	simulator.get_turn_manager().turn_completed.connect(on_completed)
+	simulator.lock_policy = func(_results: Array[int]) -> Array:
+		return []
+	var stats: Dictionary = simulator.run_turns(1)
+	simulator.get_turn_manager().turn_completed.disconnect(on_completed)
+	assert_eq(int(stats["stalled_turns"]), 1)
+	assert_eq(resolved[0], 1, "The room is only entered after the turn resolves.")